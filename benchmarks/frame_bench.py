@@ -0,0 +1,379 @@
+"""
+Frame Benchmark Module
+--------------------
+Runs scripted stress scenarios through the frame pipeline and reports
+per-phase frame times and allocations as JSON.
+
+Each scenario is timed several times from a fresh game, in rounds over
+all scenarios. Reported times are the median over those repeats, and the
+spread of the repeats gives the noise a later comparison must exceed
+before it reports a regression.
+
+Usage:
+    python -m benchmarks.frame_bench --output results.json
+    python -m benchmarks.frame_bench --baseline results.json
+"""
+
+import os
+import gc
+import math
+import sys
+import json
+import random
+import argparse
+import statistics
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+# Draw to an offscreen display so the draw phase can be measured anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.pop("AIRFORCE_HEADLESS", None)
+
+from config import SCREEN_HEIGHT, SCREEN_WIDTH
+from main import Game
+from sprites.boss import Boss
+from sprites.enemy import Enemy
+
+PHASES = ("sprites", "boss_shooting", "collisions", "update", "draw", "flip", "frame")
+# Timed runs per scenario, each from a fresh game
+REPEATS: int = 5
+# Standard deviations of repeat-to-repeat noise a p95 slowdown must exceed
+NOISE_FACTOR: float = 3.0
+# Relative p95 slowdown against the baseline reported as a regression
+REGRESSION_THRESHOLD: float = 0.10
+# Absolute p95 slowdown below which a phase is never reported, so that
+# microsecond phases do not fail the run on timer noise
+REGRESSION_FLOOR_MS: float = 0.05
+# Scale from median absolute deviation to standard deviation
+MAD_TO_SIGMA: float = 1.4826
+
+
+class Driver(NamedTuple):
+    """Input a scenario feeds the game every timed frame."""
+    # Frames between player shots, 0 to never shoot
+    fire_every: int = 0
+    # Keep the player's triple shot active
+    triple_shot: bool = False
+    # Start an enemy explosion every frame and a boss explosion every second
+    explode: bool = False
+
+
+Scenario = Callable[[Game], Driver]
+
+
+def add_enemies(game: Game, count: int) -> None:
+    """Spread enemies over the visible playfield."""
+    for _ in range(count):
+        enemy = game.pools[Enemy].acquire(game.enemies, game.rng)
+        enemy.rect.y = game.rng.randint(0, SCREEN_HEIGHT - 100)
+
+
+def enemies(count: int) -> Scenario:
+    """Scenario: many enemies, player firing every fourth frame."""
+    def setup(game: Game) -> Driver:
+        add_enemies(game, count)
+        return Driver(fire_every=4)
+    return setup
+
+
+def bullets(triple: bool) -> Scenario:
+    """Scenario: a few enemies, player firing every frame."""
+    def setup(game: Game) -> Driver:
+        add_enemies(game, 10)
+        return Driver(fire_every=1, triple_shot=triple)
+    return setup
+
+
+def boss_spam(health_fraction: float) -> Scenario:
+    """Scenario: a boss firing every pattern of its phase every frame."""
+    def setup(game: Game) -> Driver:
+        boss = Boss(game.rng)
+        boss.rect.top = 50
+        boss.entry_phase = False
+        boss.shoot_delay = -1
+        boss.health = 10 ** 9
+        boss.max_health = int(boss.health / health_fraction)
+        game.bosses.add(boss)
+        game.boss_active = True
+        return Driver(fire_every=2)
+    return setup
+
+
+def explosions(game: Game) -> Driver:
+    """Scenario: an enemy explosion every frame and a boss explosion every second."""
+    add_enemies(game, 10)
+    return Driver(explode=True)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "enemies_10": enemies(10),
+    "enemies_100": enemies(100),
+    "enemies_1000": enemies(1000),
+    "enemies_10000": enemies(10000),
+    "bullets_single": bullets(False),
+    "bullets_triple": bullets(True),
+    "boss_spam": boss_spam(1.0),
+    "boss_final_phase": boss_spam(0.25),
+    "explosions": explosions,
+}
+
+
+def build_game(setup: Scenario) -> Tuple[Game, Driver]:
+    """Create a game with a scenario applied, and the scenario's driver."""
+    random.seed(0)
+    game = Game()
+    game.player_name = "bench"
+    game.scores = {"bench": 0}
+    game.reset_game()
+    game.profiler.budget_ms = None
+    return game, setup(game)
+
+
+def keep_alive(game: Game, driver: Driver, frame: int) -> None:
+    """Hold the scenario in steady state between timed frames."""
+    game.game_active = True
+    game.game_over = False
+    for enemy in game.enemies:
+        if enemy.rect.top > SCREEN_HEIGHT - 5:
+            enemy.rect.bottom = 0
+            enemy.moved()
+    if driver.triple_shot:
+        game.player.activate_triple_shot()
+    game.player.set_input(frame % 120 < 60, frame % 120 >= 60)
+    if driver.fire_every and frame % driver.fire_every == 0:
+        game.shoot()
+    if driver.explode:
+        game.particles.emit("explosion", random.randrange(SCREEN_WIDTH), random.randrange(SCREEN_HEIGHT))
+        if frame % 60 == 0:
+            game.particles.emit("boss_explosion", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3)
+
+
+def run_frame(game: Game) -> Dict:
+    """Run one profiled frame and return its profiler record."""
+    profiler = game.profiler
+    profiler.begin_frame()
+    with profiler.phase("update"):
+        game.update()
+    with profiler.phase("draw"):
+        game.draw()
+    profiler.end_frame(game.entity_counts())
+    return profiler.frames[-1]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Mean, p95 and p99 of a list of durations in milliseconds."""
+    if not samples:
+        return {"mean_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    return {
+        "mean_ms": sum(ordered) / len(ordered),
+        "p95_ms": ordered[int(last * 0.95)],
+        "p99_ms": ordered[int(last * 0.99)],
+    }
+
+
+def combine(runs: List[Dict[str, float]]) -> Dict[str, float]:
+    """
+    Median of each stat over repeated runs, plus the noise of the p95.
+
+    The noise is a robust standard deviation (scaled median absolute
+    deviation), so one disturbed repeat does not widen it.
+
+    Args:
+        runs: summarize() results of each repeat.
+
+    Returns:
+        Dict[str, float]: Median stats and p95_noise_ms.
+    """
+    combined = {stat: statistics.median(run[stat] for run in runs) for stat in runs[0]}
+    p95 = combined["p95_ms"]
+    combined["p95_noise_ms"] = MAD_TO_SIGMA * statistics.median(
+        abs(run["p95_ms"] - p95) for run in runs)
+    return combined
+
+
+def time_scenario(setup: Scenario, frames: int) -> Tuple[Game, Driver, Dict[str, List[float]], int]:
+    """
+    Time one run of a scenario from a fresh game.
+
+    Args:
+        setup: Scenario builder.
+        frames: Number of timed frames.
+
+    Returns:
+        Tuple: The game and driver, frame times per phase, and garbage
+        collections during the run.
+    """
+    game, driver = build_game(setup)
+    timings = {phase: [] for phase in PHASES}
+
+    gc_before = sum(stat["collections"] for stat in gc.get_stats())
+    for frame in range(frames):
+        keep_alive(game, driver, frame)
+        record = run_frame(game)
+        phases = record["phases"]
+        timings["sprites"].append(sum(
+            elapsed for name, elapsed in phases.items() if name.startswith("update.")))
+        for phase in ("boss_shooting", "collisions", "update", "draw", "flip"):
+            timings[phase].append(phases.get(phase, 0.0))
+        timings["frame"].append(record["total_ms"])
+    gc_runs = sum(stat["collections"] for stat in gc.get_stats()) - gc_before
+    return game, driver, timings, gc_runs
+
+
+def measure_allocations(game: Game, driver: Driver, first_frame: int, frames: int) -> Dict:
+    """
+    Measure per-frame allocations of a running scenario.
+
+    Allocations are measured apart from the timed frames since
+    tracemalloc distorts timing.
+
+    Args:
+        game: Game of a finished timed run.
+        driver: Its scenario driver.
+        first_frame: Frame number to continue from.
+        frames: Number of frames run under tracemalloc.
+
+    Returns:
+        Dict: Net and peak bytes allocated per frame.
+    """
+    allocated = 0
+    peak = 0
+    tracemalloc.start()
+    for frame in range(first_frame, first_frame + frames):
+        keep_alive(game, driver, frame)
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        run_frame(game)
+        current, frame_peak = tracemalloc.get_traced_memory()
+        allocated += max(current - before, 0)
+        peak = max(peak, frame_peak - before)
+    tracemalloc.stop()
+    return {"net_bytes_per_frame": allocated / max(frames, 1), "peak_bytes_per_frame": peak}
+
+
+def run_scenarios(names: List[str], frames: int, alloc_frames: int,
+                  repeats: int = REPEATS) -> Dict[str, Dict]:
+    """
+    Run scenarios and measure them.
+
+    The repeats are interleaved, one round over every scenario at a time,
+    so that a slow stretch of the machine spreads over the repeats of
+    all scenarios and shows in their noise instead of shifting every
+    repeat of one scenario.
+
+    Args:
+        names: Keys of SCENARIOS to run.
+        frames: Number of timed frames per repeat.
+        alloc_frames: Number of frames run under tracemalloc.
+        repeats: Number of timed runs per scenario.
+
+    Returns:
+        Dict[str, Dict]: Per scenario, per-phase timing stats, allocation
+        and GC counters.
+    """
+    repeats = max(repeats, 1)
+    runs = {name: [] for name in names}
+    gc_counts = {name: [] for name in names}
+    results = {}
+    for repeat in range(repeats):
+        for name in names:
+            game, driver, timings, gc_runs = time_scenario(SCENARIOS[name], frames)
+            runs[name].append({phase: summarize(samples) for phase, samples in timings.items()})
+            gc_counts[name].append(gc_runs)
+            if repeat < repeats - 1:
+                continue
+
+            result = {phase: combine([run[phase] for run in runs[name]]) for phase in PHASES}
+            result["alloc"] = measure_allocations(game, driver, frames, alloc_frames)
+            result["alloc"]["gc_collections"] = statistics.median(gc_counts[name])
+            result["entities"] = len(game.all_sprites) + len(game.boss_bullets) + len(game.particles)
+            results[name] = result
+    return results
+
+
+def compare(results: Dict, baseline: Dict, threshold: float,
+            floor_ms: float = REGRESSION_FLOOR_MS,
+            noise_factor: float = NOISE_FACTOR) -> List[str]:
+    """
+    Find phases whose p95 got slower than the baseline.
+
+    A slowdown is reported only when it exceeds the relative threshold,
+    the absolute floor and noise_factor times the combined repeat noise
+    of both runs.
+
+    Args:
+        results: Results of this run.
+        baseline: Saved results to compare against.
+        threshold: Relative p95 slowdown reported as a regression.
+        floor_ms: Smallest absolute p95 slowdown reported, in milliseconds.
+        noise_factor: Multiple of the measured noise a slowdown must exceed.
+
+    Returns:
+        List[str]: One line per regression.
+    """
+    regressions = []
+    for scenario, phases in results["scenarios"].items():
+        old_phases = baseline.get("scenarios", {}).get(scenario)
+        if old_phases is None:
+            continue
+        for phase in PHASES:
+            old_stats = old_phases.get(phase, {})
+            old = old_stats.get("p95_ms", 0.0)
+            new = phases[phase]["p95_ms"]
+            noise = math.hypot(old_stats.get("p95_noise_ms", 0.0), phases[phase]["p95_noise_ms"])
+            margin = max(floor_ms, noise_factor * noise)
+            if old > 0 and new > old * (1 + threshold) and new - old > margin:
+                regressions.append(
+                    f"{scenario}.{phase}: p95 {old:.3f} ms -> {new:.3f} ms (+{100 * (new / old - 1):.0f}%)")
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300, help="timed frames per scenario")
+    parser.add_argument("--repeats", type=int, default=REPEATS,
+                        help="timed runs per scenario; medians are reported")
+    parser.add_argument("--alloc-frames", type=int, default=30, help="frames traced for allocations")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default all)")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--baseline", help="compare against a saved results file")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="relative p95 slowdown reported as a regression")
+    parser.add_argument("--floor-ms", type=float, default=REGRESSION_FLOOR_MS,
+                        help="smallest absolute p95 slowdown in ms reported as a regression")
+    parser.add_argument("--noise-factor", type=float, default=NOISE_FACTOR,
+                        help="multiple of the repeat noise a p95 slowdown must exceed")
+    args = parser.parse_args()
+
+    results = {"frames": args.frames, "repeats": args.repeats, "scenarios": run_scenarios(
+        args.scenario or list(SCENARIOS), args.frames, args.alloc_frames, args.repeats)}
+    for name, scenario in results["scenarios"].items():
+        frame = scenario["frame"]
+        print(f"{name:16} mean {frame['mean_ms']:8.3f} ms  p95 {frame['p95_ms']:8.3f} ms  "
+              f"p99 {frame['p99_ms']:8.3f} ms", file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.floor_ms,
+                              args.noise_factor)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
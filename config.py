@@ -2,24 +2,44 @@
 Game Configuration Module
 ------------------------
 Contains all game constants and settings.
+
+Importing this module does not open a window or load fonts; call
+init_display() once before drawing.
 """
 
+import time
+
+# Reference point for startup timings
+STARTUP_TIME: float = time.perf_counter()
+
+import os
 import pygame
 import logging
 import sys
-from typing import Tuple
+from typing import Dict, NamedTuple, Optional, Tuple
+from utils.log_setup import configure_logging
+from utils.font_cache import load_font
+from sprites import image_cache
 
-# Initialize logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    filename='game_log.txt'
-)
+# Initialize logging (queued, rate limited, written by a background thread)
+configure_logging(json_lines=os.environ.get("AIRFORCE_LOG_JSON", "") == "1")
 
 # Screen settings
 SCREEN_WIDTH: int = 600
 SCREEN_HEIGHT: int = 400
+# Simulation steps per second; game time and movement advance per step
 FPS: int = 60
+# Highest render rate, 0 to draw as often as the display allows
+MAX_RENDER_FPS: int = 240
+
+# Speeds in pixels per second of simulated time
+PLAYER_SPEED: int = 300
+ENEMY_SPEED: int = 60  # per speed level, enemies have one or two
+BULLET_SPEED: int = 600
+BOSS_SPEED: int = 180
+BOSS_ENTRY_SPEED: int = 60
+BOSS_BULLET_SPEED: int = 420
+POWERUP_SPEED: int = 120
 
 # Colors
 WHITE: Tuple[int, int, int] = (255, 255, 255)
@@ -39,17 +59,84 @@ SAVE_FILE: str = "assets/game_data.json"
 ENEMY_SPAWN_RATE: float = 0.0004
 BOSS_SPAWN_INTERVAL: int = 15
 TRIPLE_SHOT_DURATION: int = 3600
+BOSS_HEALTH: int = 15
+BOSS_SHOOT_DELAY: int = 1200
+
+# Effects: most particles alive at once, bursts shrink as it is approached
+MAX_PARTICLES: int = 2048
+
+# Frame governor: degradations applied in order while frames run over
+# budget (any of hud_text, particles, bullet_cap, frame_skip), and limits
+GOVERNOR_DEGRADATIONS: Tuple[str, ...] = ("hud_text", "particles", "bullet_cap", "frame_skip")
+GOVERNED_PARTICLE_DENSITY: float = 0.25
+BULLET_CAP: int = 24
+BOSS_BULLET_CAP: int = 300
+
+FONT_NAME: str = "Arial"
+
+# Headless mode: no window, fonts or name prompt (simulation and CI runs)
+HEADLESS: bool = os.environ.get("AIRFORCE_HEADLESS", "") == "1"
+
+
+class Display(NamedTuple):
+    """Window and fonts created by init_display."""
+    screen: pygame.Surface
+    clock: pygame.time.Clock
+    font: pygame.font.Font
+    small_font: pygame.font.Font
+
+
+# Set by init_display
+screen = None
+clock = None
+font = None
+small_font = None
+_display: Optional[Display] = None
+
+# Milliseconds since STARTUP_TIME at each startup milestone
+startup_timings: Dict[str, float] = {}
+
+
+def mark_startup(milestone: str) -> None:
+    """
+    Record the time of a startup milestone.
+
+    Args:
+        milestone: Milestone name, e.g. "display" or "first_frame".
+    """
+    startup_timings[milestone] = (time.perf_counter() - STARTUP_TIME) * 1000
+
+
+def init_display() -> Display:
+    """
+    Initialize pygame, open the window and load the fonts.
+
+    Safe to call more than once; later calls return the same display.
+
+    Returns:
+        Display: The window, clock and fonts.
+    """
+    global screen, clock, font, small_font, _display
+    if _display is not None:
+        return _display
+
+    try:
+        # Initialize pygame
+        pygame.init()
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Airforce")
+        # Surfaces cached before the window existed are in the wrong format
+        image_cache.invalidate()
+        clock = pygame.time.Clock()
+        mark_startup("display")
+
+        # Initialize fonts from cached paths instead of SysFont's font scan
+        font = load_font(FONT_NAME, 30)
+        small_font = load_font(FONT_NAME, 20)
+        mark_startup("fonts")
+    except pygame.error as e:
+        logging.critical(f"Failed to initialize pygame: {e}")
+        sys.exit(1)
 
-try:
-    # Initialize pygame
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("Airforce")
-    clock = pygame.time.Clock()
-
-    # Initialize fonts
-    font = pygame.font.SysFont("Arial", 30)
-    small_font = pygame.font.SysFont("Arial", 20)
-except pygame.error as e:
-    logging.critical(f"Failed to initialize pygame: {e}")
-    sys.exit(1)
\ No newline at end of file
+    _display = Display(screen, clock, font, small_font)
+    return _display
\ No newline at end of file
@@ -8,49 +8,154 @@ import pygame
 import random
 import logging
 import sys
-from typing import Dict, Optional
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 from config import *
-from utils.error_handler import GameError, handle_pygame_error
-from utils.score_manager import load_scores, save_scores
+from utils.error_handler import handle_pygame_error, update_group
+from utils.game_clock import SimulatedClock, install_clock
+from utils.spatial_hash import SpatialHash, groupcollide, spritecollide
+from utils.dirty_renderer import DirtyRenderer
+from utils.text_cache import TextCache
+from utils.score_manager import ScoreWriter, load_scores
+from utils.leaderboard import Leaderboard
+from utils.replay import Recording
+from utils.profiler import FrameProfiler
+from utils.frame_governor import FrameGovernor
+from utils.fixed_timestep import FixedTimestep, Interpolator, blend_position
+from utils.snapshot import HudValues, Snapshot, SnapshotBuffer
+from utils.sim_thread import InputState, SimulationThread
 from sprites.player import Player
 from sprites.enemy import Enemy
-from sprites.boss import Boss, BossBullet
+from sprites.boss import Boss
 from sprites.bullet import Bullet
 from sprites.powerup import PowerUp
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    filename='game_log.txt'
-)
+from sprites.pool import SpritePool
+from sprites.registry import EntityRegistry
+from sprites.mask_cache import collide_mask
+from sprites.bullet_field import blend, create_field, draw_bullets
+from sprites.bullet_patterns import emit
+from sprites.particles import ParticleSystem
+from sprites.kinematics import KinematicStore, available as kinematics_available
 
 
 class Game:
     """Main game class that manages game state and loop."""
 
-    def __init__(self):
-        """Initialize the game state."""
+    # Balance settings accepted by apply_overrides, mapped to attributes
+    TUNABLES: Dict[str, str] = {
+        "ENEMY_SPAWN_RATE": "enemy_spawn_rate",
+        "BOSS_SPAWN_INTERVAL": "boss_spawn_interval",
+        "TRIPLE_SHOT_DURATION": "triple_shot_duration",
+        "BOSS_HEALTH": "boss_health",
+        "BOSS_SHOOT_DELAY": "boss_shoot_delay",
+    }
+
+    def __init__(self, headless: bool = HEADLESS, player_name: str = "headless",
+                 record_path: Optional[str] = None):
+        """
+        Initialize the game state.
+
+        Args:
+            headless: Run without window, fonts or name prompt, driven by
+                step() as fast as possible.
+            player_name: Player name used in headless mode.
+            record_path: Record each game's seed and input to this file
+                for deterministic replay.
+        """
         try:
-            # Initialize pygame if not already initialized
-            if not pygame.get_init():
-                pygame.init()
-
-            self.all_sprites = pygame.sprite.Group()
-            self.enemies = pygame.sprite.Group()
-            self.bullets = pygame.sprite.Group()
-            self.boss_bullets = pygame.sprite.Group()
-            self.powerups = pygame.sprite.Group()
-            self.bosses = pygame.sprite.Group()
+            self.headless = headless
+            # Game time advances per fixed step, never with the wall clock
+            self.sim_clock = SimulatedClock(FPS)
+            # Game's own random generator, so games in one process do not
+            # reseed each other; unseeded games start from the random module
+            self.rng = random.Random(random.getrandbits(63))
+            self.timestep = FixedTimestep(FPS)
+            self.interpolator = Interpolator()
+            self.record_path = record_path
+            self.recording = None
+            self.shoot_requested = False
+
+            # Window and fonts are only created for windowed games
+            if headless:
+                self.screen = self.clock = self.font = self.small_font = None
+            else:
+                self.screen, self.clock, self.font, self.small_font = init_display()
+
+            # Every live sprite, drawn from a sprite atlas, with a view per type
+            self.all_sprites = EntityRegistry()
+            self.enemies = self.all_sprites.view("enemies")
+            self.bullets = self.all_sprites.view("bullets")
+            self.powerups = self.all_sprites.view("powerups")
+            self.bosses = self.all_sprites.view("bosses")
+
+            # Numerous sprite types move in one array pass, if NumPy is installed
+            self.kinematics = {
+                Enemy: KinematicStore(),
+                Bullet: KinematicStore(cull_top=True, cull_sides=True),
+                PowerUp: KinematicStore(cull_bottom=True),
+            } if kinematics_available() else {}
+
+            # Groups updated one by one so each is profiled separately
+            self.update_groups = (
+                ("update.enemies", self.enemies, self.kinematics.get(Enemy)),
+                ("update.bullets", self.bullets, self.kinematics.get(Bullet)),
+                ("update.powerups", self.powerups, self.kinematics.get(PowerUp)),
+                ("update.bosses", self.bosses, None),
+            )
+
+            # Reusable sprites, returned to their pool on kill()
+            self.pools = {
+                sprite_class: SpritePool(sprite_class, self.kinematics.get(sprite_class))
+                for sprite_class in (Enemy, Bullet, PowerUp)
+            }
+
+            # Boss bullets are array rows, not sprites, so patterns can
+            # keep thousands alive
+            self.boss_bullets = create_field((15, 25), RED)
+            # Hit and explosion effects, also array rows
+            self.particles = ParticleSystem()
+
+            # Broadphase grids, rebuilt every frame in handle_collisions
+            self.enemy_grid = SpatialHash()
+            self.boss_grid = SpatialHash()
+            self.powerup_grid = SpatialHash()
 
             self.game_active = False
             self.game_over = False
             self.score = 0
             self.enemies_defeated = 0
+            self.bosses_defeated = 0
             self.boss_active = False
             self.scores = {}
             self.player_name = ""
             self.player = None
+            self.score_writer = None
+            self.leaderboard = None
+            self.quarantined = 0
+
+            # Balance settings, see apply_overrides
+            self.enemy_spawn_rate = ENEMY_SPAWN_RATE
+            self.boss_spawn_interval = BOSS_SPAWN_INTERVAL
+            self.triple_shot_duration = TRIPLE_SHOT_DURATION
+            self.boss_health = BOSS_HEALTH
+            self.boss_shoot_delay = BOSS_SHOOT_DELAY
+
+            self.renderer = None if headless else DirtyRenderer(self.screen, BLACK)
+            self.drawn_state = None
+            self.snapshot_rects = []
+            self.text_cache = TextCache()
+            self.profiler = FrameProfiler(budget_ms=None if headless else 1000 / FPS)
+            # Sheds work while frames run over budget; never in headless games
+            self.governor = FrameGovernor(None if headless else 1000 / FPS,
+                                          GOVERNOR_DEGRADATIONS)
+            # Cap asked for by the governor, and the cap in force this step
+            self.cap_requested = False
+            self.bullets_capped = False
+
+            if headless:
+                # Soak runs never touch the real score file
+                self.player_name = player_name
+                self.scores = {player_name: 0}
 
         except Exception as e:
             logging.critical(f"Failed to initialize game: {e}")
@@ -84,11 +189,22 @@ class Game:
                     self.scores = load_scores()  # This now loads from text file
                     if self.player_name not in self.scores:
                         self.scores[self.player_name] = 0
-                    return True
                 except Exception as e:
                     logging.error(f"Error loading scores: {e}")
                     self.scores = {self.player_name: 0}
-                    return True
+
+                # Shared leaderboard, which may hold a score from another machine
+                try:
+                    self.leaderboard = Leaderboard()
+                    stored = self.leaderboard.get(self.player_name) or 0
+                    self.scores[self.player_name] = max(
+                        self.scores[self.player_name], stored)
+                except Exception as e:
+                    logging.error(f"Error opening leaderboard: {e}")
+                    self.leaderboard = None
+                self.score_writer = ScoreWriter(
+                    self.scores, leaderboard=self.leaderboard)
+                return True
 
             except (EOFError, KeyboardInterrupt):
                 print("\nGame cancelled by user.")
@@ -104,21 +220,20 @@ class Game:
     def spawn_enemy(self) -> None:
         """Spawn a new enemy."""
         try:
-            enemy = Enemy()
-            self.all_sprites.add(enemy)
-            self.enemies.add(enemy)
-        except GameError as e:
+            self.pools[Enemy].acquire(self.enemies, self.rng)
+        except Exception as e:
             logging.error(f"Failed to spawn enemy: {e}")
 
     @handle_pygame_error
     def spawn_boss(self) -> None:
         """Spawn a boss enemy."""
         try:
-            boss = Boss()
-            self.all_sprites.add(boss)
+            boss = Boss(self.rng)
+            boss.health = boss.max_health = self.boss_health
+            boss.shoot_delay = self.boss_shoot_delay
             self.bosses.add(boss)
             self.boss_active = True
-        except GameError as e:
+        except Exception as e:
             logging.error(f"Failed to spawn boss: {e}")
 
     @handle_pygame_error
@@ -126,102 +241,227 @@ class Game:
         """Handle boss shooting mechanics."""
         if self.boss_active:
             try:
+                target = self.player.rect.center
+                limit = BOSS_BULLET_CAP if self.bullets_capped else None
                 for boss in self.bosses:
-                    if not boss.entry_phase and pygame.time.get_ticks() - boss.last_shot > boss.shoot_delay:
-                        for offset in [-30, 0, 30]:
-                            bullet = BossBullet(
-                                boss.rect.centerx + offset, boss.rect.bottom)
-                            self.all_sprites.add(bullet)
-                            self.boss_bullets.add(bullet)
-                        boss.last_shot = pygame.time.get_ticks()
-            except GameError as e:
+                    if boss.entry_phase:
+                        continue
+                    for pattern, volley in boss.due_patterns():
+                        self.boss_bullets.spawn(emit(
+                            pattern, boss.rect.centerx, boss.rect.bottom, target, volley), limit)
+            except Exception as e:
                 logging.error(f"Error in boss shooting: {e}")
 
     @handle_pygame_error
     def handle_collisions(self) -> None:
         """Handle all game collisions."""
         try:
+            # Rect overlaps found through the grids are confirmed with
+            # cached pixel masks, so transparent edges never hit
             # Player hit by boss bullets
-            if pygame.sprite.spritecollide(self.player, self.boss_bullets, True):
+            if self.boss_bullets.hit(self.player):
                 self.game_active = False
                 self.game_over = True
                 return
 
             # Bullet hits enemy
-            hits = pygame.sprite.groupcollide(
-                self.bullets, self.enemies, True, True)
+            self.enemy_grid.rebuild(self.enemies)
+            hits = groupcollide(self.bullets, self.enemy_grid, True, True, collide_mask)
+            for enemies in hits.values():
+                for enemy in enemies:
+                    self.particles.emit("explosion", *enemy.rect.center)
             for hit in hits:
                 self.score += 10
                 self.enemies_defeated += 1
 
-                if self.enemies_defeated % BOSS_SPAWN_INTERVAL == 0:
+                if self.enemies_defeated % self.boss_spawn_interval == 0:
                     self.spawn_boss()
                 elif not self.boss_active:
                     self.spawn_enemy()
 
             # Bullet hits boss
-            boss_hits = pygame.sprite.groupcollide(
-                self.bullets, self.bosses, True, False)
+            self.boss_grid.rebuild(self.bosses)
+            boss_hits = groupcollide(self.bullets, self.boss_grid, True, False, collide_mask)
             for bullet, boss_list in boss_hits.items():
                 for boss in boss_list:
                     boss.health -= 1
+                    self.particles.emit("hit", bullet.rect.centerx, bullet.rect.top)
                     if boss.health <= 0:
                         boss.kill()
+                        self.particles.emit("boss_explosion", *boss.rect.center)
                         self.boss_active = False
+                        self.bosses_defeated += 1
                         self.score += 100
                         for _ in range(2):
                             self.spawn_enemy()
 
             # Player collects power-up
-            powerup_hits = pygame.sprite.spritecollide(
-                self.player, self.powerups, True)
+            self.powerup_grid.rebuild(self.powerups)
+            powerup_hits = spritecollide(self.player, self.powerup_grid, True, collide_mask)
             for powerup in powerup_hits:
                 self.player.activate_triple_shot()
 
             # Enemy reaches bottom
-            for enemy in self.enemies:
-                if enemy.rect.top > SCREEN_HEIGHT:
+            store = self.kinematics.get(Enemy)
+            if store is not None:
+                if store.any_below(SCREEN_HEIGHT):
                     self.game_active = False
                     self.game_over = True
-                    break
+            else:
+                for enemy in self.enemies:
+                    if enemy.rect.top > SCREEN_HEIGHT:
+                        self.game_active = False
+                        self.game_over = True
+                        break
 
         except Exception as e:
             logging.error(f"Error in collision handling: {e}")
 
     @handle_pygame_error
-    def draw(self) -> None:
-        """Draw the game screen."""
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draw the game screen, updating only the regions that changed.
+
+        Args:
+            alpha: Position between the last two simulation steps at which
+                sprites are drawn, 1 for the latest step.
+        """
         try:
-            screen.fill(BLACK)
+            if self.draw_menu(self.game_active, self.game_over):
+                return
 
-            if not self.game_active:
-                if self.game_over:
-                    self.draw_game_over()
-                else:
-                    self.draw_start_screen()
+            erased = self.boss_bullets.drawn_rects + self.particles.drawn_rects
+            keep_hud = self.keep_hud(erased + self.all_sprites.drawn_rects())
+            self.renderer.begin_frame(self.all_sprites, erased, keep_overlay=keep_hud)
+            with self.interpolator.blend(self.all_sprites, alpha):
+                sprite_rects = self.all_sprites.draw(self.screen)
+            sprite_rects += self.boss_bullets.draw(self.screen, self.all_sprites.atlas, alpha)
+            sprite_rects += self.particles.draw(self.screen)
+            hud_rects = None if keep_hud else self.draw_overlays(self.hud_values(), self.profiler)
+            with self.profiler.phase("flip"):
+                self.renderer.end_frame(sprite_rects, hud_rects)
+        except Exception as e:
+            logging.error(f"Error drawing screen: {e}")
+
+    def keep_hud(self, erased: List[pygame.Rect]) -> bool:
+        """
+        Check whether this frame leaves the HUD as last drawn.
+
+        Args:
+            erased: Regions cleared at the start of the frame; the HUD is
+                redrawn if they cut into it.
+
+        Returns:
+            bool: True when the governor skips HUD text this frame.
+        """
+        return (not self.governor.refresh_hud() and not self.renderer.needs_full_redraw
+                and not self.renderer.overlay_touched(erased))
+
+    def draw_overlays(self, hud: HudValues, profiler: FrameProfiler) -> List[pygame.Rect]:
+        """
+        Draw the HUD and, if enabled, the profiler overlay.
+
+        Args:
+            hud: Values shown by the HUD.
+            profiler: Profiler shown by the overlay.
+
+        Returns:
+            List[pygame.Rect]: Screen regions covered.
+        """
+        rects = self.draw_hud(hud) or []
+        if self.profiler.overlay:
+            rects.append(profiler.draw_overlay(
+                self.screen, self.small_font, (10, SCREEN_HEIGHT - 80)))
+        return rects
+
+    def draw_menu(self, game_active: bool, game_over: bool) -> bool:
+        """
+        Draw the start or game over screen when no game is running.
+
+        Args:
+            game_active: Whether a game is running.
+            game_over: Whether the last game was lost.
+
+        Returns:
+            bool: True if a menu is showing and the frame is done.
+        """
+        state = (game_active, game_over)
+        if state != self.drawn_state:
+            self.renderer.invalidate()
+            self.drawn_state = state
+
+        if game_active:
+            return False
+        # Menus are static, so they are only drawn when invalidated
+        if self.renderer.needs_full_redraw:
+            if game_over:
+                self.draw_game_over()
             else:
-                self.all_sprites.draw(screen)
-                self.draw_hud()
+                self.draw_start_screen()
+            self.renderer.end_frame((), ())
+        return True
+
+    def draw_snapshot(self, snapshot: Snapshot, previous: Optional[Snapshot],
+                      profiler: FrameProfiler) -> None:
+        """
+        Draw a snapshot from the simulation thread.
+
+        Sprites are interpolated from the previous snapshot by the time
+        elapsed since the latest one was published.
+
+        Args:
+            snapshot: Latest simulated frame.
+            previous: Frame before it, if any.
+            profiler: Render profiler shown by the overlay.
+        """
+        try:
+            if self.draw_menu(snapshot.game_active, snapshot.game_over):
+                self.snapshot_rects = []
+                return
 
-            pygame.display.flip()
+            alpha = min((time.perf_counter() - snapshot.time) * FPS, 1.0)
+            start = {}
+            if previous is not None and alpha < 1.0:
+                start = {sprite_id: (x, y) for sprite_id, _, x, y in previous.sprites}
+
+            keep_hud = self.keep_hud(self.snapshot_rects)
+            self.renderer.begin_frame(rects=self.snapshot_rects, keep_overlay=keep_hud)
+            atlas = self.all_sprites.atlas
+            atlas.refresh()
+            blits = []
+            for sprite_id, image_key, x, y in snapshot.sprites:
+                origin = start.get(sprite_id)
+                position = blend_position(origin, (x, y), alpha) if origin else None
+                sheet, area = atlas.find(image_key)
+                blits.append((sheet.surface, position or (x, y), area))
+            rects = self.screen.blits(blits)
+            rects += draw_bullets(self.screen, atlas, self.boss_bullets.image_key,
+                                  *blend(snapshot.bullets, alpha))
+            rects += self.particles.draw_state(self.screen, snapshot.particles)
+            dirty = rects + self.snapshot_rects
+            self.snapshot_rects = rects
+
+            hud_rects = None if keep_hud else self.draw_overlays(snapshot.hud, profiler)
+            self.renderer.end_frame(dirty, hud_rects)
         except Exception as e:
-            logging.error(f"Error drawing screen: {e}")
+            logging.error(f"Error drawing snapshot: {e}")
 
     @handle_pygame_error
     def draw_start_screen(self) -> None:
         """Draw the game start screen."""
         try:
-            screen.fill(BLACK)
-            title_text = font.render("Good luck", True, WHITE)
-            player_text = font.render(
-                f"Welcome, {self.player_name}!", True, GREEN)
-            start_text = font.render("Press SPACE to Start", True, WHITE)
-
-            screen.blit(title_text, (SCREEN_WIDTH//2 -
+            self.screen.fill(BLACK)
+            text = self.text_cache
+            title_text = text.render(self.font, "Good luck", True, WHITE)
+            player_text = text.render(
+                self.font, f"Welcome, {self.player_name}!", True, GREEN)
+            start_text = text.render(self.font, "Press SPACE to Start", True, WHITE)
+
+            self.screen.blit(title_text, (SCREEN_WIDTH//2 -
                         title_text.get_width()//2, SCREEN_HEIGHT//3))
-            screen.blit(player_text, (SCREEN_WIDTH//2 -
+            self.screen.blit(player_text, (SCREEN_WIDTH//2 -
                         player_text.get_width()//2, SCREEN_HEIGHT//2))
-            screen.blit(start_text, (SCREEN_WIDTH//2 -
+            self.screen.blit(start_text, (SCREEN_WIDTH//2 -
                         start_text.get_width()//2, SCREEN_HEIGHT//2 + 50))
         except Exception as e:
             logging.error(f"Error drawing start screen: {e}")
@@ -230,55 +470,77 @@ class Game:
     def draw_game_over(self) -> None:
         """Draw the game over screen."""
         try:
-            screen.fill(BLACK)
+            self.screen.fill(BLACK)
             y_position = 80
-
-            game_over_text = font.render("Game Over", True, RED)
-            player_text = font.render(
-                f"Player: {self.player_name}", True, GREEN)
-            score_text = font.render(f"Score: {self.score}", True, WHITE)
-            high_score_text = font.render(
-                f"High Score: {self.scores[self.player_name]}", True, YELLOW)
-            restart_text = font.render(
-                "Press SPACE to Play Again", True, WHITE)
-            quit_text = small_font.render("Press Q to Quit", True, WHITE)
-
-            screen.blit(game_over_text, (SCREEN_WIDTH//2 -
+            text = self.text_cache
+
+            game_over_text = text.render(self.font, "Game Over", True, RED)
+            player_text = text.render(
+                self.font, f"Player: {self.player_name}", True, GREEN)
+            score_text = text.render(self.font, f"Score: {self.score}", True, WHITE)
+            high_score_text = text.render(
+                self.font, f"High Score: {self.scores[self.player_name]}", True, YELLOW)
+            restart_text = text.render(
+                self.font, "Press SPACE to Play Again", True, WHITE)
+            quit_text = text.render(self.small_font, "Press Q to Quit", True, WHITE)
+
+            self.screen.blit(game_over_text, (SCREEN_WIDTH//2 -
                         game_over_text.get_width()//2, y_position))
-            screen.blit(player_text, (SCREEN_WIDTH//2 -
+            self.screen.blit(player_text, (SCREEN_WIDTH//2 -
                         player_text.get_width()//2, y_position + 50))
-            screen.blit(score_text, (SCREEN_WIDTH//2 -
+            self.screen.blit(score_text, (SCREEN_WIDTH//2 -
                         score_text.get_width()//2, y_position + 100))
-            screen.blit(high_score_text, (SCREEN_WIDTH//2 -
+            self.screen.blit(high_score_text, (SCREEN_WIDTH//2 -
                         high_score_text.get_width()//2, y_position + 150))
-            screen.blit(restart_text, (SCREEN_WIDTH//2 -
+            self.screen.blit(restart_text, (SCREEN_WIDTH//2 -
                         restart_text.get_width()//2, y_position + 200))
-            screen.blit(quit_text, (SCREEN_WIDTH//2 -
+            self.screen.blit(quit_text, (SCREEN_WIDTH//2 -
                         quit_text.get_width()//2, y_position + 230))
         except Exception as e:
             logging.error(f"Error drawing game over screen: {e}")
 
+    def hud_values(self) -> HudValues:
+        """
+        Get the numbers shown by the HUD.
+
+        Returns:
+            HudValues: Score, high score and boss health.
+        """
+        boss_health = tuple(boss.health for boss in self.bosses) if self.boss_active else ()
+        return HudValues(self.score, self.scores.get(self.player_name, 0), boss_health)
+
     @handle_pygame_error
-    def draw_hud(self) -> None:
-        """Draw the heads-up display."""
-        try:
-            score_text = font.render(f"Score: {self.score}", True, WHITE)
-            high_score_text = small_font.render(
-                f"High Score: {self.scores[self.player_name]}", True, YELLOW)
-            player_text = small_font.render(
-                f"Player: {self.player_name}", True, GREEN)
+    def draw_hud(self, hud: Optional[HudValues] = None) -> List[pygame.Rect]:
+        """
+        Draw the heads-up display.
 
-            screen.blit(score_text, (10, 10))
-            screen.blit(high_score_text, (10, 40))
-            screen.blit(player_text, (10, 70))
+        Args:
+            hud: Values to show, read from the game if not given.
 
-            if self.boss_active:
-                for boss in self.bosses:
-                    health_text = font.render(
-                        f"Boss HP: {boss.health}", True, RED)
-                    screen.blit(health_text, (SCREEN_WIDTH - 200, 10))
+        Returns:
+            List[pygame.Rect]: Screen regions covered by HUD text.
+        """
+        rects = []
+        try:
+            hud = hud or self.hud_values()
+            # Labels come from the text cache and numbers from glyph
+            # atlases, so nothing is rasterised on a normal frame
+            text = self.text_cache
+            player_text = text.render(
+                self.small_font, f"Player: {self.player_name}", True, GREEN)
+
+            rects.append(text.draw_value(
+                self.screen, self.font, "Score: ", hud.score, WHITE, (10, 10)))
+            rects.append(text.draw_value(
+                self.screen, self.small_font, "High Score: ", hud.high_score, YELLOW, (10, 40)))
+            rects.append(self.screen.blit(player_text, (10, 70)))
+
+            for health in hud.boss_health:
+                rects.append(text.draw_value(
+                    self.screen, self.font, "Boss HP: ", health, RED, (SCREEN_WIDTH - 200, 10)))
         except Exception as e:
             logging.error(f"Error drawing HUD: {e}")
+        return rects
 
     @handle_pygame_error
     def handle_keypress(self, event: pygame.event.Event) -> None:
@@ -288,91 +550,384 @@ class Game:
                 pygame.event.post(pygame.event.Event(pygame.QUIT))
             elif event.key == pygame.K_SPACE:
                 if self.game_active:
-                    self.shoot()
+                    # Fired in advance() so the shot is part of the frame input
+                    self.shoot_requested = True
                 else:
                     self.reset_game()
+            elif event.key == pygame.K_F3:
+                self.profiler.overlay = not self.profiler.overlay
+            elif event.key == pygame.K_F4:
+                self.dump_profile()
         except Exception as e:
             logging.error(f"Error handling keypress: {e}")
 
+    def dump_profile(self) -> None:
+        """Write the game profiler's recent frames to JSON and CSV files."""
+        self.profiler.dump_json("frame_profile.json")
+        self.profiler.dump_csv("frame_profile.csv")
+
     @handle_pygame_error
     def shoot(self) -> None:
         """Handle player shooting."""
         try:
+            # Under the governor's bullet cap, shots past it are not fired
+            if self.bullets_capped and len(self.bullets) >= BULLET_CAP:
+                return
             if self.player.triple_shot:
                 for angle in [-30, 0, 30]:
-                    bullet = Bullet(self.player.rect.centerx,
-                                    self.player.rect.top, angle)
-                    self.all_sprites.add(bullet)
-                    self.bullets.add(bullet)
+                    self.pools[Bullet].acquire(
+                        self.bullets, self.player.rect.centerx, self.player.rect.top, angle)
             else:
-                bullet = Bullet(self.player.rect.centerx,
-                                self.player.rect.top, 0)
-                self.all_sprites.add(bullet)
-                self.bullets.add(bullet)
-        except GameError as e:
+                self.pools[Bullet].acquire(
+                    self.bullets, self.player.rect.centerx, self.player.rect.top, 0)
+        except Exception as e:
             logging.error(f"Error shooting: {e}")
 
     @handle_pygame_error
     def update(self) -> None:
         """Update game state."""
         try:
+            install_clock(self.sim_clock)
+            profiler = self.profiler
+
             # Spawn power-ups
-            if random.random() < ENEMY_SPAWN_RATE:
+            if self.rng.random() < self.enemy_spawn_rate:
                 try:
-                    powerup = PowerUp()
-                    self.all_sprites.add(powerup)
-                    self.powerups.add(powerup)
-                except GameError as e:
+                    self.pools[PowerUp].acquire(self.powerups, self.rng)
+                except Exception as e:
                     logging.error(f"Failed to spawn power-up: {e}")
 
-            self.all_sprites.update()
-            self.handle_boss_shooting()
-            self.handle_collisions()
+            # One error guard per group; failing sprites are killed
+            with profiler.phase("update.player"):
+                update_group((self.player,), quarantine=False)
+            for phase, group, store in self.update_groups:
+                with profiler.phase(phase):
+                    if store is None:
+                        self.quarantined += len(update_group(group))
+                        continue
+                    try:
+                        store.step()
+                    except Exception as e:
+                        logging.error(f"Error moving sprites in {phase}: {e}")
+            with profiler.phase("update.boss_bullets"):
+                self.boss_bullets.step()
+            with profiler.phase("update.particles"):
+                self.particles.step()
+            with profiler.phase("boss_shooting"):
+                self.handle_boss_shooting()
+            with profiler.phase("collisions"):
+                self.handle_collisions()
+
+            # Sprites killed this frame leave the registry and views now
+            self.all_sprites.flush()
 
             # Update high score
             if self.score > self.scores.get(self.player_name, 0):
                 self.scores[self.player_name] = self.score
-                # Save immediately when high score is broken
-                save_scores(self.scores)
+                # Written behind by the score writer thread
+                if self.score_writer is not None:
+                    self.score_writer.submit(self.player_name, self.score)
 
         except Exception as e:
             logging.error(f"Error updating game state: {e}")
 
     @handle_pygame_error
-    def reset_game(self) -> None:
-        """Reset the game state."""
+    def reset_game(self, seed: Optional[int] = None) -> None:
+        """
+        Reset the game state.
+
+        Args:
+            seed: Seed for the game's random generator, making the game
+                reproducible.
+                Chosen automatically when recording.
+        """
         try:
+            if seed is None and self.record_path:
+                seed = random.SystemRandom().getrandbits(63)
+            if seed is not None:
+                self.rng.seed(seed)
+                self.sim_clock.reset()
+            if self.record_path:
+                self.recording = Recording(seed)
+
+            install_clock(self.sim_clock)
             self.game_active = True
             self.game_over = False
             self.score = 0
             self.enemies_defeated = 0
+            self.bosses_defeated = 0
             self.boss_active = False
 
+            # Kills every sprite, releasing pooled ones
             self.all_sprites.empty()
-            self.enemies.empty()
-            self.bullets.empty()
-            self.boss_bullets.empty()
-            self.powerups.empty()
-            self.bosses.empty()
+            self.boss_bullets.clear()
+            self.particles.reset(seed)
 
             self.player = Player()
+            self.player.triple_shot_duration = self.triple_shot_duration
             self.all_sprites.add(self.player)
 
             for _ in range(2):
                 self.spawn_enemy()
 
-        except GameError as e:
+        except Exception as e:
             logging.error(f"Failed to reset game: {e}")
             self.game_active = False
             self.game_over = True
 
-    def run(self):
-        """Main game loop."""
+    def apply_overrides(self, overrides: Dict[str, float]) -> None:
+        """
+        Change balance settings for this game.
+
+        Args:
+            overrides: Values keyed by config name, e.g.
+                {"BOSS_HEALTH": 20}. Applied from the next reset_game().
+
+        Raises:
+            ValueError: If a name is not a tunable setting.
+        """
+        for name, value in overrides.items():
+            if name not in self.TUNABLES:
+                raise ValueError(f"Unknown setting {name}")
+            setattr(self, self.TUNABLES[name], value)
+
+    def govern(self, frame_ms: float) -> None:
+        """
+        Report a frame's time to the governor and apply any level change.
+
+        Args:
+            frame_ms: Time the frame's work took.
+        """
+        if not self.governor.observe(frame_ms):
+            return
+        governor = self.governor
+        self.particles.density = GOVERNED_PARTICLE_DENSITY if governor.active("particles") else 1.0
+        self.cap_requested = governor.active("bullet_cap")
+
+    def entity_counts(self) -> Dict[str, int]:
+        """
+        Get the number of live sprites per group.
+
+        Returns:
+            Dict[str, int]: Counts keyed by group name.
+        """
+        return {
+            "enemies": len(self.enemies),
+            "bullets": len(self.bullets),
+            "boss_bullets": len(self.boss_bullets),
+            "powerups": len(self.powerups),
+            "bosses": len(self.bosses),
+            "particles": len(self.particles),
+        }
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get sprite pool counters.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Pool stats keyed by sprite class name.
+        """
+        return {sprite_class.__name__: pool.stats()
+                for sprite_class, pool in self.pools.items()}
+
+    def advance(self, left: bool, right: bool, shoot: bool) -> None:
+        """
+        Apply one frame of player input and update the game.
+
+        Args:
+            left: Whether the player moves left this frame.
+            right: Whether the player moves right this frame.
+            shoot: Whether the player fires this frame.
+        """
+        # Latched once per step, as the governor may run on another thread
+        self.bullets_capped = self.cap_requested
+        if self.recording is not None:
+            self.recording.record(left, right, shoot, self.bullets_capped)
+
+        self.player.set_input(left, right)
+        if shoot:
+            self.shoot()
+        self.update()
+        self.sim_clock.tick()
+
+        if not self.game_active:
+            self.finish_recording()
+
+    def finish_recording(self) -> None:
+        """Save the current recording, if any."""
+        if self.recording is not None:
+            self.recording.score = self.score
+            self.recording.save(self.record_path)
+            self.recording = None
+
+    def step(self, left: bool = False, right: bool = False, shoot: bool = False) -> bool:
+        """
+        Advance one frame without rendering (headless mode).
+
+        Args:
+            left: Whether the player moves left this frame.
+            right: Whether the player moves right this frame.
+            shoot: Whether the player fires this frame.
+
+        Returns:
+            bool: True while the game is still active.
+        """
+        if not self.game_active:
+            return False
+
+        self.profiler.begin_frame()
+        with self.profiler.phase("update"):
+            self.advance(left, right, shoot)
+        self.profiler.end_frame(self.entity_counts())
+        return self.game_active
+
+    def simulate(self, max_frames: int,
+                 controller: Optional[Callable[["Game"], Tuple[bool, bool, bool]]] = None,
+                 seed: Optional[int] = None, time_limit: Optional[float] = None) -> int:
+        """
+        Play one game headless as fast as possible.
+
+        Args:
+            max_frames: Maximum number of frames to simulate.
+            controller: Called every frame with the game, returns the
+                (left, right, shoot) input. Defaults to no input.
+            seed: Seed for a reproducible game.
+            time_limit: Wall-clock seconds after which the game is stopped.
+
+        Returns:
+            int: Number of frames simulated before game over or a limit.
+        """
+        self.reset_game(seed)
+        deadline = time.perf_counter() + time_limit if time_limit else None
+        frames = 0
+        while frames < max_frames:
+            inputs = controller(self) if controller else (False, False, False)
+            frames += 1
+            if not self.step(*inputs):
+                break
+            if deadline is not None and frames % 1000 == 0 and time.perf_counter() > deadline:
+                break
+        return frames
+
+    def run_replay(self, recording: Recording, realtime: bool = False) -> int:
+        """
+        Re-run a recorded game.
+
+        Args:
+            recording: Seed and input stream to play back.
+            realtime: Play at game speed on screen instead of running
+                unthrottled without rendering.
+
+        Returns:
+            int: Number of frames replayed.
+        """
+        if not self.player_name:
+            self.player_name = "replay"
+            self.scores = {self.player_name: 0}
+
+        self.reset_game(recording.seed)
+        if not realtime:
+            frames = 0
+            while frames < len(recording):
+                frames += 1
+                self.cap_requested = recording.capped(frames - 1)
+                if not self.step(*recording.frame(frames - 1)):
+                    break
+            return frames
+
+        frames = 0
+        self.clock.tick()
+        while frames < len(recording) and self.game_active:
+            elapsed = self.clock.tick(MAX_RENDER_FPS) / 1000
+            if pygame.event.peek(pygame.QUIT):
+                break
+            pygame.event.pump()
+            for _ in range(self.timestep.advance(elapsed)):
+                if frames == len(recording) or not self.game_active:
+                    break
+                self.interpolator.capture(self.all_sprites)
+                self.cap_requested = recording.capped(frames)
+                self.step(*recording.frame(frames))
+                frames += 1
+            self.draw(self.timestep.alpha)
+        return frames
+
+    def run_threaded(self) -> None:
+        """
+        Game loop with logic on a simulation thread.
+
+        This thread only polls events and draws the latest snapshot, so a
+        slow draw or display wait never holds up game logic and a slow
+        step never holds up drawing.
+        """
+        buffer = SnapshotBuffer()
+        inputs = InputState()
+        worker = SimulationThread(self, buffer, inputs)
+        # The game's own profiler is written by the worker
+        profiler = FrameProfiler(budget_ms=self.profiler.budget_ms, dump_prefix="render_profile")
+        worker.start()
+        try:
+            running = True
+            while running and not worker.stopped.is_set():
+                try:
+                    self.clock.tick(MAX_RENDER_FPS)
+                    profiler.begin_frame()
+                    previous, snapshot = buffer.read()
+
+                    with profiler.phase("events"):
+                        for event in pygame.event.get():
+                            if event.type == pygame.QUIT:
+                                running = False
+                            elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                                if snapshot is not None and not snapshot.game_active:
+                                    inputs.request_restart()
+                                else:
+                                    inputs.press_shoot()
+                            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                                # The game's profiler belongs to the worker
+                                inputs.request_profile_dump()
+                            elif event.type == pygame.KEYDOWN:
+                                self.handle_keypress(event)
+                            elif event.type == pygame.WINDOWEXPOSED:
+                                self.renderer.invalidate()
+                        keys = pygame.key.get_pressed()
+                        inputs.set_keys(keys[pygame.K_LEFT], keys[pygame.K_RIGHT])
+
+                    # Nothing to draw until the worker publishes its first step
+                    if snapshot is None:
+                        continue
+                    if not self.governor.skip_frame():
+                        with profiler.phase("draw"):
+                            self.draw_snapshot(snapshot, previous, profiler)
+                    profiler.end_frame({"sprites": len(snapshot.sprites),
+                                        "governor_level": self.governor.level})
+                    self.govern(profiler.frames[-1]["total_ms"])
+                    self.mark_first_frame()
+                except Exception as e:
+                    logging.error(f"Error in render loop: {e}")
+        finally:
+            worker.stop()
+
+    def mark_first_frame(self) -> None:
+        """Record the first drawn frame and log the startup timings, once."""
+        if "first_frame" not in startup_timings:
+            mark_startup("first_frame")
+            logging.info("Startup (ms since launch): " + ", ".join(
+                f"{name} {ms:.0f}" for name, ms in startup_timings.items()))
+
+    def run(self, threaded: bool = False):
+        """
+        Main game loop.
+
+        Args:
+            threaded: Run game logic on a simulation thread, see run_threaded.
+        """
         try:
             # Get player name first
             if not self.get_player_name():
                 pygame.quit()
                 return
+            mark_startup("name_entered")
 
             # Initialize player and enemies
             try:
@@ -380,29 +935,57 @@ class Game:
                 self.all_sprites.add(self.player)
 
                 for _ in range(2):
-                    enemy = Enemy()
-                    self.all_sprites.add(enemy)
-                    self.enemies.add(enemy)
-            except GameError as e:
+                    self.spawn_enemy()
+            except Exception as e:
                 logging.error(f"Failed to initialize sprites: {e}")
                 return
 
-            # Main game loop
+            if threaded:
+                self.run_threaded()
+                return
+
+            # Main game loop: fixed simulation steps, drawn as often as allowed
             running = True
+            self.clock.tick()
             while running:
                 try:
-                    clock.tick(FPS)
-
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            running = False
-                        elif event.type == pygame.KEYDOWN:
-                            self.handle_keypress(event)
-
-                    if self.game_active:
-                        self.update()
-
-                    self.draw()
+                    elapsed = self.clock.tick(MAX_RENDER_FPS) / 1000
+                    profiler = self.profiler
+                    profiler.begin_frame()
+
+                    with profiler.phase("events"):
+                        for event in pygame.event.get():
+                            if event.type == pygame.QUIT:
+                                running = False
+                            elif event.type == pygame.KEYDOWN:
+                                self.handle_keypress(event)
+                            elif event.type == pygame.WINDOWEXPOSED:
+                                self.renderer.invalidate()
+
+                    steps = self.timestep.advance(elapsed)
+                    if self.game_active and steps:
+                        keys = pygame.key.get_pressed()
+                        with profiler.phase("update"):
+                            for step in range(steps):
+                                if not self.game_active:
+                                    break
+                                # Only the last step's start is needed to interpolate
+                                if step == steps - 1:
+                                    self.interpolator.capture(self.all_sprites)
+                                self.advance(keys[pygame.K_LEFT], keys[pygame.K_RIGHT],
+                                             self.shoot_requested)
+                                self.shoot_requested = False
+                    elif not self.game_active:
+                        self.shoot_requested = False
+
+                    if not self.governor.skip_frame():
+                        with profiler.phase("draw"):
+                            self.draw(self.timestep.alpha)
+                    counts = self.entity_counts()
+                    counts["governor_level"] = self.governor.level
+                    profiler.end_frame(counts)
+                    self.govern(profiler.frames[-1]["total_ms"])
+                    self.mark_first_frame()
 
                 except Exception as e:
                     logging.error(f"Error in game loop: {e}")
@@ -411,8 +994,13 @@ class Game:
         except Exception as e:
             logging.critical(f"Critical game error: {e}")
         finally:
+            logging.info(f"Frame governor: {self.governor.stats()}")
             try:
-                save_scores(self.scores)  # Final save before quitting
+                self.finish_recording()
+                if self.score_writer is not None:
+                    self.score_writer.close()  # Final save before quitting
+                if self.leaderboard is not None:
+                    self.leaderboard.close()
             except Exception as e:
                 logging.error(f"Error saving scores: {e}")
             pygame.quit()
@@ -420,8 +1008,11 @@ class Game:
 
 if __name__ == "__main__":
     try:
-        game = Game()
-        game.run()
+        record_path = None
+        if "--record" in sys.argv:
+            record_path = sys.argv[sys.argv.index("--record") + 1]
+        game = Game(record_path=record_path)
+        game.run(threaded="--threaded" in sys.argv)
     except Exception as e:
         logging.critical(f"Fatal error: {e}")
         pygame.quit()
@@ -2,30 +2,108 @@
 Base Sprite Module
 ----------------
 Provides base sprite class with error handling.
+
+Sprites are compact __slots__ entities registered in an EntityRegistry
+rather than pygame sprites held by several groups.
 """
 
-import pygame
 from utils.error_handler import handle_sprite_error
 from typing import Tuple
+from . import image_cache
 
 
-class BaseSprite(pygame.sprite.Sprite):
+class BaseSprite:
     """Base class for all game sprites with error handling."""
 
+    __slots__ = ("image", "rect", "image_key", "image_generation", "pool", "store",
+                 "slot", "registry", "view", "drawn_rect", "x", "y")
+
     @handle_sprite_error
     def __init__(self):
         """Initialize the base sprite."""
-        super().__init__()
+        # Pool that owns this sprite while it is alive, if any
+        self.pool = None
+        # Kinematic store moving this sprite and its slot there, if any
+        self.store = None
+        self.slot = -1
+        # Registry and type view listing this sprite while it is alive
+        self.registry = None
+        self.view = None
+        # Screen area covered when last drawn
+        self.drawn_rect = None
+        # Exact top-left position, rect holds it rounded to whole pixels
+        self.x = 0.0
+        self.y = 0.0
 
     @handle_sprite_error
     def create_surface(self, size: Tuple[int, int], color: Tuple[int, int, int]) -> None:
         """
         Create a surface for the sprite.
 
+        The image is shared with every sprite of the same size and colour,
+        so it must not be drawn on.
+
         Args:
             size: Tuple of width and height.
             color: Tuple of RGB values.
         """
-        self.image = pygame.Surface(size)
-        self.image.fill(color)
+        self.image_key = (size, color)
+        self.image = image_cache.get_surface(size, color)
+        self.image_generation = image_cache.generation
         self.rect = self.image.get_rect()
+
+    def refresh_image(self) -> None:
+        """Re-fetch the shared image if the cache has replaced it."""
+        if self.image_generation != image_cache.generation:
+            self.image_generation = image_cache.generation
+            self.image = image_cache.get_surface(*self.image_key)
+
+    def move_by(self, dx: float, dy: float) -> None:
+        """
+        Move by a possibly fractional offset.
+
+        The exact position is kept in x and y, so speeds that are not a
+        whole number of pixels per step still move evenly both ways. A
+        rect set directly since the last move is picked up first.
+
+        Args:
+            dx: Pixels to move right.
+            dy: Pixels to move down.
+        """
+        rect = self.rect
+        if round(self.x) != rect.x:
+            self.x = float(rect.x)
+        if round(self.y) != rect.y:
+            self.y = float(rect.y)
+        self.x += dx
+        self.y += dy
+        rect.x = round(self.x)
+        rect.y = round(self.y)
+
+    def moved(self) -> None:
+        """Tell the kinematic store that rect was changed directly."""
+        if self.store is not None:
+            self.store.moved(self)
+
+    def alive(self) -> bool:
+        """Check whether the sprite is registered and not killed."""
+        return self.registry is not None
+
+    def update(self) -> None:
+        """Advance the sprite one frame; nothing by default."""
+
+    def kill(self) -> None:
+        """
+        Remove the sprite from the game.
+
+        It stops moving and counts as dead at once; the registry drops it
+        and returns it to its pool at the end of the frame.
+        """
+        if self.store is not None:
+            self.store.remove(self)
+        if self.registry is not None:
+            self.registry.remove(self)
+        elif self.pool is not None:
+            pool = self.pool
+            self.pool = None
+            pool.release(self)
@@ -0,0 +1,161 @@
+"""
+Sprite Atlas Module
+-----------------
+Packs sprite images into shared atlas surfaces, so a whole frame of
+sprites is drawn with one Surface.blits() call, each sprite an area of
+an atlas (see EntityRegistry.draw). Any image can be packed, so textured
+art works as well as the solid rectangles from the image cache.
+"""
+
+import pygame
+from typing import Dict, Hashable, List, Optional, Tuple
+from . import image_cache
+
+ATLAS_WIDTH: int = 512
+INITIAL_HEIGHT: int = 128
+# Empty pixels kept between packed images
+PADDING: int = 1
+
+
+class _Sheet:
+    """One atlas surface filled shelf by shelf."""
+
+    def __init__(self, alpha: bool):
+        """
+        Initialize an empty sheet.
+
+        Args:
+            alpha: Keep per-pixel alpha, for images that need it.
+        """
+        self.alpha = alpha
+        self.surface = self._new_surface(INITIAL_HEIGHT)
+        # Next free position on the current shelf, and its height
+        self.x = 0
+        self.y = 0
+        self.shelf_height = 0
+
+    def _new_surface(self, height: int) -> pygame.Surface:
+        """Create a blank sheet surface in the display format."""
+        if self.alpha:
+            surface = pygame.Surface((ATLAS_WIDTH, height), pygame.SRCALPHA).convert_alpha()
+            surface.fill((0, 0, 0, 0))
+        else:
+            surface = pygame.Surface((ATLAS_WIDTH, height)).convert()
+        return surface
+
+    def place(self, image: pygame.Surface) -> pygame.Rect:
+        """
+        Copy an image into the sheet.
+
+        Args:
+            image: Image no wider than the sheet.
+
+        Returns:
+            pygame.Rect: Area of the sheet holding the image.
+        """
+        width, height = image.get_size()
+        if self.x + width > ATLAS_WIDTH:
+            self.x = 0
+            self.y += self.shelf_height + PADDING
+            self.shelf_height = 0
+        while self.y + height > self.surface.get_height():
+            # Grow downwards; packed areas keep their positions
+            grown = self._new_surface(self.surface.get_height() * 2)
+            grown.blit(self.surface, (0, 0))
+            self.surface = grown
+
+        area = pygame.Rect(self.x, self.y, width, height)
+        if self.alpha:
+            self.surface.blit(image, area, special_flags=pygame.BLEND_RGBA_MAX)
+        else:
+            self.surface.blit(image, area)
+        self.x += width + PADDING
+        self.shelf_height = max(self.shelf_height, height)
+        return area
+
+
+class SpriteAtlas:
+    """Maps image keys to areas of packed atlas sheets."""
+
+    def __init__(self):
+        """Initialize an empty atlas; sheets are created on first use."""
+        self.sheets: Dict[bool, _Sheet] = {}
+        # key -> (sheet, area), sheet looked up again if it has grown
+        self.regions: Dict[Hashable, Tuple[_Sheet, pygame.Rect]] = {}
+        self.generation = image_cache.generation
+
+    def clear(self) -> None:
+        """Forget every packed image, e.g. after the display mode changed."""
+        self.sheets.clear()
+        self.regions.clear()
+        self.generation = image_cache.generation
+
+    def add(self, key: Hashable, image: pygame.Surface) -> Tuple[_Sheet, pygame.Rect]:
+        """
+        Pack an image under a key.
+
+        Images with per-pixel alpha or a colour key go to an alpha sheet,
+        the rest to an opaque sheet that blits faster.
+
+        Args:
+            key: Identifies the image, e.g. a sprite's image_key.
+            image: Image to copy into the atlas.
+
+        Returns:
+            Tuple: The sheet and the area holding the image.
+        """
+        alpha = bool(image.get_flags() & pygame.SRCALPHA) or image.get_colorkey() is not None
+        if image.get_width() > ATLAS_WIDTH:
+            raise ValueError(f"Image {key} is wider than the atlas")
+        if alpha and image.get_colorkey() is not None:
+            image = image.convert_alpha()
+        sheet = self.sheets.get(alpha)
+        if sheet is None:
+            sheet = self.sheets[alpha] = _Sheet(alpha)
+        region = (sheet, sheet.place(image))
+        self.regions[key] = region
+        return region
+
+    def refresh(self) -> None:
+        """Repack from scratch if the image cache replaced its surfaces."""
+        if self.generation != image_cache.generation:
+            self.clear()
+
+    def find(self, key: Hashable, image: Optional[pygame.Surface] = None) -> Tuple[_Sheet, pygame.Rect]:
+        """
+        Get the packed area for a key, packing the image on first use.
+
+        Args:
+            key: Image key.
+            image: Image to pack if the key is new; defaults to the image
+                cache surface for a (size, color) key.
+
+        Returns:
+            Tuple: The sheet and the area holding the image.
+        """
+        region = self.regions.get(key)
+        if region is None:
+            region = self.add(key, image if image is not None else image_cache.get_surface(*key))
+        return region
+
+    def blit_list(self, sprites) -> List[Tuple[pygame.Surface, pygame.Rect, pygame.Rect]]:
+        """
+        Build Surface.blits() arguments for drawing sprites.
+
+        Args:
+            sprites: Sprites with image and rect, and optionally image_key.
+
+        Returns:
+            List: (atlas surface, destination, area) per sprite.
+        """
+        self.refresh()
+        regions = self.regions
+        blits = []
+        for sprite in sprites:
+            key = getattr(sprite, "image_key", None) or sprite.image
+            region = regions.get(key)
+            if region is None:
+                region = self.add(key, sprite.image)
+            blits.append((region[0].surface, sprite.rect, region[1]))
+        return blits
+
@@ -1,68 +1,88 @@
 """
 Boss Sprite Module
 ----------------
-Defines the boss enemy and its bullets.
+Defines the boss enemy and when it fires its bullet patterns.
 """
 
 import random
-import pygame
+from typing import List, Optional, Tuple
 from . import BaseSprite
+from .bullet_patterns import BOSS_PHASES, Pattern, current_phase
 from config import *
 from utils.error_handler import handle_sprite_error
+from utils.game_clock import get_ticks
 
 
-class BossBullet(BaseSprite):
-    """Boss bullet sprite."""
+class Boss(BaseSprite):
+    """Boss enemy sprite with shooting capability."""
+
+    __slots__ = ("speed_x", "speed_y", "health", "max_health", "direction", "entry_phase",
+                 "shoot_delay", "phase", "last_shots", "volleys")
 
     @handle_sprite_error
-    def __init__(self, x: int, y: int):
+    def __init__(self, rng: Optional[random.Random] = None):
         """
-        Initialize the boss bullet.
+        Initialize the boss sprite.
 
         Args:
-            x: Starting x position
-            y: Starting y position
+            rng: Random generator choosing its direction, by default the
+                random module.
         """
         super().__init__()
-        self.create_surface((15, 25), RED)
-        self.rect.centerx = x
-        self.rect.top = y
-        self.speed_y = 7
-
-    @handle_sprite_error
-    def update(self):
-        """Update bullet position."""
-        self.rect.y += self.speed_y
-        if self.rect.top > SCREEN_HEIGHT:
-            self.kill()
-
-
-class Boss(BaseSprite):
-    """Boss enemy sprite with shooting capability."""
-
-    @handle_sprite_error
-    def __init__(self):
-        """Initialize the boss sprite."""
-        super().__init__()
         self.create_surface((100, 100), RED)
         self.rect.centerx = SCREEN_WIDTH // 2
         self.rect.y = -self.rect.height
-        self.speed_x = 3
-        self.speed_y = 1
-        self.health = 15
-        self.direction = random.choice([1, -1])
+        self.speed_x = BOSS_SPEED / FPS
+        self.speed_y = BOSS_ENTRY_SPEED / FPS
+        self.health = self.max_health = BOSS_HEALTH
+        self.direction = (rng or random).choice([1, -1])
         self.entry_phase = True
-        self.last_shot = pygame.time.get_ticks()
-        self.shoot_delay = 1200
+        self.shoot_delay = BOSS_SHOOT_DELAY
+        self.start_phase(0)
+
+    def start_phase(self, phase: int) -> None:
+        """
+        Switch to an attack phase, its patterns first firing one delay later.
+
+        Args:
+            phase: Index into BOSS_PHASES.
+        """
+        count = len(BOSS_PHASES[phase].patterns)
+        self.phase = phase
+        # Per pattern of the phase: when it last fired and how often
+        self.last_shots = [get_ticks()] * count
+        self.volleys = [0] * count
+
+    def due_patterns(self) -> List[Tuple[Pattern, int]]:
+        """
+        Get the patterns to fire now, marking them fired.
+
+        The phase follows the remaining health; each pattern repeats
+        every pattern.delay times shoot_delay milliseconds.
+
+        Returns:
+            List: (pattern, volleys it fired before) per pattern due.
+        """
+        phase = current_phase(BOSS_PHASES, self.health, self.max_health)
+        if phase != self.phase:
+            self.start_phase(phase)
+        now = get_ticks()
+        due = []
+        for i, pattern in enumerate(BOSS_PHASES[phase].patterns):
+            if now - self.last_shots[i] > pattern.delay * self.shoot_delay:
+                due.append((pattern, self.volleys[i]))
+                self.volleys[i] += 1
+                self.last_shots[i] = now
+        return due
 
     @handle_sprite_error
     def update(self):
         """Update boss position and state."""
         if self.entry_phase:
-            self.rect.y += self.speed_y
+            self.move_by(0, self.speed_y)
             if self.rect.top >= 50:
                 self.entry_phase = False
         else:
-            self.rect.x += self.speed_x * self.direction
+            self.move_by(self.speed_x * self.direction, 0)
             if self.rect.right > SCREEN_WIDTH or self.rect.left < 0:
                 self.direction *= -1
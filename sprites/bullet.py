@@ -13,6 +13,8 @@ from utils.error_handler import handle_sprite_error
 class Bullet(BaseSprite):
     """Player bullet sprite with directional movement."""
 
+    __slots__ = ("speed", "angle", "speed_x", "speed_y")
+
     @handle_sprite_error
     def __init__(self, x: int, y: int, angle: float):
         """
@@ -25,9 +27,21 @@ class Bullet(BaseSprite):
         """
         super().__init__()
         self.create_surface((10, 20), YELLOW)
+        self.reset(x, y, angle)
+
+    @handle_sprite_error
+    def reset(self, x: int, y: int, angle: float):
+        """
+        Place the bullet for a new shot.
+
+        Args:
+            x: Starting x position
+            y: Starting y position
+            angle: Firing angle in degrees
+        """
         self.rect.centerx = x
         self.rect.bottom = y
-        self.speed = 10
+        self.speed = BULLET_SPEED / FPS
         self.angle = math.radians(angle)
         self.speed_x = -math.sin(self.angle) * self.speed
         self.speed_y = -math.cos(self.angle) * self.speed
@@ -0,0 +1,390 @@
+"""
+Bullet Field Module
+-----------------
+Keeps every bullet of one look as rows of parallel arrays instead of one
+sprite object per bullet, so boss patterns with thousands of live
+bullets are spawned a volley at a time, moved, culled and hit-tested in
+a few vectorized passes and drawn with one Surface.blits() call.
+
+Without NumPy the same field runs on Python lists.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # create_field() falls back to BulletField
+    np = None
+
+import pygame
+from typing import List, Optional, Tuple
+from config import SCREEN_HEIGHT, SCREEN_WIDTH
+from . import image_cache
+from .atlas import SpriteAtlas
+from .bullet_patterns import Volley
+from .mask_cache import get_image_mask, get_mask
+
+INITIAL_CAPACITY: int = 256
+
+# Left x, top y, and the same before the latest step, in whole pixels
+BulletState = Tuple[List[int], List[int], List[int], List[int]]
+
+
+class BulletField:
+    """Bullets of one size and colour, kept in parallel Python lists."""
+
+    def __init__(self, size: Tuple[int, int], color: Tuple[int, int, int]):
+        """
+        Initialize an empty field.
+
+        Args:
+            size: Width and height of every bullet.
+            color: Bullet colour.
+        """
+        self.width, self.height = size
+        self.image_key = (size, color)
+        # Rects drawn last frame, erased at the start of the next one
+        self.drawn_rects: List[pygame.Rect] = []
+        self.clear()
+
+    @property
+    def image(self) -> pygame.Surface:
+        """Shared surface every bullet is drawn with."""
+        return image_cache.get_surface(*self.image_key)
+
+    def clear(self) -> None:
+        """Remove every bullet."""
+        self.xs: List[float] = []
+        self.ys: List[float] = []
+        self.vxs: List[float] = []
+        self.vys: List[float] = []
+        self.prev_xs: List[float] = []
+        self.prev_ys: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def spawn(self, volley: Volley, limit: Optional[int] = None) -> int:
+        """
+        Add a volley of bullets.
+
+        Args:
+            volley: Centre x, top y and per-step velocities, see emit().
+            limit: Most bullets alive afterwards; the rest of the volley
+                is not fired.
+
+        Returns:
+            int: Bullets added.
+        """
+        if limit is not None:
+            room = max(limit - len(self), 0)
+            if room < len(volley[0]):
+                volley = tuple(values[:room] for values in volley)
+        if volley[0]:
+            self._append(volley)
+        return len(volley[0])
+
+    def _append(self, volley: Volley) -> None:
+        """Store the bullets of a volley."""
+        centres, tops, vxs, vys = volley
+        lefts = [x - self.width // 2 for x in centres]
+        self.xs.extend(lefts)
+        self.ys.extend(tops)
+        self.prev_xs.extend(lefts)
+        self.prev_ys.extend(tops)
+        self.vxs.extend(vxs)
+        self.vys.extend(vys)
+
+    def _keep(self, keep: List[bool]) -> None:
+        """Drop the bullets whose keep flag is false."""
+        for name in ("xs", "ys", "vxs", "vys", "prev_xs", "prev_ys"):
+            values = getattr(self, name)
+            setattr(self, name, [value for value, kept in zip(values, keep) if kept])
+
+    def step(self) -> int:
+        """
+        Move every bullet one frame and drop those that left the screen.
+
+        Returns:
+            int: Number of bullets dropped.
+        """
+        self.prev_xs = self.xs
+        self.prev_ys = self.ys
+        self.xs = [x + vx for x, vx in zip(self.xs, self.vxs)]
+        self.ys = [y + vy for y, vy in zip(self.ys, self.vys)]
+        width, height = self.width, self.height
+        keep = [-width <= int(x) <= SCREEN_WIDTH and -height <= int(y) <= SCREEN_HEIGHT
+                for x, y in zip(self.xs, self.ys)]
+        dropped = keep.count(False)
+        if dropped:
+            self._keep(keep)
+        return dropped
+
+    def _overlapping(self, rect: pygame.Rect) -> List[int]:
+        """Indices of bullets whose rects overlap a rect."""
+        width, height = self.width, self.height
+        return [i for i, (x, y) in enumerate(zip(self.xs, self.ys))
+                if int(x) < rect.right and int(x) + width > rect.left
+                and int(y) < rect.bottom and int(y) + height > rect.top]
+
+    def _remove(self, indices: List[int]) -> None:
+        """Drop the bullets at the given indices."""
+        keep = [True] * len(self)
+        for i in indices:
+            keep[i] = False
+        self._keep(keep)
+
+    def hit(self, sprite) -> int:
+        """
+        Remove the bullets touching a sprite.
+
+        Rect overlaps are found first; pixel masks are only compared for
+        those, and only when either image has transparent pixels.
+
+        Args:
+            sprite: Sprite to test, e.g. the player.
+
+        Returns:
+            int: Number of bullets that hit.
+        """
+        rect = sprite.rect
+        hits = self._overlapping(rect)
+        if not hits:
+            return 0
+        sprite_mask, sprite_solid = get_mask(sprite)
+        bullet_mask, bullet_solid = get_image_mask(self.image_key, self.image)
+        if not (sprite_solid and bullet_solid):
+            lefts, tops = self.positions(hits)
+            hits = [i for i, x, y in zip(hits, lefts, tops)
+                    if sprite_mask.overlap(bullet_mask, (x - rect.x, y - rect.y))]
+        if hits:
+            self._remove(hits)
+        return len(hits)
+
+    def positions(self, indices: List[int]) -> Tuple[List[int], List[int]]:
+        """Whole-pixel top-left corners of some bullets."""
+        return [int(self.xs[i]) for i in indices], [int(self.ys[i]) for i in indices]
+
+    def state(self) -> BulletState:
+        """
+        Copy the current and previous bullet positions.
+
+        Returns:
+            BulletState: Lists safe to hand to another thread.
+        """
+        return ([int(x) for x in self.xs], [int(y) for y in self.ys],
+                [int(x) for x in self.prev_xs], [int(y) for y in self.prev_ys])
+
+    def blended(self, alpha: float) -> Tuple[List[int], List[int]]:
+        """
+        Get bullet positions part way through the latest step.
+
+        Args:
+            alpha: 0 for the previous positions, 1 for the current ones.
+
+        Returns:
+            Tuple: Left x and top y lists.
+        """
+        return blend(self.state(), alpha)
+
+    def rects(self) -> List[pygame.Rect]:
+        """
+        Get a rect per bullet, e.g. for observations.
+
+        Returns:
+            List[pygame.Rect]: New rects, in spawn order.
+        """
+        xs, ys, _, _ = self.state()
+        return [pygame.Rect(x, y, self.width, self.height) for x, y in zip(xs, ys)]
+
+    def draw(self, surface: pygame.Surface, atlas: SpriteAtlas, alpha: float = 1.0) -> List[pygame.Rect]:
+        """
+        Draw every bullet with one blits() call.
+
+        Args:
+            surface: Surface to draw on.
+            atlas: Atlas holding the bullet image.
+            alpha: Position between the last two steps, 1 for the latest.
+
+        Returns:
+            List[pygame.Rect]: Regions changed since the last draw.
+        """
+        rects = draw_bullets(surface, atlas, self.image_key, *self.blended(alpha))
+        dirty = rects + self.drawn_rects
+        self.drawn_rects = rects
+        return dirty
+
+
+class ArrayBulletField(BulletField):
+    """BulletField kept in NumPy arrays, moved and tested in bulk."""
+
+    def clear(self) -> None:
+        """Remove every bullet."""
+        self.count = 0
+        # Rows are x and y, so both axes move in one operation
+        self.pos = np.zeros((2, INITIAL_CAPACITY))
+        self.vel = np.zeros((2, INITIAL_CAPACITY))
+        self.prev = np.zeros((2, INITIAL_CAPACITY))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _append(self, volley: Volley) -> None:
+        """Store the bullets of a volley."""
+        centres, tops, vxs, vys = volley
+        start = self.count
+        end = start + len(centres)
+        if end > self.pos.shape[1]:
+            capacity = self.pos.shape[1]
+            while capacity < end:
+                capacity *= 2
+            for name in ("pos", "vel", "prev"):
+                old = getattr(self, name)
+                new = np.zeros((2, capacity))
+                new[:, :start] = old[:, :start]
+                setattr(self, name, new)
+        self.pos[0, start:end] = centres
+        self.pos[0, start:end] -= self.width // 2
+        self.pos[1, start:end] = tops
+        self.prev[:, start:end] = self.pos[:, start:end]
+        self.vel[0, start:end] = vxs
+        self.vel[1, start:end] = vys
+        self.count = end
+
+    def _keep(self, keep) -> None:
+        """Drop the bullets whose keep flag is false."""
+        n = self.count
+        kept = int(np.count_nonzero(keep))
+        for array in (self.pos, self.vel, self.prev):
+            array[:, :kept] = array[:, :n][:, keep]
+        self.count = kept
+
+    def _corners(self):
+        """Whole-pixel top-left corners, truncated like int()."""
+        return self.pos[:, :self.count].astype(np.int64)
+
+    def step(self) -> int:
+        """
+        Move every bullet one frame and drop those that left the screen.
+
+        Returns:
+            int: Number of bullets dropped.
+        """
+        n = self.count
+        if not n:
+            return 0
+        self.prev[:, :n] = self.pos[:, :n]
+        self.pos[:, :n] += self.vel[:, :n]
+        left, top = self._corners()
+        out = ((left < -self.width) | (left > SCREEN_WIDTH)
+               | (top < -self.height) | (top > SCREEN_HEIGHT))
+        dropped = int(np.count_nonzero(out))
+        if dropped:
+            self._keep(~out)
+        return dropped
+
+    def _overlapping(self, rect: pygame.Rect) -> List[int]:
+        """Indices of bullets whose rects overlap a rect."""
+        if not self.count:
+            return []
+        left, top = self._corners()
+        overlap = ((left < rect.right) & (left + self.width > rect.left)
+                   & (top < rect.bottom) & (top + self.height > rect.top))
+        return np.flatnonzero(overlap).tolist()
+
+    def _remove(self, indices: List[int]) -> None:
+        """Drop the bullets at the given indices."""
+        keep = np.ones(self.count, dtype=bool)
+        keep[indices] = False
+        self._keep(keep)
+
+    def positions(self, indices: List[int]) -> Tuple[List[int], List[int]]:
+        """Whole-pixel top-left corners of some bullets."""
+        lefts, tops = self.pos[:, indices].astype(np.int64).tolist()
+        return lefts, tops
+
+    def state(self) -> BulletState:
+        """
+        Copy the current and previous bullet positions.
+
+        Returns:
+            BulletState: Lists safe to hand to another thread.
+        """
+        n = self.count
+        xs, ys = self.pos[:, :n].astype(np.int64).tolist()
+        prev_xs, prev_ys = self.prev[:, :n].astype(np.int64).tolist()
+        return xs, ys, prev_xs, prev_ys
+
+    def blended(self, alpha: float) -> Tuple[List[int], List[int]]:
+        """
+        Get bullet positions part way through the latest step.
+
+        Args:
+            alpha: 0 for the previous positions, 1 for the current ones.
+
+        Returns:
+            Tuple: Left x and top y lists.
+        """
+        current = self._corners()
+        if alpha < 1.0:
+            previous = self.prev[:, :self.count].astype(np.int64)
+            current = np.rint(previous + (current - previous) * alpha).astype(np.int64)
+        xs, ys = current.tolist()
+        return xs, ys
+
+
+def create_field(size: Tuple[int, int], color: Tuple[int, int, int]) -> BulletField:
+    """
+    Create a bullet field, array-backed if NumPy is installed.
+
+    Args:
+        size: Width and height of every bullet.
+        color: Bullet colour.
+
+    Returns:
+        BulletField: The empty field.
+    """
+    if np is not None:
+        return ArrayBulletField(size, color)
+    return BulletField(size, color)
+
+
+def blend(bullets: BulletState, alpha: float) -> Tuple[List[int], List[int]]:
+    """
+    Blend bullet positions between their previous and current steps.
+
+    Bullets move a few pixels per step, so unlike sprites they are never
+    too far apart to blend.
+
+    Args:
+        bullets: Positions from BulletField.state().
+        alpha: 0 for the previous positions, 1 for the current ones.
+
+    Returns:
+        Tuple: Left x and top y lists.
+    """
+    xs, ys, prev_xs, prev_ys = bullets
+    if alpha >= 1.0:
+        return xs, ys
+    return ([round(px + (x - px) * alpha) for x, px in zip(xs, prev_xs)],
+            [round(py + (y - py) * alpha) for y, py in zip(ys, prev_ys)])
+
+
+def draw_bullets(surface: pygame.Surface, atlas: SpriteAtlas, image_key: tuple,
+                 xs: List[int], ys: List[int]) -> List[pygame.Rect]:
+    """
+    Draw bullets sharing one image with a single blits() call.
+
+    Args:
+        surface: Surface to draw on.
+        atlas: Atlas holding the bullet image.
+        image_key: (size, color) of the bullet image.
+        xs: Left x of every bullet.
+        ys: Top y of every bullet.
+
+    Returns:
+        List[pygame.Rect]: Areas drawn.
+    """
+    if not xs:
+        return []
+    sheet, area = atlas.find(image_key)
+    image = sheet.surface
+    return surface.blits([(image, position, area) for position in zip(xs, ys)])
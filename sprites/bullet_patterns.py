@@ -0,0 +1,138 @@
+"""
+Bullet Patterns Module
+--------------------
+Declares boss attacks as data: each boss phase lists the patterns it
+fires, and emit() turns one volley of a pattern into the positions and
+velocities of its bullets, spawned together into a BulletField.
+
+Angles are in degrees, 0 pointing straight down and positive values
+turning towards the right of the screen.
+"""
+
+import math
+from typing import List, NamedTuple, Tuple
+from config import BOSS_BULLET_SPEED, FPS
+
+# Bullet start x, start y, x velocity and y velocity, one entry per bullet
+Volley = Tuple[List[float], List[float], List[float], List[float]]
+
+
+class Pattern(NamedTuple):
+    """
+    One repeating attack.
+
+    kind is one of:
+        line: count bullets side by side, spacing px apart, moving at angle.
+        ring: count bullets evenly around the boss, turned by spin degrees
+            every volley; a ring with few bullets and a high spin is a spiral.
+        aimed: count bullets spread over arc degrees, centred on the player.
+        wave: count bullets spread over arc degrees around angle, the whole
+            fan swaying sway degrees from side to side over the volleys.
+    """
+    kind: str
+    count: int = 1
+    # Pixels per second
+    speed: float = BOSS_BULLET_SPEED
+    # Multiple of the boss's shoot delay between volleys
+    delay: float = 1.0
+    spacing: float = 0.0
+    arc: float = 0.0
+    angle: float = 0.0
+    spin: float = 0.0
+    sway: float = 0.0
+
+
+class Phase(NamedTuple):
+    """Patterns fired while the boss has at most a fraction of its health."""
+    health: float
+    patterns: Tuple[Pattern, ...]
+
+
+# Ordered from full health down; later phases replace earlier ones
+BOSS_PHASES: Tuple[Phase, ...] = (
+    Phase(1.0, (
+        Pattern("line", count=3, spacing=30),
+    )),
+    Phase(0.66, (
+        Pattern("aimed", count=5, arc=40, speed=360),
+        Pattern("ring", count=16, speed=240, delay=1.5, spin=11.25),
+    )),
+    Phase(0.33, (
+        Pattern("ring", count=4, speed=210, delay=0.08, spin=13),
+        Pattern("wave", count=9, arc=80, speed=300, delay=0.75, sway=35),
+        Pattern("aimed", count=3, arc=12, speed=480, delay=1.25),
+    )),
+)
+
+
+def current_phase(phases: Tuple[Phase, ...], health: int, max_health: int) -> int:
+    """
+    Find the phase for a boss's remaining health.
+
+    Args:
+        phases: Phases ordered from full health down.
+        health: Remaining health.
+        max_health: Health the boss started with.
+
+    Returns:
+        int: Index into phases.
+    """
+    fraction = health / max_health if max_health > 0 else 0.0
+    index = 0
+    for i, phase in enumerate(phases):
+        if fraction <= phase.health:
+            index = i
+    return index
+
+
+def _directions(pattern: Pattern, aim: float, volley: int) -> List[float]:
+    """Firing angles in degrees of one volley, for the angular patterns."""
+    count = pattern.count
+    if pattern.kind == "ring":
+        start = pattern.angle + pattern.spin * volley
+        return [start + 360.0 * i / count for i in range(count)]
+
+    if pattern.kind == "aimed":
+        centre = aim
+    else:
+        centre = pattern.angle + pattern.sway * math.sin(volley * 0.5)
+    if count == 1:
+        return [centre]
+    step = pattern.arc / (count - 1)
+    return [centre - pattern.arc / 2 + step * i for i in range(count)]
+
+
+def emit(pattern: Pattern, x: float, y: float, target: Tuple[int, int], volley: int) -> Volley:
+    """
+    Generate one volley of a pattern.
+
+    Args:
+        pattern: Pattern to fire.
+        x: Centre x of the muzzle.
+        y: Muzzle y, where the bullets' top edges start.
+        target: Point aimed patterns fire at, usually the player centre.
+        volley: Volleys of this pattern already fired, for spin and sway.
+
+    Returns:
+        Volley: Bullet centre x, top y and per-step velocities.
+
+    Raises:
+        ValueError: If the pattern kind is unknown.
+    """
+    speed = pattern.speed / FPS
+    count = pattern.count
+    if pattern.kind == "line":
+        radians = math.radians(pattern.angle)
+        vx = math.sin(radians) * speed
+        vy = math.cos(radians) * speed
+        first = x - pattern.spacing * (count - 1) / 2
+        xs = [first + pattern.spacing * i for i in range(count)]
+        return xs, [y] * count, [vx] * count, [vy] * count
+
+    if pattern.kind not in ("ring", "aimed", "wave"):
+        raise ValueError(f"Unknown bullet pattern {pattern.kind}")
+    aim = math.degrees(math.atan2(target[0] - x, target[1] - y))
+    angles = [math.radians(angle) for angle in _directions(pattern, aim, volley)]
+    return ([x] * count, [y] * count,
+            [math.sin(angle) * speed for angle in angles],
+            [math.cos(angle) * speed for angle in angles])
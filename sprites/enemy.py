@@ -5,6 +5,7 @@ Defines the basic enemy sprite.
 """
 
 import random
+from typing import Optional
 from . import BaseSprite
 from config import *
 from utils.error_handler import handle_sprite_error
@@ -13,16 +14,34 @@ from utils.error_handler import handle_sprite_error
 class Enemy(BaseSprite):
     """Basic enemy sprite that moves downward."""
 
+    __slots__ = ("speed_y",)
+
     @handle_sprite_error
-    def __init__(self):
-        """Initialize the enemy sprite."""
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Initialize the enemy sprite.
+
+        Args:
+            rng: Random generator placing it, by default the random module.
+        """
         super().__init__()
         self.create_surface((50, 50), GRAY)
-        self.rect.x = random.randint(0, SCREEN_WIDTH - self.rect.width)
-        self.rect.y = random.randint(-100, -40)
-        self.speed_y = random.randint(1, 2)
+        self.reset(rng)
+
+    @handle_sprite_error
+    def reset(self, rng: Optional[random.Random] = None):
+        """
+        Place the enemy at a random position above the screen.
+
+        Args:
+            rng: Random generator to use, by default the random module.
+        """
+        rng = rng or random
+        self.rect.x = rng.randint(0, SCREEN_WIDTH - self.rect.width)
+        self.rect.y = rng.randint(-100, -40)
+        self.speed_y = rng.randint(1, 2) * ENEMY_SPEED / FPS
 
     @handle_sprite_error
     def update(self):
         """Update enemy position."""
-        self.rect.y += self.speed_y
+        self.move_by(0, self.speed_y)
@@ -0,0 +1,63 @@
+"""
+Image Cache Module
+----------------
+Provides shared, display-format sprite surfaces keyed by size, colour
+and flags, so identical sprites reuse one surface.
+"""
+
+import pygame
+from typing import Dict, List, Tuple
+
+# (size, color, flags) -> [surface, converted to display format]
+_cache: Dict[Tuple, List] = {}
+
+# Bumped whenever cached surfaces are replaced; sprites compare against it
+generation: int = 0
+
+
+def _display_ready() -> bool:
+    """Check whether a display surface exists to convert against."""
+    return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+
+def get_surface(size: Tuple[int, int], color: Tuple[int, int, int], flags: int = 0) -> pygame.Surface:
+    """
+    Get a shared surface filled with a colour.
+
+    Surfaces are converted to the display pixel format as soon as a
+    display exists. Callers must not draw onto the returned surface.
+
+    Args:
+        size: Tuple of width and height.
+        color: Tuple of RGB values.
+        flags: pygame surface flags, e.g. pygame.SRCALPHA.
+
+    Returns:
+        pygame.Surface: The cached surface.
+    """
+    global generation
+    key = (size, color, flags)
+    entry = _cache.get(key)
+    if entry is not None and entry[1]:
+        return entry[0]
+
+    ready = _display_ready()
+    if entry is not None and not ready:
+        return entry[0]
+
+    surface = pygame.Surface(size, flags)
+    surface.fill(color)
+    if ready:
+        surface = surface.convert_alpha() if flags & pygame.SRCALPHA else surface.convert()
+        if entry is not None:
+            # Sprites holding the unconverted surface pick this one up
+            generation += 1
+    _cache[key] = [surface, ready]
+    return surface
+
+
+def invalidate() -> None:
+    """Drop all cached surfaces, e.g. after the display mode changes."""
+    global generation
+    _cache.clear()
+    generation += 1
@@ -0,0 +1,221 @@
+"""
+Kinematics Module
+---------------
+Keeps the positions, velocities and sizes of one sprite type in NumPy
+arrays, so the whole type is moved and bounds-culled in one vectorized
+pass per frame. NumPy is optional; without it sprites move through their
+own update() methods.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # Sprites fall back to their update() methods
+    np = None
+
+from typing import List
+from config import SCREEN_HEIGHT, SCREEN_WIDTH
+
+INITIAL_CAPACITY: int = 64
+# Below this many sprites the arithmetic runs on Python floats, because
+# each NumPy call costs more than a handful of scalar updates
+SMALL_BATCH: int = 16
+
+
+def available() -> bool:
+    """
+    Check whether array-backed movement can be used.
+
+    Returns:
+        bool: True if NumPy is installed.
+    """
+    return np is not None
+
+
+class KinematicStore:
+    """Struct-of-arrays movement for every live sprite of one type."""
+
+    def __init__(self, cull_top: bool = False, cull_bottom: bool = False,
+                 cull_sides: bool = False, capacity: int = INITIAL_CAPACITY):
+        """
+        Initialize an empty store.
+
+        Args:
+            cull_top: Kill sprites that leave through the top of the screen.
+            cull_bottom: Kill sprites that leave through the bottom.
+            cull_sides: Kill sprites that cross the left or right edge.
+            capacity: Initial array length, doubled when full.
+        """
+        self.cull_top = cull_top
+        self.cull_bottom = cull_bottom
+        self.cull_sides = cull_sides
+        self.count = 0
+        # Slot i of every array belongs to sprites[i], whose rect is rects[i]
+        self.sprites: List = []
+        self.rects: List = []
+        # Sprites whose rect was set outside the store since the last step
+        self.pending: List = []
+        # Rows are x and y, so both axes move in one operation
+        self.pos = np.zeros((2, capacity))
+        self.vel = np.zeros((2, capacity))
+        self.size = np.zeros((2, capacity), dtype=np.int64)
+        # Set once any sprite moves sideways, otherwise only rect.y is synced
+        self.horizontal = False
+
+    def _grow(self) -> None:
+        """Double the array capacity."""
+        for name in ("pos", "vel", "size"):
+            old = getattr(self, name)
+            new = np.zeros((2, 2 * old.shape[1]), dtype=old.dtype)
+            new[:, :self.count] = old[:, :self.count]
+            setattr(self, name, new)
+
+    def _load(self, sprite) -> None:
+        """Copy a sprite's rect and speed into its slot."""
+        slot = sprite.slot
+        rect = sprite.rect
+        self.pos[:, slot] = rect.topleft
+        speed_x = getattr(sprite, "speed_x", 0)
+        self.vel[:, slot] = (speed_x, sprite.speed_y)
+        if speed_x:
+            self.horizontal = True
+        self.size[:, slot] = rect.size
+
+    def add(self, sprite) -> None:
+        """
+        Start moving a sprite from its current rect and speed.
+
+        The rect is read again on the next step, so it may still be
+        changed after the sprite is added.
+
+        Args:
+            sprite: Sprite with rect and speed_y (and optionally speed_x).
+        """
+        if self.count == self.pos.shape[1]:
+            self._grow()
+        sprite.store = self
+        sprite.slot = self.count
+        self.sprites.append(sprite)
+        self.rects.append(sprite.rect)
+        self.count += 1
+        self._load(sprite)
+        self.pending.append(sprite)
+
+    def moved(self, sprite) -> None:
+        """
+        Note that a sprite's rect was changed directly.
+
+        Args:
+            sprite: Sprite in this store.
+        """
+        self.pending.append(sprite)
+
+    def remove(self, sprite) -> None:
+        """
+        Stop moving a sprite, filling its slot with the last one.
+
+        Args:
+            sprite: Sprite in this store.
+        """
+        slot = sprite.slot
+        last = self.count - 1
+        if slot != last:
+            moved = self.sprites[last]
+            self.sprites[slot] = moved
+            self.rects[slot] = self.rects[last]
+            moved.slot = slot
+            for array in (self.pos, self.vel, self.size):
+                array[:, slot] = array[:, last]
+        self.sprites.pop()
+        self.rects.pop()
+        self.count = last
+        sprite.store = None
+
+    def step(self) -> List:
+        """
+        Move every sprite one frame, update rects and kill sprites that
+        left the screen.
+
+        Returns:
+            List: The sprites killed.
+        """
+        for sprite in self.pending:
+            if sprite.store is self:
+                self._load(sprite)
+        self.pending.clear()
+
+        n = self.count
+        if not n:
+            return []
+        if n < SMALL_BATCH:
+            return self._step_small(n)
+        pos = self.pos[:, :n]
+        pos += self.vel[:, :n]
+        # Truncate like int(), which the per-sprite updates used
+        coords = pos.astype(np.int64)
+        left = coords[0]
+        top = coords[1]
+
+        out = None
+        if self.cull_top:
+            out = top + self.size[1, :n] < 0
+        if self.cull_bottom:
+            below = top > SCREEN_HEIGHT
+            out = below if out is None else out | below
+        if self.cull_sides:
+            beside = (left < 0) | (left + self.size[0, :n] > SCREEN_WIDTH)
+            out = beside if out is None else out | beside
+        gone = np.flatnonzero(out).tolist() if out is not None else []
+
+        if not gone:
+            if self.horizontal:
+                for rect, rect_x, rect_y in zip(self.rects, *coords.tolist()):
+                    rect.topleft = (rect_x, rect_y)
+            else:
+                for rect, rect_y in zip(self.rects, top.tolist()):
+                    rect.y = rect_y
+            return []
+
+        # Only survivors are drawn and collided, culled rects are left stale
+        culled = [self.sprites[i] for i in gone]
+        keep = ~out
+        for rect, rect_x, rect_y in zip(
+                [rect for rect, kept in zip(self.rects, keep.tolist()) if kept],
+                left[keep].tolist(), top[keep].tolist()):
+            rect.topleft = (rect_x, rect_y)
+        for sprite in culled:
+            sprite.kill()
+        return culled
+
+    def _step_small(self, n: int) -> List:
+        """step() for a few sprites, with the same arithmetic on Python floats."""
+        (xs, ys), (vxs, vys) = self.pos[:, :n].tolist(), self.vel[:, :n].tolist()
+        xs = [x + vx for x, vx in zip(xs, vxs)]
+        ys = [y + vy for y, vy in zip(ys, vys)]
+        self.pos[:, :n] = (xs, ys)
+
+        culled = []
+        for sprite, rect, x, y in zip(self.sprites, self.rects, xs, ys):
+            left = int(x)
+            top = int(y)
+            if ((self.cull_top and top + rect.height < 0)
+                    or (self.cull_bottom and top > SCREEN_HEIGHT)
+                    or (self.cull_sides and (left < 0 or left + rect.width > SCREEN_WIDTH))):
+                culled.append(sprite)
+            else:
+                rect.topleft = (left, top)
+        for sprite in culled:
+            sprite.kill()
+        return culled
+
+    def any_below(self, limit: int) -> bool:
+        """
+        Check whether any sprite's top edge is below a line.
+
+        Args:
+            limit: Screen y coordinate.
+
+        Returns:
+            bool: True if a sprite's rect.top is greater than limit.
+        """
+        n = self.count
+        return bool(n) and bool((self.pos[1, :n].astype(np.int64) > limit).any())
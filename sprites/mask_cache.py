@@ -0,0 +1,75 @@
+"""
+Mask Cache Module
+---------------
+Provides collision masks computed once per sprite image and shared by
+every sprite drawn with it, for pixel-accurate checks after a rect
+overlap has already been found.
+"""
+
+import pygame
+from typing import Dict, Hashable, Tuple
+
+# image key -> (mask, whether every pixel is set)
+_cache: Dict[Hashable, Tuple[pygame.mask.Mask, bool]] = {}
+
+
+def get_image_mask(key: Hashable, image: pygame.Surface) -> Tuple[pygame.mask.Mask, bool]:
+    """
+    Get the collision mask of an image, building it on first use.
+
+    Args:
+        key: Identifies the image, e.g. an image_key.
+        image: Image to build the mask from if the key is new.
+
+    Returns:
+        Tuple: The mask, and True if it covers the whole image.
+    """
+    entry = _cache.get(key)
+    if entry is None:
+        mask = pygame.mask.from_surface(image)
+        width, height = image.get_size()
+        entry = _cache[key] = (mask, mask.count() == width * height)
+    return entry
+
+
+def get_mask(sprite) -> Tuple[pygame.mask.Mask, bool]:
+    """
+    Get the collision mask of a sprite's image.
+
+    Sprites with an image_key share the mask of that key; others are
+    cached by image surface.
+
+    Args:
+        sprite: Sprite with image and optionally image_key.
+
+    Returns:
+        Tuple: The mask, and True if it covers the whole image.
+    """
+    return get_image_mask(getattr(sprite, "image_key", None) or sprite.image, sprite.image)
+
+
+def collide_mask(left, right) -> bool:
+    """
+    Check whether two sprites with overlapping rects touch pixel-wise.
+
+    Solid images need no mask test, so rectangle art costs only two
+    cache lookups.
+
+    Args:
+        left: First sprite.
+        right: Second sprite; its rect must overlap left's.
+
+    Returns:
+        bool: True if set pixels of the two images overlap.
+    """
+    left_mask, left_solid = get_mask(left)
+    right_mask, right_solid = get_mask(right)
+    if left_solid and right_solid:
+        return True
+    offset = (right.rect.x - left.rect.x, right.rect.y - left.rect.y)
+    return left_mask.overlap(right_mask, offset) is not None
+
+
+def clear() -> None:
+    """Drop all cached masks, e.g. after sprite art was replaced."""
+    _cache.clear()
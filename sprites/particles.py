@@ -0,0 +1,223 @@
+"""
+Particles Module
+--------------
+Hit sparks and explosions kept in fixed-capacity NumPy arrays (position,
+velocity, lifetime and colour) rather than as sprites. Every live
+particle is moved and expired in one vectorized pass per frame and drawn
+with one Surface.blits() call from a small palette of faded colours.
+
+Particles draw on their own random generator, so effects never change
+the course of a seeded game. Without NumPy no particles are shown.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # Effects are skipped
+    np = None
+
+import math
+import pygame
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from config import (BLUE, FPS, GRAY, MAX_PARTICLES, ORANGE, PINK, RED,
+                    SCREEN_HEIGHT, SCREEN_WIDTH, WHITE, YELLOW)
+
+PARTICLE_SIZE: int = 3
+# Brightness steps a particle fades through over its lifetime
+FADE_LEVELS: int = 6
+# Downward pull in px/s per second, and velocity kept per step
+GRAVITY: float = 240.0
+DRAG: float = 0.96
+
+COLORS: Tuple[Tuple[int, int, int], ...] = (WHITE, YELLOW, ORANGE, RED, GRAY, PINK, BLUE)
+
+# Left x, top y and palette cell of every particle
+ParticleState = Tuple[List[int], List[int], List[int]]
+
+
+class Effect(NamedTuple):
+    """A burst of particles flying out from a point."""
+    count: int
+    # Fastest particle, in pixels per second
+    speed: float
+    # Longest life, in seconds
+    lifetime: float
+    colors: Tuple[Tuple[int, int, int], ...]
+
+
+EFFECTS: Dict[str, Effect] = {
+    "hit": Effect(6, 150, 0.25, (WHITE, YELLOW)),
+    "explosion": Effect(24, 180, 0.6, (GRAY, ORANGE, YELLOW)),
+    "boss_explosion": Effect(160, 300, 1.2, (RED, ORANGE, YELLOW, WHITE)),
+}
+
+
+class ParticleSystem:
+    """Every live particle, in arrays allocated once."""
+
+    def __init__(self, capacity: int = MAX_PARTICLES):
+        """
+        Initialize an empty system.
+
+        Args:
+            capacity: Most particles alive at once.
+        """
+        self.capacity = capacity if np is not None else 0
+        self.count = 0
+        # Burst sizes are scaled by this, e.g. lowered under load
+        self.density = 1.0
+        self.dropped = 0
+        self.drawn_rects: List[pygame.Rect] = []
+        self.palette: Optional[pygame.Surface] = None
+        self.areas = [pygame.Rect(cell * PARTICLE_SIZE, 0, PARTICLE_SIZE, PARTICLE_SIZE)
+                      for cell in range(len(COLORS) * FADE_LEVELS)]
+        if np is not None:
+            self.pos = np.zeros((2, capacity))
+            self.vel = np.zeros((2, capacity))
+            self.life = np.zeros(capacity)
+            self.max_life = np.ones(capacity)
+            self.color = np.zeros(capacity, dtype=np.int64)
+            self.rng = np.random.default_rng()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """
+        Remove every particle.
+
+        Args:
+            seed: Seed for the particle random generator, if any.
+        """
+        self.count = 0
+        if np is not None:
+            self.rng = np.random.default_rng(seed)
+
+    def emit(self, name: str, x: float, y: float) -> int:
+        """
+        Start a burst.
+
+        Past half the capacity bursts shrink in proportion to the room
+        left, so a busy screen thins out instead of overflowing.
+
+        Args:
+            name: Effect name, one of EFFECTS.
+            x: Centre x.
+            y: Centre y.
+
+        Returns:
+            int: Particles started.
+        """
+        effect = EFFECTS[name]
+        requested = int(effect.count * self.density)
+        free = self.capacity - self.count
+        n = min(requested, free, int(requested * 2 * free / self.capacity)) if self.capacity else 0
+        self.dropped += requested - n
+        if n <= 0:
+            return 0
+
+        start = self.count
+        end = start + n
+        rng = self.rng
+        angle = rng.uniform(0.0, 2 * math.pi, n)
+        speed = rng.uniform(0.3, 1.0, n) * (effect.speed / FPS)
+        life = rng.uniform(0.6, 1.0, n) * (effect.lifetime * FPS)
+        self.pos[0, start:end] = x
+        self.pos[1, start:end] = y
+        self.vel[0, start:end] = np.cos(angle) * speed
+        self.vel[1, start:end] = np.sin(angle) * speed
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        indices = [COLORS.index(color) for color in effect.colors]
+        self.color[start:end] = rng.choice(indices, n)
+        self.count = end
+        return n
+
+    def step(self) -> None:
+        """Move every particle one frame and drop expired ones."""
+        n = self.count
+        if not n:
+            return
+        pos = self.pos[:, :n]
+        vel = self.vel[:, :n]
+        pos += vel
+        vel[1] += GRAVITY / (FPS * FPS)
+        vel *= DRAG
+        life = self.life[:n]
+        life -= 1
+
+        alive = ((life > 0) & (pos[0] > -PARTICLE_SIZE) & (pos[0] < SCREEN_WIDTH)
+                 & (pos[1] > -PARTICLE_SIZE) & (pos[1] < SCREEN_HEIGHT))
+        kept = int(np.count_nonzero(alive))
+        if kept < n:
+            for array in (self.pos, self.vel):
+                array[:, :kept] = array[:, :n][:, alive]
+            for array in (self.life, self.max_life, self.color):
+                array[:kept] = array[:n][alive]
+            self.count = kept
+
+    def state(self) -> ParticleState:
+        """
+        Copy what is needed to draw the particles.
+
+        Returns:
+            ParticleState: Lists safe to hand to another thread.
+        """
+        n = self.count
+        if not n:
+            return [], [], []
+        xs, ys = self.pos[:, :n].astype(np.int64).tolist()
+        # Brightest level first, fading as life runs out
+        level = np.ceil(self.life[:n] / self.max_life[:n] * FADE_LEVELS).astype(np.int64)
+        cells = self.color[:n] * FADE_LEVELS + (FADE_LEVELS - np.clip(level, 1, FADE_LEVELS))
+        return xs, ys, cells.tolist()
+
+    def _build_palette(self) -> pygame.Surface:
+        """Create the strip of colour cells, brightest first for each colour."""
+        palette = pygame.Surface((len(self.areas) * PARTICLE_SIZE, PARTICLE_SIZE))
+        for index, (red, green, blue) in enumerate(COLORS):
+            for step in range(FADE_LEVELS):
+                scale = (FADE_LEVELS - step) / FADE_LEVELS
+                color = (int(red * scale), int(green * scale), int(blue * scale))
+                palette.fill(color, self.areas[index * FADE_LEVELS + step])
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            palette = palette.convert()
+        return palette
+
+    def draw_state(self, surface: pygame.Surface, particles: ParticleState) -> List[pygame.Rect]:
+        """
+        Draw particles with one blits() call.
+
+        Particles are short-lived and drawn where the latest step left
+        them, without interpolation.
+
+        Args:
+            surface: Surface to draw on.
+            particles: Positions and cells from state().
+
+        Returns:
+            List[pygame.Rect]: Areas drawn.
+        """
+        xs, ys, cells = particles
+        if not xs:
+            return []
+        if self.palette is None:
+            self.palette = self._build_palette()
+        palette = self.palette
+        areas = self.areas
+        return surface.blits([(palette, (x, y), areas[cell])
+                              for x, y, cell in zip(xs, ys, cells)])
+
+    def draw(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Draw the live particles.
+
+        Args:
+            surface: Surface to draw on.
+
+        Returns:
+            List[pygame.Rect]: Regions changed since the last draw.
+        """
+        rects = self.draw_state(surface, self.state())
+        dirty = rects + self.drawn_rects
+        self.drawn_rects = rects
+        return dirty
@@ -7,11 +7,15 @@ Defines the player character sprite.
 from . import BaseSprite
 from config import *
 from utils.error_handler import handle_sprite_error
+from utils.game_clock import get_ticks
 
 
 class Player(BaseSprite):
     """Player sprite class with movement and shooting capabilities."""
 
+    __slots__ = ("speed_x", "move_left", "move_right", "triple_shot", "triple_shot_timer",
+                 "triple_shot_duration")
+
     @handle_sprite_error
     def __init__(self):
         """Initialize the player sprite."""
@@ -20,6 +24,8 @@ class Player(BaseSprite):
         self.rect.centerx = SCREEN_WIDTH // 2
         self.rect.bottom = SCREEN_HEIGHT - 10
         self.speed_x = 0
+        self.move_left = False
+        self.move_right = False
         self.triple_shot = False
         self.triple_shot_timer = 0
         self.triple_shot_duration = TRIPLE_SHOT_DURATION
@@ -28,13 +34,12 @@ class Player(BaseSprite):
     def update(self):
         """Update player position and state."""
         self.speed_x = 0
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            self.speed_x = -5
-        if keys[pygame.K_RIGHT]:
-            self.speed_x = 5
+        if self.move_left:
+            self.speed_x = -PLAYER_SPEED / FPS
+        if self.move_right:
+            self.speed_x = PLAYER_SPEED / FPS
 
-        self.rect.x += self.speed_x
+        self.move_by(self.speed_x, 0)
 
         if self.rect.right > SCREEN_WIDTH:
             self.rect.right = SCREEN_WIDTH
@@ -42,12 +47,24 @@ class Player(BaseSprite):
             self.rect.left = 0
 
         if self.triple_shot:
-            current_time = pygame.time.get_ticks()
+            current_time = get_ticks()
             if current_time - self.triple_shot_timer > self.triple_shot_duration:
                 self.triple_shot = False
 
+    @handle_sprite_error
+    def set_input(self, left: bool, right: bool):
+        """
+        Set the movement input for the next update.
+
+        Args:
+            left: Whether the left key is held
+            right: Whether the right key is held
+        """
+        self.move_left = left
+        self.move_right = right
+
     @handle_sprite_error
     def activate_triple_shot(self):
         """Activate triple shot power-up."""
         self.triple_shot = True
-        self.triple_shot_timer = pygame.time.get_ticks()
+        self.triple_shot_timer = get_ticks()
@@ -0,0 +1,88 @@
+"""
+Sprite Pool Module
+----------------
+Provides reusable sprite instances so spawning and killing do not
+allocate new sprites and surfaces in steady state.
+"""
+
+from typing import Dict, List, Optional, Type
+from . import BaseSprite
+from .kinematics import KinematicStore
+from .registry import EntityView
+
+
+class SpritePool:
+    """Free list of reusable sprites of a single class."""
+
+    def __init__(self, sprite_class: Type[BaseSprite], store: Optional[KinematicStore] = None):
+        """
+        Initialize an empty pool.
+
+        Args:
+            sprite_class: Sprite class to pool. It must provide a reset()
+                method taking the same arguments as its constructor.
+            store: Kinematic store that moves acquired sprites, or None if
+                they move through their own update().
+        """
+        self.sprite_class = sprite_class
+        self.store = store
+        self.free: List[BaseSprite] = []
+        self.in_use = 0
+        self.hits = 0
+        self.misses = 0
+        self.high_water = 0
+
+    def acquire(self, view: EntityView, *args) -> BaseSprite:
+        """
+        Get a sprite from the pool and register it.
+
+        Args:
+            view: Registry view the sprite is listed in.
+            *args: Arguments passed to reset() or the constructor.
+
+        Returns:
+            BaseSprite: A live sprite that returns to the pool on kill().
+        """
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            sprite.refresh_image()
+            self.hits += 1
+        else:
+            sprite = self.sprite_class(*args)
+            self.misses += 1
+
+        sprite.pool = self
+        view.add(sprite)
+        if self.store is not None:
+            self.store.add(sprite)
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return sprite
+
+    def release(self, sprite: BaseSprite) -> None:
+        """
+        Return a killed sprite to the pool.
+
+        Args:
+            sprite: Sprite that has been removed from the registry.
+        """
+        self.in_use -= 1
+        self.free.append(sprite)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get pool counters.
+
+        Returns:
+            Dict[str, int]: Hits, misses, live and free counts and the
+            high-water mark of live sprites.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "high_water": self.high_water,
+        }
@@ -5,6 +5,7 @@ Defines the power-up sprite.
 """
 
 import random
+from typing import Optional
 from . import BaseSprite
 from config import *
 from utils.error_handler import handle_sprite_error
@@ -13,18 +14,36 @@ from utils.error_handler import handle_sprite_error
 class PowerUp(BaseSprite):
     """Power-up sprite that grants triple shot capability."""
 
+    __slots__ = ("speed_y",)
+
     @handle_sprite_error
-    def __init__(self):
-        """Initialize the power-up sprite."""
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Initialize the power-up sprite.
+
+        Args:
+            rng: Random generator placing it, by default the random module.
+        """
         super().__init__()
         self.create_surface((30, 30), BLUE)
-        self.rect.x = random.randint(0, SCREEN_WIDTH - self.rect.width)
-        self.rect.y = random.randint(-100, -40)
-        self.speed_y = 2
+        self.reset(rng)
+
+    @handle_sprite_error
+    def reset(self, rng: Optional[random.Random] = None):
+        """
+        Place the power-up at a random position above the screen.
+
+        Args:
+            rng: Random generator to use, by default the random module.
+        """
+        rng = rng or random
+        self.rect.x = rng.randint(0, SCREEN_WIDTH - self.rect.width)
+        self.rect.y = rng.randint(-100, -40)
+        self.speed_y = POWERUP_SPEED / FPS
 
     @handle_sprite_error
     def update(self):
         """Update power-up position."""
-        self.rect.y += self.speed_y
+        self.move_by(0, self.speed_y)
         if self.rect.top > SCREEN_HEIGHT:
             self.kill()
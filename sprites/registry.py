@@ -0,0 +1,214 @@
+"""
+Entity Registry Module
+--------------------
+Provides the single membership structure for every live sprite, with
+per-type views for update and collision code. Adding and removing are
+O(1); removal is deferred until the end of the frame so iteration never
+sees the structure change underneath it.
+"""
+
+import pygame
+from typing import Dict, Iterator, List, Optional
+from . import image_cache
+from .atlas import SpriteAtlas
+
+
+class EntityView:
+    """Live entities of one type, in spawn order."""
+
+    __slots__ = ("registry", "members")
+
+    def __init__(self, registry: "EntityRegistry"):
+        """
+        Initialize an empty view.
+
+        Args:
+            registry: Registry the view belongs to.
+        """
+        self.registry = registry
+        self.members: Dict = {}
+
+    def add(self, entity) -> None:
+        """
+        Register an entity under this view.
+
+        Args:
+            entity: Entity to add.
+        """
+        self.registry.add(entity, self)
+
+    def sprites(self) -> List:
+        """
+        Get the live entities.
+
+        Returns:
+            List: Entities not removed, in spawn order.
+        """
+        if self.registry.graveyard:
+            return [entity for entity in self.members if entity.registry is not None]
+        return list(self.members)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.sprites())
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+
+class EntityRegistry:
+    """All live entities, each in at most one type view."""
+
+    def __init__(self, atlas: Optional[SpriteAtlas] = None):
+        """
+        Initialize an empty registry.
+
+        Args:
+            atlas: Atlas entities are drawn from, a new one if not given.
+        """
+        # Entities in spawn order; the values are unused
+        self.members: Dict = {}
+        self.views: Dict[str, EntityView] = {}
+        # Entities removed this frame, dropped from the views by flush()
+        self.graveyard: List = []
+        # Last drawn areas of entities no longer registered
+        self.lost_rects: List[pygame.Rect] = []
+        self.atlas = atlas or SpriteAtlas()
+
+    def view(self, name: str) -> EntityView:
+        """
+        Get a type view, creating it on first use.
+
+        Args:
+            name: View name, e.g. "enemies".
+
+        Returns:
+            EntityView: The view.
+        """
+        view = self.views.get(name)
+        if view is None:
+            view = self.views[name] = EntityView(self)
+        return view
+
+    def add(self, entity, view: Optional[EntityView] = None) -> None:
+        """
+        Register an entity.
+
+        Args:
+            entity: Entity to add.
+            view: Type view to list it in, if any.
+        """
+        entity.registry = self
+        entity.view = view
+        self.members[entity] = None
+        if view is not None:
+            view.members[entity] = None
+
+    def remove(self, entity) -> None:
+        """
+        Unregister an entity at the end of the frame.
+
+        It stops counting as alive at once and is skipped by the views.
+
+        Args:
+            entity: Registered entity.
+        """
+        entity.registry = None
+        self.graveyard.append(entity)
+
+    def flush(self) -> None:
+        """Drop removed entities and return pooled ones to their pool."""
+        graveyard = self.graveyard
+        if not graveyard:
+            return
+        self.graveyard = []
+        members = self.members
+        for entity in graveyard:
+            del members[entity]
+            if entity.view is not None:
+                del entity.view.members[entity]
+                entity.view = None
+            if entity.drawn_rect is not None:
+                self.lost_rects.append(entity.drawn_rect)
+                entity.drawn_rect = None
+            if entity.pool is not None:
+                pool = entity.pool
+                entity.pool = None
+                pool.release(entity)
+
+    def empty(self) -> None:
+        """Remove every entity at once."""
+        for entity in list(self.members):
+            entity.kill()
+        self.flush()
+
+    def sprites(self) -> List:
+        """
+        Get every live entity.
+
+        Returns:
+            List: Entities not removed, in spawn order.
+        """
+        if self.graveyard:
+            return [entity for entity in self.members if entity.registry is not None]
+        return list(self.members)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.sprites())
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def draw(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Draw every entity from the atlas with one blits() call, in the
+        order the entities were added.
+
+        Args:
+            surface: Surface to draw on.
+
+        Returns:
+            List[pygame.Rect]: Regions changed since the last draw.
+        """
+        self.flush()
+        if self.atlas.generation != image_cache.generation:
+            # Cached images were replaced, e.g. by a new display mode
+            for entity in self.members:
+                entity.refresh_image()
+        entities = list(self.members)
+        new_rects = surface.blits(self.atlas.blit_list(entities))
+
+        dirty = self.lost_rects
+        self.lost_rects = []
+        for entity, new_rect in zip(entities, new_rects):
+            old_rect = entity.drawn_rect
+            if old_rect:
+                if new_rect.colliderect(old_rect):
+                    dirty.append(new_rect.union(old_rect))
+                else:
+                    dirty.append(new_rect)
+                    dirty.append(old_rect)
+            else:
+                dirty.append(new_rect)
+            entity.drawn_rect = new_rect
+        return dirty
+
+    def clear(self, surface: pygame.Surface, bgd: pygame.Surface) -> None:
+        """
+        Erase the last drawn area of every entity.
+
+        Args:
+            surface: Surface drawn on.
+            bgd: Background surface the size of surface.
+        """
+        surface.blits([(bgd, rect, rect) for rect in self.drawn_rects()], doreturn=False)
+
+    def drawn_rects(self) -> List[pygame.Rect]:
+        """
+        Get the areas the next clear() will erase.
+
+        Returns:
+            List[pygame.Rect]: Last drawn area of every entity and of
+            entities removed since.
+        """
+        return self.lost_rects + [entity.drawn_rect for entity in self.members
+                                  if entity.drawn_rect]
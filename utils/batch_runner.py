@@ -0,0 +1,238 @@
+"""
+Batch Runner Module
+-----------------
+Plays many headless games in parallel for balance tuning. Each game is a
+job with its own seed, bot and setting overrides; results are written to
+a JSON-lines file as they arrive and summarised per set of overrides.
+
+Usage:
+    python -m utils.batch_runner --runs 100 --sweep BOSS_HEALTH=10,15,20
+    python -m utils.batch_runner --jobs jobs.jsonl --output results.jsonl
+
+A jobs file holds one JSON object per line, all keys optional:
+    {"seed": 1, "bot": "tracker", "overrides": {"ENEMY_SPAWN_RATE": 0.001},
+     "max_frames": 36000, "time_limit": 60}
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+import multiprocessing
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils.bots import BOTS
+
+# Inherited by the workers, which all import pygame
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+DEFAULT_MAX_FRAMES: int = 60 * 60 * 10
+RESULTS_FILE = "batch_results.jsonl"
+# Completed games between progress lines on stderr
+PROGRESS_INTERVAL: int = 100
+
+
+def run_job(job: Dict) -> Dict:
+    """
+    Play one game in a worker process.
+
+    Args:
+        job: Job description with id, seed, bot, overrides, max_frames and
+            time_limit.
+
+    Returns:
+        Dict: The job fields plus the game's results, or an error message.
+    """
+    from main import Game
+    from utils.bots import make_bot
+
+    result = dict(job)
+    start = time.perf_counter()
+    try:
+        game = Game(headless=True, player_name="batch")
+        game.apply_overrides(job["overrides"])
+        frames = game.simulate(job["max_frames"], make_bot(job["bot"], job["seed"]),
+                               seed=job["seed"], time_limit=job["time_limit"])
+        result.update(score=game.score, frames=frames,
+                      bosses_killed=game.bosses_defeated,
+                      enemies_defeated=game.enemies_defeated,
+                      game_over=game.game_over)
+    except Exception as e:
+        result["error"] = str(e)
+    result["elapsed"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def parse_value(text: str) -> float:
+    """Parse a setting value as int when possible, else float."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def parse_sweeps(sweeps: List[str]) -> List[Dict[str, float]]:
+    """
+    Expand NAME=v1,v2 arguments into every combination of overrides.
+
+    Args:
+        sweeps: Arguments of the form "BOSS_HEALTH=10,15,20".
+
+    Returns:
+        List[Dict[str, float]]: One overrides dict per combination.
+    """
+    names: List[str] = []
+    values: List[List[float]] = []
+    for sweep in sweeps:
+        name, _, text = sweep.partition("=")
+        names.append(name)
+        values.append([parse_value(value) for value in text.split(",")])
+    return [dict(zip(names, combo)) for combo in itertools.product(*values)]
+
+
+def generate_jobs(args: argparse.Namespace) -> Iterator[Dict]:
+    """
+    Yield the jobs to run, from a jobs file or a sweep.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Yields:
+        Dict: Complete job descriptions.
+    """
+    defaults = {"bot": args.bot, "overrides": {}, "max_frames": args.max_frames,
+                "time_limit": args.time_limit}
+    if args.jobs:
+        with open(args.jobs) as f:
+            for index, line in enumerate(f):
+                if line.strip():
+                    job = dict(defaults, id=index, seed=args.seed + index)
+                    job.update(json.loads(line))
+                    yield job
+        return
+
+    index = 0
+    for overrides in parse_sweeps(args.sweep or []):
+        # Same seeds for every combination, so settings are compared on equal games
+        for run in range(args.runs):
+            yield dict(defaults, id=index, seed=args.seed + run, overrides=overrides)
+            index += 1
+
+
+class Summary:
+    """Running totals of results, grouped by bot and overrides."""
+
+    def __init__(self):
+        """Initialize empty totals."""
+        self.groups: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self.completed = 0
+        self.errors = 0
+
+    def add(self, result: Dict) -> None:
+        """
+        Count one finished game.
+
+        Args:
+            result: Result returned by run_job.
+        """
+        self.completed += 1
+        if "error" in result:
+            self.errors += 1
+            return
+        key = (result["bot"], json.dumps(result["overrides"], sort_keys=True))
+        totals = self.groups.setdefault(
+            key, {"games": 0, "score": 0, "frames": 0, "bosses_killed": 0,
+                  "max_score": 0, "game_over": 0})
+        totals["games"] += 1
+        totals["score"] += result["score"]
+        totals["frames"] += result["frames"]
+        totals["bosses_killed"] += result["bosses_killed"]
+        totals["game_over"] += result["game_over"]
+        totals["max_score"] = max(totals["max_score"], result["score"])
+
+    def rows(self) -> List[Dict]:
+        """
+        Get per-group averages.
+
+        Returns:
+            List[Dict]: One row per bot and overrides combination.
+        """
+        rows = []
+        for (bot, overrides), totals in sorted(self.groups.items()):
+            games = totals["games"]
+            rows.append({
+                "bot": bot,
+                "overrides": json.loads(overrides),
+                "games": games,
+                "mean_score": totals["score"] / games,
+                "max_score": totals["max_score"],
+                "mean_frames": totals["frames"] / games,
+                "mean_bosses_killed": totals["bosses_killed"] / games,
+                "game_over_rate": totals["game_over"] / games,
+            })
+        return rows
+
+
+def run_batch(jobs: Iterator[Dict], output: str, workers: Optional[int] = None) -> Summary:
+    """
+    Run jobs across a process pool, writing each result as it arrives.
+
+    Args:
+        jobs: Job descriptions.
+        output: JSON-lines results file.
+        workers: Worker processes, defaults to one per core.
+
+    Returns:
+        Summary: Totals over all results.
+    """
+    summary = Summary()
+    # Spawned workers start clean instead of inheriting pygame and logging state
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(workers or os.cpu_count()) as pool, open(output, 'w') as f:
+        for result in pool.imap_unordered(run_job, jobs):
+            f.write(json.dumps(result) + "\n")
+            summary.add(result)
+            if summary.completed % PROGRESS_INTERVAL == 0:
+                f.flush()
+                print(f"{summary.completed} games done", file=sys.stderr)
+    return summary
+
+
+def main() -> int:
+    """Run a batch from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", help="JSON-lines file of jobs")
+    parser.add_argument("--sweep", action="append",
+                        help="NAME=v1,v2,... setting values to try (repeatable)")
+    parser.add_argument("--runs", type=int, default=10, help="games per combination")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--bot", choices=sorted(BOTS), default="tracker", help="default bot")
+    parser.add_argument("--max-frames", type=int, default=DEFAULT_MAX_FRAMES,
+                        help="frame limit per game")
+    parser.add_argument("--time-limit", type=float, help="wall-clock seconds per game")
+    parser.add_argument("--workers", type=int, help="worker processes (default all cores)")
+    parser.add_argument("--output", default=RESULTS_FILE, help="JSON-lines results file")
+    parser.add_argument("--summary", help="write the per-combination summary as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    summary = run_batch(generate_jobs(args), args.output, args.workers)
+    rows = summary.rows()
+
+    for row in rows:
+        print(f"{row['bot']:8} {json.dumps(row['overrides']):40} games {row['games']:5}  "
+              f"score {row['mean_score']:8.1f}  frames {row['mean_frames']:9.1f}  "
+              f"bosses {row['mean_bosses_killed']:5.2f}", file=sys.stderr)
+    print(f"{summary.completed} games ({summary.errors} failed) in "
+          f"{time.perf_counter() - start:.1f} s", file=sys.stderr)
+
+    if args.summary:
+        with open(args.summary, 'w') as f:
+            json.dump(rows, f, indent=2)
+    return 1 if summary.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
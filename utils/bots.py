@@ -0,0 +1,72 @@
+"""
+Bots Module
+---------
+Scripted players for headless games. A bot is called once per frame with
+the game and returns the (left, right, shoot) input for that frame.
+"""
+
+import random
+from typing import Callable, Dict, Tuple
+
+Controller = Callable[["Game"], Tuple[bool, bool, bool]]
+
+# Frames between shots of the tracker bot
+TRACKER_SHOT_INTERVAL: int = 8
+# Horizontal distance within which the tracker stops moving
+TRACKER_DEADZONE: int = 5
+
+
+def idle_bot(seed: int) -> Controller:
+    """Bot that never moves or shoots."""
+    def control(game) -> Tuple[bool, bool, bool]:
+        return False, False, False
+    return control
+
+
+def tracker_bot(seed: int) -> Controller:
+    """Bot that follows the first enemy and fires at a fixed rate."""
+    def control(game) -> Tuple[bool, bool, bool]:
+        player = game.player
+        target = next(iter(game.enemies), None)
+        left = right = False
+        if target is not None:
+            left = target.rect.centerx < player.rect.centerx - TRACKER_DEADZONE
+            right = target.rect.centerx > player.rect.centerx + TRACKER_DEADZONE
+        return left, right, game.sim_clock.frame % TRACKER_SHOT_INTERVAL == 0
+    return control
+
+
+def random_bot(seed: int) -> Controller:
+    """Bot pressing random keys, independent of the game's random state."""
+    rng = random.Random(seed)
+
+    def control(game) -> Tuple[bool, bool, bool]:
+        move = rng.random()
+        return move < 0.3, move > 0.7, rng.random() < 0.2
+    return control
+
+
+BOTS: Dict[str, Callable[[int], Controller]] = {
+    "idle": idle_bot,
+    "tracker": tracker_bot,
+    "random": random_bot,
+}
+
+
+def make_bot(name: str, seed: int = 0) -> Controller:
+    """
+    Create a bot by name.
+
+    Args:
+        name: One of BOTS.
+        seed: Seed for bots with their own randomness.
+
+    Returns:
+        Controller: Per-frame input function for Game.simulate.
+
+    Raises:
+        ValueError: If there is no bot with that name.
+    """
+    if name not in BOTS:
+        raise ValueError(f"Unknown bot {name}")
+    return BOTS[name](seed)
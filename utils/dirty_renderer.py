@@ -0,0 +1,112 @@
+"""
+Dirty Renderer Module
+-------------------
+Provides dirty-rectangle presentation: only changed screen regions are
+cleared and pushed to the display, with a fallback to a full flip when
+too much of the screen changed.
+"""
+
+import pygame
+from typing import List, Optional, Sequence, Tuple
+from sprites.registry import EntityRegistry
+
+FULL_REDRAW_RATIO: float = 0.5
+
+
+class DirtyRenderer:
+    """Tracks changed screen regions and presents them with display.update."""
+
+    def __init__(self, screen: pygame.Surface, background_color: Tuple[int, int, int],
+                 full_redraw_ratio: float = FULL_REDRAW_RATIO):
+        """
+        Initialize the renderer.
+
+        Args:
+            screen: Display surface to draw on.
+            background_color: Colour used to clear the screen.
+            full_redraw_ratio: Fraction of the screen area above which a
+                frame is presented with a full flip instead.
+        """
+        self.screen = screen
+        self.background = pygame.Surface(screen.get_size()).convert()
+        self.background.fill(background_color)
+        self.full_redraw_area = full_redraw_ratio * screen.get_width() * screen.get_height()
+        self.overlay_rects: List[pygame.Rect] = []
+        self.needs_full_redraw = True
+        self.full_flips = 0
+        self.partial_updates = 0
+
+    def invalidate(self) -> None:
+        """Force the next frame to redraw and flip the whole screen."""
+        self.needs_full_redraw = True
+
+    def overlay_touched(self, rects: Sequence[pygame.Rect]) -> bool:
+        """
+        Check whether erasing some regions would cut into the HUD text.
+
+        Args:
+            rects: Regions about to be cleared.
+
+        Returns:
+            bool: True if any of them overlaps the last HUD text drawn.
+        """
+        return any(rect.collidelist(self.overlay_rects) != -1 for rect in rects)
+
+    def begin_frame(self, group: Optional[EntityRegistry] = None,
+                    rects: Sequence[pygame.Rect] = (), keep_overlay: bool = False) -> bool:
+        """
+        Clear what was drawn last frame.
+
+        Args:
+            group: Entity registry drawn every frame.
+            rects: Other regions drawn last frame, e.g. from a snapshot.
+            keep_overlay: Leave last frame's HUD text on screen, for a
+                frame that will not redraw it.
+
+        Returns:
+            bool: True if this frame is a full redraw.
+        """
+        if self.needs_full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            return True
+
+        if not keep_overlay:
+            for rect in self.overlay_rects:
+                self.screen.blit(self.background, rect, rect)
+        for rect in rects:
+            self.screen.blit(self.background, rect, rect)
+        if group is not None:
+            group.clear(self.screen, self.background)
+        return False
+
+    def end_frame(self, sprite_rects: Sequence[pygame.Rect],
+                  overlay_rects: Optional[Sequence[pygame.Rect]]) -> None:
+        """
+        Push the changed regions to the display.
+
+        Args:
+            sprite_rects: Rects returned by RenderUpdates.draw.
+            overlay_rects: Rects of HUD text drawn this frame, cleared
+                at the start of the next frame, or None if last frame's
+                HUD text was kept.
+        """
+        dirty = list(sprite_rects)
+        if overlay_rects is not None:
+            dirty.extend(self.overlay_rects)
+            dirty.extend(overlay_rects)
+            self.overlay_rects = list(overlay_rects)
+
+        if not self.needs_full_redraw:
+            area = 0
+            for rect in dirty:
+                area += rect.width * rect.height
+            if area > self.full_redraw_area:
+                self.needs_full_redraw = True
+
+        if self.needs_full_redraw:
+            pygame.display.flip()
+            self.needs_full_redraw = False
+            self.full_flips += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_updates += 1
@@ -0,0 +1,407 @@
+"""
+Environment Module
+----------------
+Gym-style wrappers for training agents: GameEnv plays one headless game,
+VectorGameEnv steps many games per call with batched NumPy observations,
+actions and rewards. Requires NumPy, which the game itself does not.
+
+Actions are the input bits used by replays: LEFT | RIGHT | SHOOT, 0-7.
+
+Usage:
+    env = VectorGameEnv(64, seed=0)
+    obs, info = env.reset()
+    obs, rewards, terminated, truncated, info = env.step(actions)
+"""
+
+import ctypes
+import multiprocessing
+import pygame
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Only needed for training
+    np = None
+
+from config import SCREEN_HEIGHT, SCREEN_WIDTH
+from utils.replay import LEFT, RIGHT, SHOOT
+
+ACTION_COUNT: int = 8
+# Nearest enemies and boss bullets included in an observation
+OBS_ENEMIES: int = 5
+OBS_BOSS_BULLETS: int = 5
+# player x, triple shot, boss (present, x, y, health), nearest power-up
+# (present, dx, y), then (present, dx, y) per enemy and boss bullet
+OBS_SIZE: int = 2 + 4 + 3 + 3 * (OBS_ENEMIES + OBS_BOSS_BULLETS)
+
+DEFAULT_MAX_FRAMES: int = 60 * 60 * 10
+DEATH_PENALTY: float = 100.0
+
+
+def _require_numpy() -> None:
+    """Raise a clear error when NumPy is missing."""
+    if np is None:
+        raise ImportError("The training environments need NumPy: pip install numpy")
+
+
+def _write_nearest(out, offset: int, rects: List[pygame.Rect], count: int, player_x: int) -> int:
+    """
+    Write (present, dx, y) for the sprites nearest the player.
+
+    Args:
+        out: Observation row.
+        offset: Index of the first slot.
+        rects: Rects of the objects to read; may be reordered.
+        count: Number of slots.
+        player_x: Player centre x.
+
+    Returns:
+        int: Index after the written slots.
+    """
+    if len(rects) > count:
+        # Closest to the player's level first, it is what can hit them
+        rects.sort(key=lambda rect: (SCREEN_HEIGHT - rect.bottom) + abs(rect.centerx - player_x))
+    for rect in rects[:count]:
+        out[offset] = 1.0
+        out[offset + 1] = (rect.centerx - player_x) / SCREEN_WIDTH
+        out[offset + 2] = rect.centery / SCREEN_HEIGHT
+        offset += 3
+    end = offset + 3 * (count - min(len(rects), count))
+    out[offset:end] = 0.0
+    return end
+
+
+def observe(game, out) -> None:
+    """
+    Write a game's observation into a float array.
+
+    Args:
+        game: Game to observe.
+        out: Array of OBS_SIZE floats to fill.
+    """
+    player = game.player
+    player_x = player.rect.centerx
+    out[0] = player_x / SCREEN_WIDTH
+    out[1] = 1.0 if player.triple_shot else 0.0
+
+    boss = next(iter(game.bosses), None)
+    if boss is not None:
+        out[2] = 1.0
+        out[3] = boss.rect.centerx / SCREEN_WIDTH
+        out[4] = boss.rect.centery / SCREEN_HEIGHT
+        out[5] = boss.health / game.boss_health
+    else:
+        out[2:6] = 0.0
+
+    offset = _write_nearest(out, 6, [sprite.rect for sprite in game.powerups], 1, player_x)
+    offset = _write_nearest(out, offset, [sprite.rect for sprite in game.enemies],
+                            OBS_ENEMIES, player_x)
+    _write_nearest(out, offset, game.boss_bullets.rects(), OBS_BOSS_BULLETS, player_x)
+
+
+class GameEnv:
+    """One headless game behind a reset/step interface."""
+
+    def __init__(self, frame_skip: int = 1, max_frames: int = DEFAULT_MAX_FRAMES,
+                 death_penalty: float = DEATH_PENALTY,
+                 overrides: Optional[Dict[str, float]] = None):
+        """
+        Initialize the environment.
+
+        Args:
+            frame_skip: Frames each action is held for.
+            max_frames: Frames after which an episode is truncated.
+            death_penalty: Subtracted from the reward when the game is lost.
+            overrides: Balance settings, see Game.apply_overrides.
+        """
+        _require_numpy()
+        from main import Game
+
+        self.game = Game(headless=True, player_name="agent")
+        self.game.apply_overrides(overrides or {})
+        self.frame_skip = frame_skip
+        self.max_frames = max_frames
+        self.death_penalty = death_penalty
+        self.frames = 0
+        self.obs = np.zeros(OBS_SIZE, dtype=np.float32)
+
+    def info(self) -> Dict[str, int]:
+        """Get episode statistics."""
+        game = self.game
+        return {"score": game.score, "frames": self.frames,
+                "enemies_defeated": game.enemies_defeated,
+                "bosses_killed": game.bosses_defeated}
+
+    def reset(self, seed: Optional[int] = None):
+        """
+        Start a new episode.
+
+        Args:
+            seed: Seed making the episode reproducible.
+
+        Returns:
+            Tuple: (observation, info).
+        """
+        self.game.reset_game(seed)
+        self.frames = 0
+        observe(self.game, self.obs)
+        return self.obs.copy(), self.info()
+
+    def advance(self, action: int) -> Tuple[float, bool, bool]:
+        """
+        Play one action without building the observation.
+
+        Args:
+            action: Input bits, 0-7.
+
+        Returns:
+            Tuple[float, bool, bool]: (reward, terminated, truncated).
+        """
+        game = self.game
+        left, right, shoot = bool(action & LEFT), bool(action & RIGHT), bool(action & SHOOT)
+        start_score = game.score
+        for _ in range(self.frame_skip):
+            game.advance(left, right, shoot)
+            self.frames += 1
+            if not game.game_active:
+                break
+            # Fire once per action, holding the key does not repeat in game either
+            shoot = False
+
+        reward = float(game.score - start_score)
+        terminated = game.game_over
+        if terminated:
+            reward -= self.death_penalty
+        return reward, terminated, not terminated and self.frames >= self.max_frames
+
+    def step(self, action: int):
+        """
+        Play one action.
+
+        Args:
+            action: Input bits, 0-7.
+
+        Returns:
+            Tuple: (observation, reward, terminated, truncated, info).
+        """
+        reward, terminated, truncated = self.advance(action)
+        observe(self.game, self.obs)
+        return self.obs.copy(), reward, terminated, truncated, self.info()
+
+
+# Per-game arrays shared by a vector environment and its workers:
+# name -> (ctypes element type, shape after the leading num_envs axis)
+_BUFFERS: Dict[str, Tuple] = {
+    "actions": (ctypes.c_int64, ()),
+    "obs": (ctypes.c_float, (OBS_SIZE,)),
+    "rewards": (ctypes.c_float, ()),
+    "terminated": (ctypes.c_bool, ()),
+    "truncated": (ctypes.c_bool, ()),
+    "scores": (ctypes.c_int64, ()),
+    # Observation and score of games that just finished; score -1 otherwise
+    "final_obs": (ctypes.c_float, (OBS_SIZE,)),
+    "final_score": (ctypes.c_int64, ()),
+}
+
+
+def _views(raw: Dict, num_envs: int) -> Dict:
+    """Wrap shared ctypes arrays as NumPy arrays of their full shapes."""
+    views = {}
+    for name, (ctype, shape) in _BUFFERS.items():
+        views[name] = np.frombuffer(raw[name], dtype=np.dtype(ctype)).reshape((num_envs,) + shape)
+    return views
+
+
+class _EnvSlice:
+    """A run of games stepped one after another, writing into shared arrays."""
+
+    def __init__(self, arrays: Dict, start: int, end: int, kwargs: Dict):
+        """
+        Create the games.
+
+        Args:
+            arrays: Full NumPy arrays from _views().
+            start: First game index owned.
+            end: Index after the last game owned.
+            kwargs: Passed to each GameEnv.
+        """
+        self.envs = [GameEnv(**kwargs) for _ in range(start, end)]
+        self.start = start
+        self.arrays = {name: array[start:end] for name, array in arrays.items()}
+
+    def reset(self, seed: Optional[int]) -> None:
+        """Start a new episode in every game, game i seeded with seed + i."""
+        arrays = self.arrays
+        for i, env in enumerate(self.envs):
+            env.game.reset_game(None if seed is None else seed + self.start + i)
+            env.frames = 0
+            observe(env.game, arrays["obs"][i])
+            arrays["scores"][i] = 0
+
+    def step(self) -> None:
+        """Play the actions in the shared array, resetting finished games."""
+        arrays = self.arrays
+        obs = arrays["obs"]
+        final_obs = arrays["final_obs"]
+        final_score = arrays["final_score"]
+        final_score[:] = -1
+        for i, (env, action) in enumerate(zip(self.envs, arrays["actions"].tolist())):
+            reward, terminated, truncated = env.advance(action)
+            game = env.game
+            arrays["rewards"][i] = reward
+            arrays["terminated"][i] = terminated
+            arrays["truncated"][i] = truncated
+            arrays["scores"][i] = game.score
+            if terminated or truncated:
+                observe(game, final_obs[i])
+                final_score[i] = game.score
+                game.reset_game()
+                env.frames = 0
+            observe(game, obs[i])
+
+
+def _worker(conn, raw: Dict, num_envs: int, start: int, end: int, kwargs: Dict) -> None:
+    """
+    Worker process: own games start to end-1 and run commands from conn.
+
+    Commands are ("reset", seed), ("step", None) and ("close", None); each
+    is answered with None once the shared arrays are written, or with the
+    error message if it failed.
+    """
+    envs = _EnvSlice(_views(raw, num_envs), start, end, kwargs)
+    while True:
+        command, arg = conn.recv()
+        if command == "close":
+            break
+        try:
+            if command == "reset":
+                envs.reset(arg)
+            else:
+                envs.step()
+            conn.send(None)
+        except Exception as e:
+            conn.send(f"{type(e).__name__}: {e}")
+    conn.close()
+
+
+class VectorGameEnv:
+    """
+    Many headless games stepped together, resetting finished ones.
+
+    Observations, actions and rewards live in shared arrays. With
+    num_workers > 0 the games are split between that many worker
+    processes, which step their games in parallel and write straight
+    into the arrays, so throughput grows with the CPU cores available.
+    With num_workers=0 every game runs in this process.
+
+    Every game has its own random generator, so game i is reproducible
+    from seed + i and the same actions.
+    """
+
+    def __init__(self, num_envs: int, seed: Optional[int] = None, num_workers: int = 0,
+                 **kwargs):
+        """
+        Initialize the environments.
+
+        Args:
+            num_envs: Number of games.
+            seed: Seed for the first reset.
+            num_workers: Worker processes, at most num_envs; 0 to step
+                every game in this process.
+            **kwargs: Passed to each GameEnv.
+        """
+        _require_numpy()
+        self.num_envs = num_envs
+        self.seed = seed
+        raw = {name: multiprocessing.RawArray(ctype, num_envs * int(np.prod(shape, dtype=np.int64)))
+               for name, (ctype, shape) in _BUFFERS.items()}
+        self.arrays = _views(raw, num_envs)
+        self.obs = self.arrays["obs"]
+        self.local: Optional[_EnvSlice] = None
+        self.workers: List = []
+        self.conns: List = []
+
+        num_workers = min(num_workers, num_envs)
+        if num_workers <= 0:
+            self.local = _EnvSlice(self.arrays, 0, num_envs, kwargs)
+            return
+        context = multiprocessing.get_context("spawn")
+        bounds = [num_envs * i // num_workers for i in range(num_workers + 1)]
+        for start, end in zip(bounds, bounds[1:]):
+            parent, child = context.Pipe()
+            worker = context.Process(target=_worker, name=f"GameEnv-{start}",
+                                     args=(child, raw, num_envs, start, end, kwargs),
+                                     daemon=True)
+            worker.start()
+            child.close()
+            self.workers.append(worker)
+            self.conns.append(parent)
+
+    def _run(self, command: str, arg=None) -> None:
+        """Run a command on every game, in the workers if there are any."""
+        if self.local is not None:
+            if command == "reset":
+                self.local.reset(arg)
+            else:
+                self.local.step()
+            return
+        for conn in self.conns:
+            conn.send((command, arg))
+        errors = [error for error in (conn.recv() for conn in self.conns) if error]
+        if errors:
+            raise RuntimeError(f"Environment worker failed: {errors[0]}")
+
+    def reset(self, seed: Optional[int] = None):
+        """
+        Start a new episode in every game.
+
+        Args:
+            seed: Base seed, game i uses seed + i. Defaults to the
+                constructor's seed.
+
+        Returns:
+            Tuple: (observations, info) with observations of shape
+            (num_envs, OBS_SIZE).
+        """
+        self._run("reset", self.seed if seed is None else seed)
+        return self.obs.copy(), {"score": self.arrays["scores"].copy()}
+
+    def step(self, actions):
+        """
+        Play one action in every game.
+
+        Finished games are reset right away; their last observation and
+        final score are in info["final_observation"] and info["final_score"].
+
+        Args:
+            actions: Integer array of shape (num_envs,), input bits 0-7.
+
+        Returns:
+            Tuple: (observations, rewards, terminated, truncated, info).
+        """
+        arrays = self.arrays
+        arrays["actions"][:] = actions
+        self._run("step")
+
+        info = {"score": arrays["scores"].copy()}
+        final_score = arrays["final_score"]
+        if (final_score >= 0).any():
+            final_obs = arrays["final_obs"].copy()
+            final_obs[final_score < 0] = 0.0
+            info["final_observation"] = final_obs
+            info["final_score"] = final_score.copy()
+        return (self.obs.copy(), arrays["rewards"].copy(), arrays["terminated"].copy(),
+                arrays["truncated"].copy(), info)
+
+    def close(self) -> None:
+        """Stop the worker processes, if any."""
+        for conn in self.conns:
+            try:
+                conn.send(("close", None))
+                conn.close()
+            except OSError:
+                pass
+        for worker in self.workers:
+            worker.join()
+        self.conns = []
+        self.workers = []
@@ -2,12 +2,20 @@
 Error Handler Module
 ------------------
 Provides custom exceptions and error handling utilities.
+
+Per-call decorators are only applied in debug builds
+(AIRFORCE_DEBUG_GUARDS=1). Otherwise errors are caught once per sprite
+group by update_group and by the try blocks in the game methods.
 """
 
+import os
 import logging
-from typing import Callable, Any
+from typing import Callable, Any, Iterable, List
 from functools import wraps
 
+# Wrap every decorated call in its own error guard
+DEBUG_GUARDS: bool = os.environ.get("AIRFORCE_DEBUG_GUARDS", "") == "1"
+
 class GameError(Exception):
     """Base exception class for game-specific errors."""
     pass
@@ -20,8 +28,12 @@ def handle_sprite_error(func: Callable) -> Callable:
         func: The function to wrap with error handling.
         
     Returns:
-        Callable: The wrapped function with error handling.
+        Callable: The wrapped function with error handling, or func
+        itself unless DEBUG_GUARDS is set.
     """
+    if not DEBUG_GUARDS:
+        return func
+
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
         try:
@@ -39,8 +51,12 @@ def handle_pygame_error(func: Callable) -> Callable:
         func: The function to wrap with error handling.
         
     Returns:
-        Callable: The wrapped function with error handling.
+        Callable: The wrapped function with error handling, or func
+        itself unless DEBUG_GUARDS is set.
     """
+    if not DEBUG_GUARDS:
+        return func
+
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
         try:
@@ -48,4 +64,31 @@ def handle_pygame_error(func: Callable) -> Callable:
         except Exception as e:
             logging.error(f"Pygame error in {func.__name__}: {e}")
             return None
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+def update_group(sprites: Iterable, quarantine: bool = True) -> List:
+    """
+    Update a batch of sprites under a single error guard.
+
+    A sprite whose update raises is logged and, if quarantine is set,
+    killed; the rest of the batch still updates.
+
+    Args:
+        sprites: Sprites or sprite group to update.
+        quarantine: Kill sprites that fail.
+
+    Returns:
+        List: The sprites that failed.
+    """
+    failed = []
+    remaining = iter(list(sprites))
+    while True:
+        try:
+            for sprite in remaining:
+                sprite.update()
+            return failed
+        except Exception as e:
+            logging.error(f"Sprite error in update: {e} ({sprite!r})")
+            failed.append(sprite)
+            if quarantine:
+                sprite.kill()
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""
+Fixed Timestep Module
+-------------------
+Decouples simulation from rendering: an accumulator turns variable frame
+times into a whole number of fixed simulation steps, and sprites are
+drawn interpolated between their last two simulated positions.
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Steps run per rendered frame at most; time beyond that is dropped
+MAX_CATCH_UP_STEPS: int = 5
+# Sprites that moved further in one step (respawned or teleported) are
+# drawn where they are instead of sliding across the screen
+MAX_INTERPOLATION_DISTANCE: int = 64
+
+
+class FixedTimestep:
+    """Accumulates real time and releases it in fixed simulation steps."""
+
+    def __init__(self, rate: int, max_steps: int = MAX_CATCH_UP_STEPS):
+        """
+        Initialize the accumulator.
+
+        Args:
+            rate: Simulation steps per second.
+            max_steps: Most steps released for one frame, so a slow frame
+                cannot snowball into ever longer catch-up.
+        """
+        self.step_seconds = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_steps = 0
+
+    def advance(self, elapsed: float) -> int:
+        """
+        Add a frame's real time and take the steps it covers.
+
+        Args:
+            elapsed: Seconds since the previous frame.
+
+        Returns:
+            int: Number of simulation steps to run now.
+        """
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.step_seconds)
+        if steps > self.max_steps:
+            # Too far behind: run the limit and let the rest go
+            self.dropped_steps += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator %= self.step_seconds
+        else:
+            self.accumulator -= steps * self.step_seconds
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step elapsed since the last one, for interpolation."""
+        return min(self.accumulator / self.step_seconds, 1.0)
+
+
+def blend_position(start: Tuple[int, int], end: Tuple[int, int],
+                   alpha: float) -> Optional[Tuple[int, int]]:
+    """
+    Get a position part way between two simulated positions.
+
+    Args:
+        start: Position before the step.
+        end: Position after the step.
+        alpha: 0 for start, 1 for end.
+
+    Returns:
+        Optional[Tuple[int, int]]: The blended position, or None if the
+        sprite did not move or jumped too far to slide.
+    """
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    if not (dx or dy) or abs(dx) + abs(dy) > MAX_INTERPOLATION_DISTANCE:
+        return None
+    return round(start[0] + dx * alpha), round(start[1] + dy * alpha)
+
+
+class Interpolator:
+    """Moves sprite rects between their previous and current positions for drawing."""
+
+    def __init__(self):
+        """Initialize with no captured positions."""
+        self.previous: Dict = {}
+
+    def capture(self, sprites) -> None:
+        """
+        Remember sprite positions before a simulation step.
+
+        Args:
+            sprites: Sprites that will be drawn.
+        """
+        self.previous = {sprite: sprite.rect.topleft for sprite in sprites}
+
+    @contextmanager
+    def blend(self, sprites, alpha: float) -> Iterator[None]:
+        """
+        Place sprites part way between their captured and current
+        positions, restoring the simulated positions afterwards.
+
+        Args:
+            sprites: Sprites about to be drawn.
+            alpha: 0 for the captured positions, 1 for the current ones.
+        """
+        moved: List[Tuple] = []
+        if alpha < 1.0:
+            previous = self.previous
+            for sprite in sprites:
+                start = previous.get(sprite)
+                if start is None:
+                    continue
+                rect = sprite.rect
+                position = blend_position(start, rect.topleft, alpha)
+                if position is not None:
+                    moved.append((rect, rect.x, rect.y))
+                    rect.topleft = position
+        try:
+            yield
+        finally:
+            for rect, x, y in moved:
+                rect.topleft = (x, y)
@@ -0,0 +1,71 @@
+"""
+Font Cache Module
+---------------
+Resolves system font names to font files once and remembers the paths
+between runs, so startup does not rescan the system font list.
+"""
+
+import os
+import json
+import logging
+import pygame
+from typing import Dict, Optional
+
+FONT_CACHE_FILE = "font_cache.json"
+
+
+def _load_cache() -> Dict[str, Optional[str]]:
+    """Read the name -> path cache, or an empty one."""
+    try:
+        if os.path.exists(FONT_CACHE_FILE):
+            with open(FONT_CACHE_FILE, 'r') as f:
+                return json.load(f)
+    except Exception as e:
+        logging.error(f"Error loading font cache: {e}")
+    return {}
+
+
+def _save_cache(cache: Dict[str, Optional[str]]) -> None:
+    """Write the name -> path cache."""
+    try:
+        with open(FONT_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except Exception as e:
+        logging.error(f"Error saving font cache: {e}")
+
+
+def resolve_font(name: str) -> Optional[str]:
+    """
+    Find the file for a system font, using the cache when possible.
+
+    Args:
+        name: System font name, e.g. "Arial".
+
+    Returns:
+        Optional[str]: Path to the font file, or None if the system has no
+        such font (pygame's default font is used then).
+    """
+    cache = _load_cache()
+    if name in cache:
+        path = cache[name]
+        if path is None or os.path.exists(path):
+            return path
+
+    path = pygame.font.match_font(name)
+    cache[name] = path
+    _save_cache(cache)
+    return path
+
+
+def load_font(name: str, size: int) -> pygame.font.Font:
+    """
+    Load a system font by name without scanning the font list on later runs.
+
+    Args:
+        name: System font name.
+        size: Point size.
+
+    Returns:
+        pygame.font.Font: The loaded font.
+    """
+    return pygame.font.Font(resolve_font(name), size)
@@ -0,0 +1,154 @@
+"""
+Frame Governor Module
+-------------------
+Watches frame times against the frame budget and, while frames keep
+running over it, switches on cheaper ways of running the game one
+degradation at a time, switching them off again in reverse order once
+there is headroom.
+"""
+
+import logging
+from typing import Dict, Optional, Sequence, Tuple
+
+# Supported degradations; by default applied in this order, lifted in reverse
+DEGRADATIONS: Tuple[str, ...] = (
+    "hud_text",      # redraw HUD text only every few frames
+    "particles",     # fewer particles per effect
+    "bullet_cap",    # limit live player and boss bullets
+    "frame_skip",    # draw every other frame
+)
+# Weight of the newest frame in the smoothed frame time
+SMOOTHING: float = 0.1
+# Frames the smoothed time must stay over budget before degrading
+DEGRADE_AFTER: int = 30
+# Frames it must stay under the headroom before restoring
+RESTORE_AFTER: int = 120
+# Fraction of the budget frames must fit in to count as headroom
+HEADROOM: float = 0.7
+# Frames between HUD redraws while hud_text is applied
+HUD_REFRESH_FRAMES: int = 10
+
+
+class FrameGovernor:
+    """Degradation level chosen from recent frame times."""
+
+    def __init__(self, budget_ms: Optional[float], degradations: Sequence[str] = DEGRADATIONS,
+                 degrade_after: int = DEGRADE_AFTER, restore_after: int = RESTORE_AFTER,
+                 headroom: float = HEADROOM):
+        """
+        Initialize the governor at level 0, nothing degraded.
+
+        Args:
+            budget_ms: Frame time to stay within, or None to never degrade.
+            degradations: Names of the degradations, in the order applied.
+            degrade_after: Consecutive over-budget frames before the next
+                degradation is applied.
+            restore_after: Consecutive frames within the headroom before
+                the last degradation is lifted.
+            headroom: Fraction of the budget a frame must fit in to count
+                towards restoring.
+
+        Raises:
+            ValueError: If a degradation name is not one of DEGRADATIONS.
+        """
+        self.budget_ms = budget_ms
+        unknown = set(degradations) - set(DEGRADATIONS)
+        if unknown:
+            raise ValueError(f"Unknown degradations: {', '.join(sorted(unknown))}")
+        self.degradations = tuple(degradations)
+        self.degrade_after = degrade_after
+        self.restore_after = restore_after
+        self.headroom = headroom
+        self.level = 0
+        self.smoothed_ms = 0.0
+        self.over = 0
+        self.under = 0
+        self.frame = 0
+        self.changes = 0
+
+    def active(self, name: str) -> bool:
+        """
+        Check whether a degradation is applied.
+
+        Args:
+            name: Degradation name.
+
+        Returns:
+            bool: True if the current level includes it.
+        """
+        return name in self.degradations[:self.level]
+
+    def observe(self, frame_ms: float) -> bool:
+        """
+        Account for one frame.
+
+        Args:
+            frame_ms: Time the frame's work took, excluding any wait for
+                the frame rate cap.
+
+        Returns:
+            bool: True if the level changed.
+        """
+        self.frame += 1
+        if self.budget_ms is None:
+            return False
+        self.smoothed_ms += (frame_ms - self.smoothed_ms) * SMOOTHING
+        if self.smoothed_ms > self.budget_ms:
+            self.over += 1
+            self.under = 0
+        elif self.smoothed_ms < self.budget_ms * self.headroom:
+            self.under += 1
+            self.over = 0
+        else:
+            self.over = self.under = 0
+
+        if self.over >= self.degrade_after and self.level < len(self.degradations):
+            self._set_level(self.level + 1)
+            return True
+        if self.under >= self.restore_after and self.level > 0:
+            self._set_level(self.level - 1)
+            return True
+        return False
+
+    def _set_level(self, level: int) -> None:
+        """Change level and start counting frames afresh."""
+        name = self.degradations[max(level, self.level) - 1]
+        logging.info(f"Frame governor level {self.level} -> {level} "
+                     f"({'applying' if level > self.level else 'lifting'} {name}, "
+                     f"smoothed frame {self.smoothed_ms:.1f} ms)")
+        self.level = level
+        self.over = self.under = 0
+        self.changes += 1
+
+    def refresh_hud(self) -> bool:
+        """
+        Check whether the HUD should be redrawn this frame.
+
+        Returns:
+            bool: False on most frames while hud_text is applied.
+        """
+        return not self.active("hud_text") or self.frame % HUD_REFRESH_FRAMES == 0
+
+    def skip_frame(self) -> bool:
+        """
+        Check whether drawing should be skipped this frame.
+
+        Returns:
+            bool: True on every other frame while frame_skip is applied.
+        """
+        return self.active("frame_skip") and self.frame % 2 == 1
+
+    def stats(self) -> Dict:
+        """
+        Get the governor state for telemetry.
+
+        Returns:
+            Dict: Level, applied degradations, smoothed frame time and
+            number of level changes.
+        """
+        return {
+            "level": self.level,
+            "degradations": list(self.degradations[:self.level]),
+            "smoothed_ms": round(self.smoothed_ms, 2),
+            "changes": self.changes,
+        }
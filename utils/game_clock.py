@@ -0,0 +1,67 @@
+"""
+Game Clock Module
+---------------
+Provides the time source used by game logic: pygame's wall clock for
+normal play, or a fixed-step simulated clock for headless runs.
+"""
+
+import pygame
+from typing import Optional
+
+
+class SimulatedClock:
+    """Clock that advances a fixed number of milliseconds per frame."""
+
+    def __init__(self, fps: int):
+        """
+        Initialize the simulated clock.
+
+        Args:
+            fps: Simulated frames per second.
+        """
+        self.frame_ms = 1000.0 / fps
+        self.frame = 0
+
+    def reset(self) -> None:
+        """Restart the clock at zero."""
+        self.frame = 0
+
+    def tick(self) -> None:
+        """Advance the clock by one frame."""
+        self.frame += 1
+
+    def get_ticks(self) -> int:
+        """
+        Get the simulated time.
+
+        Returns:
+            int: Milliseconds elapsed since the clock was created.
+        """
+        return int(self.frame * self.frame_ms)
+
+
+_active_clock: Optional[SimulatedClock] = None
+
+
+def install_clock(clock: Optional[SimulatedClock]) -> None:
+    """
+    Set the clock used by get_ticks.
+
+    Args:
+        clock: Simulated clock to use, or None for pygame's wall clock.
+    """
+    global _active_clock
+    _active_clock = clock
+
+
+def get_ticks() -> int:
+    """
+    Get the current game time.
+
+    Returns:
+        int: Milliseconds from the active simulated clock, or from
+        pygame.time.get_ticks when no simulated clock is installed.
+    """
+    if _active_clock is not None:
+        return _active_clock.get_ticks()
+    return pygame.time.get_ticks()
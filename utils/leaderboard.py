@@ -0,0 +1,147 @@
+"""
+Leaderboard Module
+----------------
+Provides an indexed SQLite leaderboard with point lookups, top-N and
+rank queries, safe for several game processes writing at once.
+"""
+
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+from utils.score_manager import load_scores
+
+LEADERBOARD_FILE = "game_scores.db"
+
+# Seconds a writer waits for another process's lock before failing
+BUSY_TIMEOUT: float = 5.0
+
+
+class Leaderboard:
+    """Player high scores stored in SQLite with an index on score."""
+
+    def __init__(self, path: str = LEADERBOARD_FILE):
+        """
+        Open (and if needed create and migrate) the leaderboard.
+
+        A new database is seeded from the existing text score file.
+
+        Args:
+            path: SQLite database file.
+        """
+        self.path = path
+        # Shared with the score writer thread; access is serialised by self.lock
+        self.conn = sqlite3.connect(
+            path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            # WAL lets readers in other processes run alongside a writer
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                "name TEXT PRIMARY KEY, score INTEGER NOT NULL)")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, name)")
+            empty = self.conn.execute("SELECT 1 FROM scores LIMIT 1").fetchone() is None
+        if empty:
+            self.migrate_text_scores()
+
+    def migrate_text_scores(self) -> None:
+        """Import scores from the text score file and its journal."""
+        scores = load_scores()
+        if scores:
+            self.update_many(scores)
+            logging.info(f"Migrated {len(scores)} scores into {self.path}")
+
+    def get(self, name: str) -> Optional[int]:
+        """
+        Get a player's high score.
+
+        Args:
+            name: Player name.
+
+        Returns:
+            Optional[int]: The high score, or None for an unknown player.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT score FROM scores WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def update(self, name: str, score: int) -> None:
+        """
+        Record a score, keeping the higher of it and the stored one.
+
+        Args:
+            name: Player name.
+            score: Score to record.
+        """
+        self.update_many({name: score})
+
+    def update_many(self, scores: Dict[str, int]) -> None:
+        """
+        Record several scores in one transaction.
+
+        The upsert keeps the maximum, so concurrent writers never lower a
+        high score written by another process.
+
+        Args:
+            scores: Dictionary of player names and scores.
+        """
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO scores (name, score) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET score = MAX(score, excluded.score)",
+                scores.items())
+
+    def top_n(self, n: int) -> List[Tuple[str, int]]:
+        """
+        Get the highest scores.
+
+        Args:
+            n: Number of entries to return.
+
+        Returns:
+            List[Tuple[str, int]]: (name, score) pairs, best first.
+        """
+        with self.lock:
+            return self.conn.execute(
+                "SELECT name, score FROM scores ORDER BY score DESC, name LIMIT ?",
+                (n,)).fetchall()
+
+    def rank(self, name: str) -> Optional[int]:
+        """
+        Get a player's position on the leaderboard.
+
+        Args:
+            name: Player name.
+
+        Returns:
+            Optional[int]: 1-based rank (ties share a rank), or None for an
+            unknown player.
+        """
+        score = self.get(name)
+        if score is None:
+            return None
+        return self.rank_for_score(score)
+
+    def rank_for_score(self, score: int) -> int:
+        """
+        Get the rank a score would have.
+
+        Args:
+            score: Score to place.
+
+        Returns:
+            int: 1 plus the number of players with a higher score.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT COUNT(*) FROM scores WHERE score > ?", (score,)).fetchone()
+        return row[0] + 1
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
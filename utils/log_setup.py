@@ -0,0 +1,176 @@
+"""
+Log Setup Module
+--------------
+Configures non-blocking logging: records are rate limited on the calling
+thread, queued, and written by a background listener to a rotating file
+as text or JSON lines.
+
+Only the main process writes the log file. Worker processes, e.g. those
+of the batch runner, log to stderr so that several processes never
+rotate the same file.
+"""
+
+import json
+import time
+import sys
+import atexit
+import logging
+import threading
+import multiprocessing
+from queue import SimpleQueue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, List, Optional
+
+LOG_FILE = "game_log.txt"
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Identical messages within this many seconds are counted, not written
+RATE_LIMIT_INTERVAL: float = 5.0
+# Distinct messages tracked before expired ones are forgotten
+MAX_TRACKED_MESSAGES: int = 1000
+
+MAX_LOG_BYTES: int = 1_000_000
+LOG_BACKUPS: int = 3
+
+_listener: Optional[QueueListener] = None
+_rate_limiter: Optional["RateLimitFilter"] = None
+
+
+class RateLimitFilter(logging.Filter):
+    """Drops repeats of a message inside an interval and reports their count."""
+
+    def __init__(self, interval: float = RATE_LIMIT_INTERVAL):
+        """
+        Initialize the filter.
+
+        Args:
+            interval: Seconds during which repeats of a message are suppressed.
+        """
+        super().__init__()
+        self.interval = interval
+        # (level, message) -> [time last written, repeats suppressed since]
+        self.seen: Dict[tuple, List] = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Let a record through unless it repeats one written recently."""
+        message = record.getMessage()
+        key = (record.levelno, message)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.seen.get(key)
+            if entry is not None and now - entry[0] < self.interval:
+                entry[1] += 1
+                return False
+            repeats = entry[1] if entry is not None else 0
+            self.seen[key] = [now, 0]
+            if len(self.seen) > MAX_TRACKED_MESSAGES:
+                self._forget_expired(now)
+
+        record.repeats = repeats
+        if repeats:
+            record.msg = f"{message} (repeated {repeats} more times)"
+            record.args = None
+        return True
+
+    def _forget_expired(self, now: float) -> None:
+        """Drop tracked messages whose interval passed with no repeats."""
+        for key in [key for key, (last, repeats) in self.seen.items()
+                    if not repeats and now - last >= self.interval]:
+            del self.seen[key]
+
+    def flush(self) -> None:
+        """Log a summary for every message with suppressed repeats."""
+        with self.lock:
+            pending = [(key, repeats) for key, (_, repeats) in self.seen.items() if repeats]
+            self.seen.clear()
+        for (level, message), repeats in pending:
+            logging.log(level, f"{message} (repeated {repeats} more times)")
+
+
+def in_worker_process() -> bool:
+    """
+    Check whether this is a child process started by multiprocessing.
+
+    Returns:
+        bool: True in worker processes, including while a spawned worker
+        is still importing its main module.
+    """
+    return (multiprocessing.parent_process() is not None
+            or multiprocessing.current_process().name != "MainProcess")
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialise a record to JSON."""
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        repeats = getattr(record, "repeats", 0)
+        if repeats:
+            entry["repeats"] = repeats
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+def configure_logging(filename: Optional[str] = LOG_FILE, level: int = logging.INFO,
+                      json_lines: bool = False, max_bytes: int = MAX_LOG_BYTES,
+                      backup_count: int = LOG_BACKUPS,
+                      rate_limit_interval: float = RATE_LIMIT_INTERVAL) -> None:
+    """
+    Route all logging through a queue to a background writer.
+
+    Only the first call has an effect.
+
+    Args:
+        filename: Log file, rotated by size, or None to log to stderr.
+            Worker processes always log to stderr.
+        level: Root logger level.
+        json_lines: Write JSON lines instead of the text format.
+        max_bytes: Size at which the log file is rotated.
+        backup_count: Rotated files kept.
+        rate_limit_interval: Seconds during which repeated messages are
+            suppressed and counted.
+    """
+    global _listener, _rate_limiter
+    if _listener is not None:
+        return
+
+    if filename is None or in_worker_process():
+        handler = logging.StreamHandler(sys.stderr)
+    else:
+        handler = RotatingFileHandler(
+            filename, maxBytes=max_bytes, backupCount=backup_count, delay=True)
+    handler.setFormatter(JsonFormatter() if json_lines else logging.Formatter(LOG_FORMAT))
+
+    log_queue = SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    _rate_limiter = RateLimitFilter(rate_limit_interval)
+    queue_handler.addFilter(_rate_limiter)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, handler)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Write suppressed-repeat summaries and stop the background writer."""
+    global _listener
+    if _listener is None:
+        return
+    _rate_limiter.flush()
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
@@ -0,0 +1,212 @@
+"""
+Profiler Module
+-------------
+Provides a per-phase frame profiler that keeps the last frames in a ring
+buffer, draws an on-screen overlay and exports to CSV or JSON.
+"""
+
+import csv
+import json
+import time
+import logging
+import threading
+import pygame
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+FRAME_HISTORY: int = 300
+# Frames between automatic dumps of over-budget frames
+DUMP_COOLDOWN: int = 300
+
+GRAPH_WIDTH: int = 150
+GRAPH_HEIGHT: int = 50
+
+
+def _write_json(path: str, frames: List[Dict]) -> None:
+    """Write frame records to a JSON file, logging any failure."""
+    try:
+        with open(path, 'w') as f:
+            json.dump(frames, f)
+    except Exception as e:
+        logging.error(f"Error writing profile: {e}")
+
+
+class PhaseTimer:
+    """Context manager adding its elapsed time to one profiler phase."""
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        """
+        Initialize the timer.
+
+        Args:
+            profiler: Profiler receiving the measurements.
+            name: Phase name.
+        """
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "PhaseTimer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        elapsed = (time.perf_counter() - self.start) * 1000
+        phases = self.profiler.phases
+        phases[self.name] = phases.get(self.name, 0.0) + elapsed
+        return False
+
+
+class FrameProfiler:
+    """Per-phase frame timings with a ring buffer of recent frames."""
+
+    def __init__(self, capacity: int = FRAME_HISTORY, budget_ms: Optional[float] = None,
+                 dump_prefix: str = "frame_profile"):
+        """
+        Initialize the profiler.
+
+        Args:
+            capacity: Number of frames kept.
+            budget_ms: Frame time above which the buffer is dumped to JSON
+                automatically, or None to disable.
+            dump_prefix: File name prefix for automatic dumps.
+        """
+        self.frames: Deque[Dict] = deque(maxlen=capacity)
+        self.budget_ms = budget_ms
+        self.dump_prefix = dump_prefix
+        self.phases: Dict[str, float] = {}
+        self.timers: Dict[str, PhaseTimer] = {}
+        self.frame_index = 0
+        self.frame_start = 0.0
+        self.last_dump = -DUMP_COOLDOWN
+        self.overlay = False
+
+    def phase(self, name: str) -> PhaseTimer:
+        """
+        Get the timer for a phase, for use in a with statement.
+
+        Args:
+            name: Phase name, e.g. "update" or "update.enemies".
+
+        Returns:
+            PhaseTimer: Reusable timer for the phase.
+        """
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = PhaseTimer(self, name)
+            self.timers[name] = timer
+        return timer
+
+    def begin_frame(self) -> None:
+        """Start timing a frame."""
+        self.phases = {}
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self, counts: Dict[str, int]) -> None:
+        """
+        Finish the frame and store it in the ring buffer.
+
+        Args:
+            counts: Entity counts per sprite group.
+        """
+        total = (time.perf_counter() - self.frame_start) * 1000
+        self.frames.append({
+            "frame": self.frame_index,
+            "total_ms": total,
+            "phases": self.phases,
+            "counts": counts,
+        })
+
+        if (self.budget_ms is not None and total > self.budget_ms
+                and self.frame_index - self.last_dump >= DUMP_COOLDOWN):
+            self.last_dump = self.frame_index
+            path = f"{self.dump_prefix}_{self.frame_index}.json"
+            logging.warning(
+                f"Frame {self.frame_index} took {total:.1f} ms (budget {self.budget_ms:.1f} ms), "
+                f"profile written to {path}")
+            # This frame is already late; the file is written off this thread
+            self.dump_json(path, background=True)
+        self.frame_index += 1
+
+    def dump_json(self, path: str, background: bool = False) -> None:
+        """
+        Write the buffered frames as JSON.
+
+        Args:
+            path: Destination file.
+            background: Write from a new thread instead of blocking. The
+                frame records are never changed once buffered, so a
+                shallow copy of the ring is enough.
+        """
+        frames = list(self.frames)
+        if background:
+            threading.Thread(target=_write_json, args=(path, frames),
+                             name="ProfileDump", daemon=True).start()
+        else:
+            _write_json(path, frames)
+
+    def dump_csv(self, path: str) -> None:
+        """
+        Write the buffered frames as CSV, one column per phase and count.
+
+        Args:
+            path: Destination file.
+        """
+        try:
+            phase_names: List[str] = []
+            count_names: List[str] = []
+            for record in self.frames:
+                for name in record["phases"]:
+                    if name not in phase_names:
+                        phase_names.append(name)
+                for name in record["counts"]:
+                    if name not in count_names:
+                        count_names.append(name)
+
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame", "total_ms"] + phase_names + count_names)
+                for record in self.frames:
+                    writer.writerow(
+                        [record["frame"], f"{record['total_ms']:.4f}"]
+                        + [f"{record['phases'].get(name, 0.0):.4f}" for name in phase_names]
+                        + [record["counts"].get(name, 0) for name in count_names])
+        except Exception as e:
+            logging.error(f"Error writing profile: {e}")
+
+    def draw_overlay(self, surface: pygame.Surface, font: pygame.font.Font,
+                     pos: tuple) -> pygame.Rect:
+        """
+        Draw a frame-time graph and the latest entity counts.
+
+        Args:
+            surface: Surface to draw on.
+            font: Font for the counts.
+            pos: Top-left position of the overlay.
+
+        Returns:
+            pygame.Rect: Area covered by the overlay.
+        """
+        x, y = pos
+        area = pygame.Rect(x, y, GRAPH_WIDTH, GRAPH_HEIGHT)
+        surface.fill((0, 0, 0), area)
+
+        # One column per frame, scaled so the budget sits at mid-height
+        scale = GRAPH_HEIGHT / (2 * (self.budget_ms or 1000 / 60))
+        recent = list(self.frames)[-GRAPH_WIDTH:]
+        for i, record in enumerate(recent):
+            height = min(int(record["total_ms"] * scale), GRAPH_HEIGHT)
+            over = self.budget_ms is not None and record["total_ms"] > self.budget_ms
+            color = (255, 0, 0) if over else (0, 255, 0)
+            pygame.draw.line(surface, color, (x + i, y + GRAPH_HEIGHT - 1),
+                             (x + i, y + GRAPH_HEIGHT - height))
+        pygame.draw.line(surface, (255, 255, 0), (x, y + GRAPH_HEIGHT // 2),
+                         (x + GRAPH_WIDTH - 1, y + GRAPH_HEIGHT // 2))
+
+        if recent:
+            last = recent[-1]
+            text = f"{last['total_ms']:.1f} ms " + " ".join(
+                f"{name}:{count}" for name, count in last["counts"].items())
+            area = area.union(surface.blit(
+                font.render(text, True, (255, 255, 255)), (x, y + GRAPH_HEIGHT + 2)))
+        return area
@@ -0,0 +1,149 @@
+"""
+Replay Module
+-----------
+Records the random seed and per-frame player input of a game so it can
+be replayed deterministically, either in real time or unthrottled.
+
+Usage:
+    python main.py --record game.afr
+    AIRFORCE_HEADLESS=1 python -m utils.replay game.afr
+    python -m utils.replay game.afr --realtime
+"""
+
+import sys
+import zlib
+import struct
+import logging
+from typing import Optional, Tuple
+
+MAGIC = b"AFRP"
+VERSION = 1
+# magic, version, seed, frame count, final score
+HEADER = struct.Struct("<4sHQIq")
+
+# Input bits, one byte per frame
+LEFT = 1
+RIGHT = 2
+SHOOT = 4
+# Bullet counts were capped by the frame governor, which changes play
+CAPPED = 8
+
+
+class Recording:
+    """Seed plus one input byte per simulated frame."""
+
+    def __init__(self, seed: int, inputs: Optional[bytearray] = None, score: int = -1):
+        """
+        Initialize a recording.
+
+        Args:
+            seed: Seed of the game's random generator at the start of the game.
+            inputs: Recorded input bytes, empty for a new recording.
+            score: Final score of the recorded game, -1 if unknown.
+        """
+        self.seed = seed
+        self.inputs = inputs if inputs is not None else bytearray()
+        self.score = score
+
+    def __len__(self) -> int:
+        """Number of recorded frames."""
+        return len(self.inputs)
+
+    def record(self, left: bool, right: bool, shoot: bool, capped: bool = False) -> None:
+        """
+        Append one frame of input.
+
+        Args:
+            left: Whether the player moved left.
+            right: Whether the player moved right.
+            shoot: Whether the player fired.
+            capped: Whether bullet counts were capped this frame.
+        """
+        self.inputs.append((LEFT if left else 0) | (RIGHT if right else 0)
+                           | (SHOOT if shoot else 0) | (CAPPED if capped else 0))
+
+    def frame(self, index: int) -> Tuple[bool, bool, bool]:
+        """
+        Get the input of a frame.
+
+        Args:
+            index: Frame number.
+
+        Returns:
+            Tuple[bool, bool, bool]: (left, right, shoot).
+        """
+        bits = self.inputs[index]
+        return bool(bits & LEFT), bool(bits & RIGHT), bool(bits & SHOOT)
+
+    def capped(self, index: int) -> bool:
+        """
+        Check whether bullet counts were capped in a frame.
+
+        Args:
+            index: Frame number.
+
+        Returns:
+            bool: True if the frame governor capped bullets.
+        """
+        return bool(self.inputs[index] & CAPPED)
+
+    def save(self, path: str) -> None:
+        """
+        Write the recording to a file.
+
+        Args:
+            path: Destination file.
+        """
+        try:
+            with open(path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, self.seed, len(self.inputs), self.score))
+                f.write(zlib.compress(bytes(self.inputs), 9))
+        except Exception as e:
+            logging.error(f"Error saving replay: {e}")
+
+    @classmethod
+    def load(cls, path: str) -> "Recording":
+        """
+        Read a recording from a file.
+
+        Args:
+            path: File written by save().
+
+        Returns:
+            Recording: The loaded recording.
+
+        Raises:
+            ValueError: If the file is not a replay of a supported version.
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, seed, frames, score = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay")
+        inputs = bytearray(zlib.decompress(data[HEADER.size:]))
+        if len(inputs) != frames:
+            raise ValueError(f"{path} is truncated")
+        return cls(seed, inputs, score)
+
+
+def main() -> int:
+    """Replay a recording from the command line."""
+    if len(sys.argv) < 2:
+        print("usage: python -m utils.replay FILE [--realtime]")
+        return 2
+
+    from main import Game
+
+    recording = Recording.load(sys.argv[1])
+    realtime = "--realtime" in sys.argv
+    game = Game(headless=not realtime, player_name="replay")
+    frames = game.run_replay(recording, realtime)
+    print(f"Replayed {frames} frames, score {game.score}")
+    if recording.score >= 0 and game.score != recording.score:
+        print(f"Diverged: recorded score was {recording.score}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,46 +2,246 @@
 Score Manager Module
 ------------------
 Handles loading and saving of game scores using a simple text file.
+
+High-score updates during play go through ScoreWriter, which appends
+them to a journal on a background thread and periodically compacts the
+journal into the score file. Compaction merges in scores other processes
+wrote to the file or journal meanwhile, keeping the highest per name.
 """
 
 import os
+import glob
+import atexit
 import logging
+import threading
 from typing import Dict
 
 SAVE_FILE = "game_scores.txt"
+JOURNAL_FILE = "game_scores.journal"
+
+# Seconds the writer waits to coalesce updates before appending them
+FLUSH_INTERVAL: float = 1.0
+# Journal records written before the journal is compacted into SAVE_FILE
+COMPACT_EVERY: int = 200
+
+
+def _read_entries(path: str, scores: Dict[str, int]) -> None:
+    """
+    Read name:score lines from a file into a dict, later lines winning.
+
+    Args:
+        path: File to read.
+        scores: Dictionary updated in place.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                name, score = line.strip().split(':')
+                scores[name] = int(score)
+            except ValueError:
+                continue
+
+
+def _merge_highest(scores: Dict[str, int], other: Dict[str, int]) -> None:
+    """
+    Merge scores into a dict, keeping the higher score per name.
+
+    Args:
+        scores: Dictionary updated in place.
+        other: Scores to merge in.
+    """
+    for name, score in other.items():
+        if score > scores.get(name, score - 1):
+            scores[name] = score
+
 
 def load_scores() -> Dict[str, int]:
     """
-    Load scores from the text file.
-    
+    Load scores from the text file and any journal written since.
+
     Returns:
         Dict[str, int]: Dictionary of player names and their high scores.
     """
     scores = {}
     try:
-        if os.path.exists(SAVE_FILE):
-            with open(SAVE_FILE, 'r') as f:
-                lines = f.readlines()
-                for line in lines:
-                    try:
-                        name, score = line.strip().split(':')
-                        scores[name] = int(score)
-                    except ValueError:
-                        continue
+        _read_entries(SAVE_FILE, scores)
+        # Journals left by a compaction that was interrupted
+        for path in sorted(glob.glob(JOURNAL_FILE + ".*")):
+            _read_entries(path, scores)
+        _read_entries(JOURNAL_FILE, scores)
     except Exception as e:
         logging.error(f"Error loading scores: {e}")
     return scores
 
+
 def save_scores(scores: Dict[str, int]) -> None:
     """
     Save scores to the text file.
-    
+
+    The file is written to a temporary path and renamed into place, so a
+    crash never leaves a truncated score file.
+
     Args:
         scores: Dictionary of player names and their high scores.
     """
     try:
-        with open(SAVE_FILE, 'w') as f:
-            for name, score in scores.items():
-                f.write(f"{name}:{score}\n")
+        _write_snapshot(scores)
     except Exception as e:
-        logging.error(f"Error saving scores: {e}")
\ No newline at end of file
+        logging.error(f"Error saving scores: {e}")
+
+
+def _write_snapshot(scores: Dict[str, int]) -> None:
+    """
+    Write scores to a temporary file and rename it over SAVE_FILE.
+
+    Args:
+        scores: Dictionary of player names and their high scores.
+
+    Raises:
+        OSError: If the file could not be written or renamed.
+    """
+    tmp_file = f"{SAVE_FILE}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w') as f:
+        for name, score in scores.items():
+            f.write(f"{name}:{score}\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, SAVE_FILE)
+
+
+class ScoreWriter:
+    """Background writer that persists high scores without blocking the game loop."""
+
+    def __init__(self, scores: Dict[str, int], flush_interval: float = FLUSH_INTERVAL,
+                 compact_every: int = COMPACT_EVERY, leaderboard=None):
+        """
+        Initialize the writer and start its thread.
+
+        Args:
+            scores: Scores as loaded from disk; the writer keeps its own copy.
+            flush_interval: Seconds to coalesce updates before writing.
+            compact_every: Journal records before compacting to SAVE_FILE.
+            leaderboard: Optional utils.leaderboard.Leaderboard that also
+                receives every flushed update.
+        """
+        self.snapshot = dict(scores)
+        self.leaderboard = leaderboard
+        self.flush_interval = flush_interval
+        self.compact_every = compact_every
+        self.pending: Dict[str, int] = {}
+        self.journal_records = 0
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopping = threading.Event()
+        self.closed = False
+        self.thread = threading.Thread(
+            target=self._run, name="ScoreWriter", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def submit(self, name: str, score: int) -> None:
+        """
+        Queue a high score; repeated updates for a name are coalesced.
+
+        Args:
+            name: Player name.
+            score: New high score.
+        """
+        with self.lock:
+            self.pending[name] = score
+        self.wakeup.set()
+
+    def _run(self) -> None:
+        """Writer thread: flush coalesced updates at most once per interval."""
+        while not self.stopping.is_set():
+            self.wakeup.wait()
+            self.wakeup.clear()
+            # Debounce: let further updates coalesce before writing
+            self.stopping.wait(self.flush_interval)
+            self.flush()
+
+    def flush(self) -> None:
+        """Append pending updates to the journal, compacting when it grows."""
+        with self.lock:
+            updates = self.pending
+            self.pending = {}
+        if not updates:
+            return
+
+        try:
+            with open(JOURNAL_FILE, 'a') as f:
+                for name, score in updates.items():
+                    f.write(f"{name}:{score}\n")
+            self.snapshot.update(updates)
+            self.journal_records += len(updates)
+            if self.journal_records >= self.compact_every:
+                self.compact()
+        except Exception as e:
+            logging.error(f"Error writing score journal: {e}")
+
+        if self.leaderboard is not None:
+            try:
+                self.leaderboard.update_many(updates)
+            except Exception as e:
+                logging.error(f"Error updating leaderboard: {e}")
+
+    def compact(self) -> None:
+        """
+        Rewrite SAVE_FILE with the journal folded in and remove the journal.
+
+        The journal is first moved aside, so records other processes
+        append meanwhile start a new journal instead of being lost. The
+        file, the moved journal and the snapshot are merged keeping the
+        highest score per name, and the moved journal is only removed
+        once the new file is in place; if writing fails it is put back.
+        """
+        compacting = f"{JOURNAL_FILE}.{os.getpid()}"
+        try:
+            if os.path.exists(JOURNAL_FILE):
+                os.replace(JOURNAL_FILE, compacting)
+            merged: Dict[str, int] = {}
+            _read_entries(SAVE_FILE, merged)
+            journal: Dict[str, int] = {}
+            _read_entries(compacting, journal)
+            _merge_highest(merged, journal)
+            _merge_highest(merged, self.snapshot)
+            _write_snapshot(merged)
+        except Exception as e:
+            logging.error(f"Error compacting scores: {e}")
+            self._restore_journal(compacting)
+            return
+
+        self.snapshot = merged
+        self.journal_records = 0
+        try:
+            if os.path.exists(compacting):
+                os.remove(compacting)
+        except OSError as e:
+            logging.error(f"Error removing compacted journal: {e}")
+
+    def _restore_journal(self, compacting: str) -> None:
+        """Append a journal moved aside for compaction back onto the journal."""
+        if not os.path.exists(compacting):
+            return
+        try:
+            with open(compacting, 'r') as f:
+                records = f.read()
+            with open(JOURNAL_FILE, 'a') as f:
+                f.write(records)
+            os.remove(compacting)
+        except Exception as e:
+            # Left in place; load_scores() still reads it
+            logging.error(f"Error restoring score journal: {e}")
+
+    def close(self) -> None:
+        """Stop the thread and write everything still pending."""
+        if self.closed:
+            return
+        self.closed = True
+        self.stopping.set()
+        self.wakeup.set()
+        self.thread.join()
+        self.flush()
+        self.compact()
@@ -0,0 +1,250 @@
+"""
+Simulation Thread Module
+----------------------
+Runs game logic on a worker thread at a fixed rate, publishing a render
+snapshot after every step, while the main thread only handles events and
+draws the latest snapshot.
+
+Usage:
+    python main.py --threaded
+    AIRFORCE_HEADLESS=1 python -m utils.sim_thread --check --seeds 20
+"""
+
+import sys
+import time
+import logging
+import argparse
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from config import FPS
+from utils.fixed_timestep import FixedTimestep
+from utils.snapshot import SnapshotBuffer, state_digest, take_snapshot
+
+Controller = Callable[["Game"], Tuple[bool, bool, bool]]
+
+
+class InputState:
+    """Player input written by the event thread and read per step."""
+
+    def __init__(self):
+        """Initialize with nothing pressed."""
+        self.lock = threading.Lock()
+        self.left = False
+        self.right = False
+        self.shots = 0
+        self.restart = False
+        self.profile_dump = False
+
+    def set_keys(self, left: bool, right: bool) -> None:
+        """
+        Set the held movement keys.
+
+        Args:
+            left: Whether the left key is held.
+            right: Whether the right key is held.
+        """
+        with self.lock:
+            self.left = left
+            self.right = right
+
+    def press_shoot(self) -> None:
+        """Queue one shot, fired on the next step."""
+        with self.lock:
+            self.shots += 1
+
+    def request_restart(self) -> None:
+        """Ask for a new game once the current one is over."""
+        with self.lock:
+            self.restart = True
+
+    def request_profile_dump(self) -> None:
+        """Ask the simulation thread to write out the game's profiler."""
+        with self.lock:
+            self.profile_dump = True
+
+    def take_profile_dump(self) -> bool:
+        """
+        Consume a profile dump request.
+
+        Returns:
+            bool: True if a dump was requested.
+        """
+        with self.lock:
+            dump = self.profile_dump
+            self.profile_dump = False
+            return dump
+
+    def take(self) -> Tuple[bool, bool, bool]:
+        """
+        Get the input for one step, consuming one queued shot.
+
+        Returns:
+            Tuple[bool, bool, bool]: (left, right, shoot).
+        """
+        with self.lock:
+            shoot = self.shots > 0
+            if shoot:
+                self.shots -= 1
+            return self.left, self.right, shoot
+
+    def take_restart(self) -> bool:
+        """
+        Consume a restart request.
+
+        Returns:
+            bool: True if a restart was requested.
+        """
+        with self.lock:
+            restart = self.restart
+            self.restart = False
+            return restart
+
+
+class SimulationThread(threading.Thread):
+    """Steps a game on its own thread and publishes a snapshot per step."""
+
+    def __init__(self, game, buffer: SnapshotBuffer, inputs: Optional[InputState] = None,
+                 controller: Optional[Controller] = None, realtime: bool = True,
+                 max_frames: Optional[int] = None):
+        """
+        Initialize the thread.
+
+        Args:
+            game: Game owned by this thread while it runs.
+            buffer: Buffer receiving the snapshots.
+            inputs: Player input, used when there is no controller.
+            controller: Scripted input, called with the game every step.
+            realtime: Pace steps at FPS; otherwise run as fast as possible.
+            max_frames: Stop after this many steps of the current game.
+        """
+        super().__init__(name="simulation", daemon=True)
+        self.game = game
+        self.buffer = buffer
+        self.inputs = inputs or InputState()
+        self.controller = controller
+        self.realtime = realtime
+        self.max_frames = max_frames
+        self.frames = 0
+        self.stopped = threading.Event()
+
+    def stop(self) -> None:
+        """Ask the thread to finish and wait for it."""
+        self.stopped.set()
+        if self.is_alive():
+            self.join()
+
+    def step(self) -> None:
+        """Run one simulation step and publish its snapshot."""
+        game = self.game
+        inputs = self.controller(game) if self.controller else self.inputs.take()
+        game.profiler.begin_frame()
+        with game.profiler.phase("update"):
+            game.advance(*inputs)
+        game.profiler.end_frame(game.entity_counts())
+        self.frames += 1
+        self.buffer.publish(take_snapshot(game))
+
+    def run(self) -> None:
+        """Step the game until stopped, the frame limit or, unpaced, game over."""
+        game = self.game
+        timestep = FixedTimestep(FPS)
+        last = time.perf_counter()
+        try:
+            self.buffer.publish(take_snapshot(game))
+            while not self.stopped.is_set():
+                if self.max_frames is not None and self.frames >= self.max_frames:
+                    break
+                if not self.realtime:
+                    if not game.game_active:
+                        break
+                    self.step()
+                    continue
+
+                if self.inputs.take_profile_dump():
+                    game.dump_profile()
+                if self.inputs.take_restart() and not game.game_active:
+                    game.reset_game()
+                    self.frames = 0
+                    self.buffer.publish(take_snapshot(game))
+
+                now = time.perf_counter()
+                for _ in range(timestep.advance(now - last)):
+                    if not game.game_active:
+                        break
+                    self.step()
+                last = now
+                # Sleep until the next step is due, releasing the GIL to the renderer
+                time.sleep((1.0 - timestep.alpha) * timestep.step_seconds)
+        except Exception as e:
+            logging.critical(f"Simulation thread stopped: {e}")
+            self.stopped.set()
+
+
+def outcome(game) -> Dict:
+    """Final results and state digest of a game."""
+    return {
+        "frames": game.sim_clock.frame,
+        "score": game.score,
+        "enemies_defeated": game.enemies_defeated,
+        "bosses_defeated": game.bosses_defeated,
+        "digest": state_digest(take_snapshot(game)),
+    }
+
+
+def check_determinism(seed: int, max_frames: int, bot: str = "tracker") -> Tuple[Dict, Dict]:
+    """
+    Play the same seeded game serially and on a simulation thread.
+
+    Args:
+        seed: Game seed.
+        max_frames: Frame limit for both runs.
+        bot: Scripted player, see utils.bots.
+
+    Returns:
+        Tuple[Dict, Dict]: Serial and threaded outcomes, equal when the
+        threaded mode is deterministic.
+    """
+    from main import Game
+    from utils.bots import make_bot
+
+    serial = Game(headless=True, player_name="check")
+    serial.simulate(max_frames, make_bot(bot, seed), seed=seed)
+
+    threaded = Game(headless=True, player_name="check")
+    threaded.reset_game(seed)
+    worker = SimulationThread(threaded, SnapshotBuffer(), controller=make_bot(bot, seed),
+                              realtime=False, max_frames=max_frames)
+    worker.start()
+    # Read snapshots meanwhile, as the renderer would
+    buffer = worker.buffer
+    while worker.is_alive():
+        buffer.read()
+        time.sleep(0.001)
+    worker.join()
+    return outcome(serial), outcome(threaded)
+
+
+def main() -> int:
+    """Compare serial and threaded games from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="run the determinism check")
+    parser.add_argument("--seeds", type=int, default=10, help="seeds to compare")
+    parser.add_argument("--frames", type=int, default=20000, help="frame limit per game")
+    args = parser.parse_args()
+    if not args.check:
+        parser.print_help()
+        return 2
+
+    mismatches = 0
+    for seed in range(args.seeds):
+        serial, threaded = check_determinism(seed, args.frames)
+        if serial != threaded:
+            mismatches += 1
+            print(f"seed {seed}: serial {serial} != threaded {threaded}")
+    print(f"{args.seeds - mismatches}/{args.seeds} seeds identical")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Snapshot Module
+-------------
+Immutable copies of what the screen shows, so a simulation thread can
+hand frames to the render thread without sharing live sprites, and a
+double buffer holding the two most recent snapshots.
+"""
+
+import time
+import hashlib
+import threading
+from typing import List, NamedTuple, Optional, Tuple
+
+# (sprite id, image key, x, y); the id pairs a sprite across snapshots
+SpriteState = Tuple[int, tuple, int, int]
+
+
+class HudValues(NamedTuple):
+    """Numbers shown by the heads-up display."""
+    score: int
+    high_score: int
+    boss_health: Tuple[int, ...]
+
+
+class Snapshot(NamedTuple):
+    """Everything needed to draw one simulated frame."""
+    frame: int
+    time: float
+    sprites: Tuple[SpriteState, ...]
+    # Boss bullet positions, see BulletField.state
+    bullets: Tuple[List[int], List[int], List[int], List[int]]
+    # Particle positions and palette cells, see ParticleSystem.state
+    particles: Tuple[List[int], List[int], List[int]]
+    hud: HudValues
+    game_active: bool
+    game_over: bool
+
+
+def take_snapshot(game) -> Snapshot:
+    """
+    Copy the drawable state of a game.
+
+    Args:
+        game: Game to copy, not modified.
+
+    Returns:
+        Snapshot: State after the game's latest step.
+    """
+    return Snapshot(
+        frame=game.sim_clock.frame,
+        time=time.perf_counter(),
+        sprites=tuple((id(sprite), sprite.image_key, sprite.rect.x, sprite.rect.y)
+                      for sprite in game.all_sprites),
+        bullets=game.boss_bullets.state(),
+        particles=game.particles.state(),
+        hud=game.hud_values(),
+        game_active=game.game_active,
+        game_over=game.game_over,
+    )
+
+
+def state_digest(snapshot: Snapshot) -> str:
+    """
+    Hash the game state in a snapshot, ignoring timing and sprite ids.
+
+    Args:
+        snapshot: Snapshot to hash.
+
+    Returns:
+        str: Hex digest equal for equal game states.
+    """
+    state = (snapshot.frame, tuple(sprite[1:] for sprite in snapshot.sprites),
+             snapshot.bullets[:2], snapshot.hud, snapshot.game_active, snapshot.game_over)
+    return hashlib.sha1(repr(state).encode()).hexdigest()
+
+
+class SnapshotBuffer:
+    """Double buffer: the latest snapshot and the one before it."""
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self.lock = threading.Lock()
+        self.previous: Optional[Snapshot] = None
+        self.latest: Optional[Snapshot] = None
+
+    def publish(self, snapshot: Snapshot) -> None:
+        """
+        Make a snapshot the latest, keeping the old latest as previous.
+
+        Args:
+            snapshot: Newly simulated frame.
+        """
+        with self.lock:
+            self.previous, self.latest = self.latest, snapshot
+
+    def read(self) -> Tuple[Optional[Snapshot], Optional[Snapshot]]:
+        """
+        Get the two most recent snapshots.
+
+        Returns:
+            Tuple: (previous, latest), either None before enough frames.
+        """
+        with self.lock:
+            return self.previous, self.latest
@@ -0,0 +1,136 @@
+"""
+Spatial Hash Module
+-----------------
+Provides a uniform-grid broadphase for sprite collision checks, with
+drop-in replacements for pygame's spritecollide and groupcollide.
+"""
+
+import pygame
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from sprites import BaseSprite
+from sprites.registry import EntityView
+
+CELL_SIZE: int = 64
+
+# Narrow-phase test run only on pairs whose rects overlap
+Collided = Callable[[BaseSprite, BaseSprite], bool]
+
+
+class SpatialHash:
+    """Uniform grid that buckets sprites by the cells their rects cover."""
+
+    def __init__(self, cell_size: int = CELL_SIZE):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size: Width and height of a grid cell in pixels.
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[BaseSprite]] = {}
+        self.order: Dict[BaseSprite, int] = {}
+
+    def rebuild(self, sprites: Iterable[BaseSprite]) -> None:
+        """
+        Replace the grid contents with the given sprites.
+
+        Args:
+            sprites: Sprites to insert, in the order hits are reported.
+        """
+        cells = {}
+        order = {}
+        size = self.cell_size
+        for index, sprite in enumerate(sprites):
+            order[sprite] = index
+            rect = sprite.rect
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [sprite]
+                    else:
+                        bucket.append(sprite)
+        self.cells = cells
+        self.order = order
+
+    def query(self, rect: pygame.Rect) -> List[BaseSprite]:
+        """
+        Find sprites sharing a cell with a rect.
+
+        Args:
+            rect: Area to look up.
+
+        Returns:
+            List of candidate sprites in insertion order, without
+            duplicates; it may belong to the grid and must not be changed.
+        """
+        size = self.cell_size
+        cells = self.cells
+        left = rect.left // size
+        top = rect.top // size
+        if (rect.right - 1) // size == left and (rect.bottom - 1) // size == top:
+            # Inside one cell, whose bucket is already in insertion order
+            return cells.get((left, top), [])
+        candidates = []
+        seen = set()
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                for sprite in cells.get((cx, cy), ()):
+                    if sprite not in seen:
+                        seen.add(sprite)
+                        candidates.append(sprite)
+        if len(candidates) > 1:
+            candidates.sort(key=self.order.__getitem__)
+        return candidates
+
+
+def spritecollide(sprite: BaseSprite, grid: SpatialHash,
+                  dokill: bool, collided: Optional[Collided] = None) -> List[BaseSprite]:
+    """
+    Find live sprites in a grid whose rects overlap a sprite.
+
+    Args:
+        sprite: Sprite to test.
+        grid: Grid built from the target group this frame.
+        dokill: Kill the sprites that were hit.
+        collided: Further test for rect overlaps, e.g. collide_mask.
+
+    Returns:
+        List of sprites hit.
+    """
+    rect = sprite.rect
+    hits = [target for target in grid.query(rect)
+            if target.alive() and rect.colliderect(target.rect)
+            and (collided is None or collided(sprite, target))]
+    if dokill:
+        for target in hits:
+            target.kill()
+    return hits
+
+
+def groupcollide(group: EntityView, grid: SpatialHash,
+                 dokilla: bool, dokillb: bool,
+                 collided: Optional[Collided] = None) -> Dict[BaseSprite, List[BaseSprite]]:
+    """
+    Find overlaps between a group and the sprites in a grid.
+
+    Args:
+        group: Sprites to test.
+        grid: Grid built from the target group this frame.
+        dokilla: Kill sprites from the group that hit something.
+        dokillb: Kill the target sprites that were hit.
+        collided: Further test for rect overlaps, e.g. collide_mask.
+
+    Returns:
+        Dict mapping each sprite in the group to the targets it hit.
+    """
+    crashed = {}
+    if not grid.cells:
+        return crashed
+    for sprite in group.sprites():
+        hits = spritecollide(sprite, grid, dokillb, collided)
+        if hits:
+            crashed[sprite] = hits
+            if dokilla:
+                sprite.kill()
+    return crashed
@@ -0,0 +1,157 @@
+"""
+Text Cache Module
+---------------
+Provides cached text rendering: an LRU cache of rendered strings and
+glyph atlases for fast-changing numbers such as the score.
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+MAX_CACHED_TEXTS: int = 128
+
+
+class GlyphAtlas:
+    """Pre-rendered characters of one font and colour, drawn one by one."""
+
+    def __init__(self, font: pygame.font.Font, antialias: bool,
+                 color: Tuple[int, int, int], charset: str = "0123456789-"):
+        """
+        Initialize the atlas.
+
+        Args:
+            font: Font to render glyphs with.
+            antialias: Whether glyphs are antialiased.
+            color: Tuple of RGB values.
+            charset: Characters rendered up front; others are added on use.
+        """
+        self.font = font
+        self.antialias = antialias
+        self.color = color
+        self.height = font.get_height()
+        self.glyphs: Dict[str, pygame.Surface] = {}
+        for char in charset:
+            self.glyph(char)
+
+    def glyph(self, char: str) -> pygame.Surface:
+        """
+        Get the surface for a single character.
+
+        Args:
+            char: Character to look up.
+
+        Returns:
+            pygame.Surface: The rendered glyph.
+        """
+        surface = self.glyphs.get(char)
+        if surface is None:
+            surface = self.font.render(char, self.antialias, self.color)
+            self.glyphs[char] = surface
+        return surface
+
+    def draw(self, surface: pygame.Surface, text: str, pos: Tuple[int, int]) -> pygame.Rect:
+        """
+        Draw a string glyph by glyph without rasterising it.
+
+        Args:
+            surface: Surface to draw on.
+            text: String to draw.
+            pos: Top-left position.
+
+        Returns:
+            pygame.Rect: Area covered by the string.
+        """
+        x, y = pos
+        for char in text:
+            glyph = self.glyph(char)
+            surface.blit(glyph, (x, y))
+            x += glyph.get_width()
+        return pygame.Rect(pos[0], y, x - pos[0], self.height)
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces and glyph atlases."""
+
+    def __init__(self, max_entries: int = MAX_CACHED_TEXTS):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Number of rendered strings kept before the least
+                recently used one is evicted.
+        """
+        self.max_entries = max_entries
+        self.surfaces: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.atlases: Dict[Tuple, GlyphAtlas] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool,
+               color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render text, reusing the surface from an earlier identical call.
+
+        Args:
+            font: Font to render with.
+            text: String to render.
+            antialias: Whether the text is antialiased.
+            color: Tuple of RGB values.
+
+        Returns:
+            pygame.Surface: The rendered text. Must not be drawn on.
+        """
+        key = (font, text, antialias, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def atlas(self, font: pygame.font.Font, antialias: bool,
+              color: Tuple[int, int, int]) -> GlyphAtlas:
+        """
+        Get the glyph atlas for a font and colour.
+
+        Args:
+            font: Font to render with.
+            antialias: Whether glyphs are antialiased.
+            color: Tuple of RGB values.
+
+        Returns:
+            GlyphAtlas: Shared atlas, created on first use.
+        """
+        key = (font, antialias, color)
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(font, antialias, color)
+            self.atlases[key] = atlas
+        return atlas
+
+    def draw_value(self, surface: pygame.Surface, font: pygame.font.Font, label: str,
+                   value: int, color: Tuple[int, int, int], pos: Tuple[int, int]) -> pygame.Rect:
+        """
+        Draw a cached label followed by a number from the glyph atlas.
+
+        Args:
+            surface: Surface to draw on.
+            font: Font to render with.
+            label: Static text before the number, e.g. "Score: ".
+            value: Number to draw.
+            color: Tuple of RGB values.
+            pos: Top-left position.
+
+        Returns:
+            pygame.Rect: Area covered by label and number.
+        """
+        label_rect = surface.blit(self.render(font, label, True, color), pos)
+        value_rect = self.atlas(font, True, color).draw(
+            surface, str(value), (label_rect.right, pos[1]))
+        return label_rect.union(value_rect)